@@ -0,0 +1,530 @@
+#!/usr/bin/env python3
+"""
+FlowTrack Performance Benchmark Script
+
+Mengukur performa struktur data FlowTrack pada ledger berukuran besar.
+
+Usage:
+    python benchmark.py              # ukuran default: 10^5 dan 10^6
+    python benchmark.py 10000 50000  # ukuran custom
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+DEFAULT_SIZES = [100_000, 1_000_000]
+
+
+def print_header(title):
+    print("\n" + "=" * 60)
+    print(f"  {title}")
+    print("=" * 60)
+
+
+def print_result(label, seconds, count=None):
+    if count:
+        print(f"  {label:<36} {seconds:8.3f}s  ({count / seconds:,.0f} ops/s)")
+    else:
+        print(f"  {label:<36} {seconds:8.3f}s")
+
+
+def generate_transactions(n, seed=42):
+    """Generate n transaksi sintetis (oldest-first, format to_dict)"""
+    rng = random.Random(seed)
+    start = date(2020, 1, 1)
+    categories = ["Makan", "Transport", "Kos", "Kuota", "Hiburan", "Gaji", "Lainnya"]
+    transactions = []
+    for i in range(n):
+        trans_date = start + timedelta(days=i * 2000 // max(n, 1))
+        is_income = rng.random() < 0.2
+        is_recurring = rng.random() < 0.01
+        transactions.append({
+            "id": i + 1,
+            "date": trans_date.isoformat(),
+            "title": f"Transaksi {i + 1}",
+            "amount": float(rng.randint(1, 5000) * 1000),
+            "type": "Income" if is_income else "Expense",
+            "category": rng.choice(categories),
+            "is_recurring": is_recurring,
+            "recurrence_type": rng.choice(["weekly", "monthly"]) if is_recurring else None
+        })
+    return transactions
+
+
+def write_snapshot(path, transactions):
+    """Tulis snapshot JSON dengan format yang sama seperti save_to_file()"""
+    with open(path, 'w') as f:
+        json.dump({
+            "transactions": transactions,
+            "next_id": len(transactions) + 1,
+            "current_month": transactions[-1]["date"][:7] if transactions else "",
+            "monthly_history": {},
+            # Budget untuk setiap bulan agar biaya BST search ikut terukur
+            "budgets": {month: 5_000_000.0
+                        for month in sorted({t["date"][:7] for t in transactions})}
+        }, f)
+
+
+def bench_startup(n, workdir):
+    """Startup: load_from_file (bulk path) vs insert_at_head per record"""
+    from models import FinanceManager
+
+    print_header(f"Startup load_from_file ({n:,} rows)")
+    transactions = generate_transactions(n)
+    path = os.path.join(workdir, f"startup_{n}.json")
+    write_snapshot(path, transactions)
+
+    start = time.perf_counter()
+    manager = FinanceManager(path)
+    print_result("load_from_file (total)", time.perf_counter() - start, n)
+    assert manager.transaction_count == n
+
+    start = time.perf_counter()
+    with open(path) as f:
+        data = json.load(f)
+    print_result("  json.load only", time.perf_counter() - start, n)
+
+    # Struktur data saja (tanpa parsing JSON): bulk path vs per-record
+    empty_path = os.path.join(workdir, "missing.json")
+    bulk = FinanceManager(empty_path)
+    for month, budget_limit in data["budgets"].items():
+        bulk.budget_bst.insert(month, budget_limit)
+    start = time.perf_counter()
+    bulk._bulk_load(data["transactions"])
+    print_result("  bulk build (_bulk_load)", time.perf_counter() - start, n)
+
+    baseline = FinanceManager(empty_path)
+    for month, budget_limit in data["budgets"].items():
+        baseline.budget_bst.insert(month, budget_limit)
+    start = time.perf_counter()
+    for trans in data["transactions"]:
+        baseline.insert_at_head(trans["date"], trans["title"], trans["amount"],
+                                trans["type"], trans["category"],
+                                trans["is_recurring"], trans["recurrence_type"],
+                                trans_id=trans["id"])
+    print_result("  per-record insert_at_head", time.perf_counter() - start, n)
+
+
+def bench_partitioned(n, workdir):
+    """Startup: satu data.json vs partitioned storage (hanya bulan berjalan dimuat)"""
+    from models import FinanceManager
+
+    print_header(f"Partitioned startup ({n:,} rows)")
+    transactions = generate_transactions(n)
+    path = os.path.join(workdir, f"partitioned_{n}.json")
+    write_snapshot(path, transactions)
+
+    start = time.perf_counter()
+    FinanceManager(path, partitioned=True)
+    print_result("migrasi ke file per bulan", time.perf_counter() - start, n)
+
+    start = time.perf_counter()
+    FinanceManager(path)
+    print_result("load_from_file (satu file)", time.perf_counter() - start, n)
+
+    start = time.perf_counter()
+    manager = FinanceManager(path, partitioned=True)
+    elapsed = time.perf_counter() - start
+    print_result(f"partitioned ({len(manager.id_index):,} rows dimuat)", elapsed)
+
+    start = time.perf_counter()
+    manager.get_all_transactions()
+    print_result("  lazy load semua bulan", time.perf_counter() - start, n)
+
+
+def bench_delete(n, workdir, deletes=1000, rebuild_samples=20):
+    """Delete throughput: indexed heap remove vs rebuild_from_dll per delete"""
+    from models import FinanceManager
+
+    print_header(f"Delete throughput ({n:,} rows)")
+    manager = FinanceManager(os.path.join(workdir, "missing.json"))
+    manager._bulk_load(generate_transactions(n))
+
+    rng = random.Random(7)
+    expenses = [node for node in manager.id_index.values() if node.trans_type == "Expense"]
+    victims = rng.sample(expenses, min(deletes, len(expenses)))
+
+    start = time.perf_counter()
+    for node in victims:
+        manager.delete_node(node)
+    print_result(f"delete_node x{len(victims):,} (indexed heap)",
+                 time.perf_counter() - start, len(victims))
+
+    # Baseline: biaya lama per delete = satu rebuild_from_dll penuh
+    start = time.perf_counter()
+    for _ in range(rebuild_samples):
+        manager.expense_heap.rebuild_from_dll(manager.head)
+    print_result(f"rebuild_from_dll x{rebuild_samples} (old path)",
+                 time.perf_counter() - start, rebuild_samples)
+
+
+def bench_batch(n, workdir, edits=1000, unbatched_samples=10):
+    """Edit 1000 baris: satu batch() vs update_node + persist per baris (snapshot mode)"""
+    from models import FinanceManager
+
+    print_header(f"Batch edit ({n:,} rows)")
+    path = os.path.join(workdir, f"batch_{n}.json")
+    write_snapshot(path, generate_transactions(n))
+    manager = FinanceManager(path)
+
+    rng = random.Random(17)
+    nodes = rng.sample(list(manager.id_index.values()), min(edits + unbatched_samples, n))
+    batch_nodes, single_nodes = nodes[:edits], nodes[edits:]
+
+    start = time.perf_counter()
+    with manager.batch():
+        for node in batch_nodes:
+            manager.update_node(node, amount=node.amount + 1000, trans_type="Expense")
+            manager.persist()
+    print_result(f"batch() x{len(batch_nodes):,} (1 persist)",
+                 time.perf_counter() - start, len(batch_nodes))
+
+    start = time.perf_counter()
+    for node in single_nodes:
+        manager.update_node(node, amount=node.amount + 1000, trans_type="Expense")
+        manager.persist()
+    print_result(f"  update + persist x{len(single_nodes)} (old path)",
+                 time.perf_counter() - start, len(single_nodes))
+
+
+def bench_import(n, workdir, max_rows=100_000, chunk_size=10_000):
+    """Streaming import CSV (format mutasi bank, jumlah format Indonesia)"""
+    from models import FinanceManager
+
+    rows = min(n, max_rows)
+    print_header(f"CSV import ({rows:,} rows, chunk {chunk_size:,})")
+    csv_path = os.path.join(workdir, f"import_{rows}.csv")
+    with open(csv_path, 'w', encoding='utf-8') as f:
+        f.write("Tanggal;Keterangan;Nominal\n")
+        for trans in generate_transactions(rows):
+            sign = "-" if trans["type"] == "Expense" else ""
+            amount = f"{trans['amount']:,.0f}".replace(",", ".")
+            f.write(f"{trans['date']};{trans['title']};{sign}Rp {amount}\n")
+
+    manager = FinanceManager(os.path.join(workdir, f"import_{rows}.json"), journal_mode=True)
+    result = manager.import_from_csv(
+        csv_path,
+        {"date": "Tanggal", "title": "Keterangan", "amount": "Nominal", "type": None},
+        chunk_size=chunk_size, delimiter=";"
+    )
+    assert result["rows"] == rows
+    print_result("import_from_csv", result["seconds"], result["rows"])
+
+
+def bench_recurring(n, workdir, max_schedules=100_000):
+    """Recurring queue: heap get_due_transactions vs list scan + pop(i)"""
+    from models import RecurringTransactionQueue, ScheduledTransaction, TransactionNode
+
+    schedules = min(n, max_schedules)
+    print_header(f"Recurring queue ({schedules:,} schedules)")
+    rng = random.Random(11)
+    start_day = date(2024, 1, 1)
+    scheduled = []
+    for i in range(schedules):
+        due = (start_day + timedelta(days=rng.randrange(730))).isoformat()
+        node = TransactionNode(due, f"Langganan {i}", 50_000.0, "Expense", "Tagihan",
+                               i + 1, is_recurring=True, recurrence_type="monthly")
+        scheduled.append(ScheduledTransaction(node, due))
+    today = (start_day + timedelta(days=365)).isoformat()
+
+    queue = RecurringTransactionQueue()
+    start = time.perf_counter()
+    for item in scheduled:
+        queue.enqueue(item)
+    print_result("enqueue (heap push)", time.perf_counter() - start, schedules)
+
+    start = time.perf_counter()
+    due = queue.get_due_transactions(today)
+    print_result(f"get_due_transactions ({len(due):,} due)", time.perf_counter() - start, len(due))
+
+    # Baseline: implementasi list lama (scan seluruh list + pop(i))
+    old_queue = list(scheduled)
+    start = time.perf_counter()
+    old_due = []
+    i = 0
+    while i < len(old_queue):
+        if old_queue[i].next_due_date <= today:
+            old_due.append(old_queue.pop(i))
+        else:
+            i += 1
+    print_result("  list scan + pop(i) (old path)", time.perf_counter() - start, len(old_due))
+    assert len(old_due) == len(due)
+
+
+def bench_forecast(n, workdir, max_schedules=10_000, months_ahead=24):
+    """Forecast: k-way merge generator occurrence dari semua jadwal recurring"""
+    from models import FinanceManager
+
+    schedules = min(n, max_schedules)
+    print_header(f"Forecast {months_ahead} bulan ({schedules:,} schedules)")
+    manager = FinanceManager(os.path.join(workdir, "missing.json"))
+    rng = random.Random(13)
+    today = date.today()
+    templates = []
+    for i in range(schedules):
+        start_date = today - timedelta(days=rng.randrange(28))
+        templates.append({
+            "date": start_date.isoformat(),
+            "title": f"Langganan {i + 1}",
+            "amount": float(rng.randint(1, 500) * 1000),
+            "type": "Income" if rng.random() < 0.1 else "Expense",
+            "category": "Tagihan",
+            "is_recurring": True,
+            "recurrence_type": "weekly" if rng.random() < 0.3 else "monthly"
+        })
+    templates.sort(key=lambda trans: trans["date"])
+    manager._bulk_load(templates)
+    manager._schedule_recurring()
+
+    start = time.perf_counter()
+    result = manager.forecast(months_ahead)
+    print_result(f"forecast ({len(result)} bulan, per schedule)",
+                 time.perf_counter() - start, schedules)
+
+
+class LegacyTransactionNode:
+    """Layout node sebelum __slots__/interning (baseline untuk bench_memory)"""
+
+    def __init__(self, date, title, amount, trans_type, category, trans_id,
+                 is_recurring=False, recurrence_type=None):
+        self.date = date
+        self.title = title
+        self.amount = amount
+        self.trans_type = trans_type
+        self.category = category
+        self.trans_id = trans_id
+        self.is_recurring = is_recurring
+        self.recurrence_type = recurrence_type
+        self.next = None
+        self.prev = None
+
+
+def bench_memory(n, workdir):
+    """Memory DLL (tracemalloc): node dengan __dict__ vs __slots__ + interned fields"""
+    from models import TransactionNode
+
+    print_header(f"Memory DLL ({n:,} nodes)")
+    payload = json.dumps(generate_transactions(n))
+
+    results = {}
+    for label, node_cls in (("dict nodes (old layout)", LegacyTransactionNode),
+                            ("__slots__ + interned", TransactionNode)):
+        # Parse di dalam trace (seperti load_from_file), lalu buang record
+        # mentah: yang tersisa adalah memori yang benar-benar dipegang DLL
+        tracemalloc.start()
+        rows = json.loads(payload)
+        head = None
+        for t in rows:
+            node = node_cls(t["date"], t["title"], t["amount"], t["type"], t["category"],
+                            t["id"], t["is_recurring"], t["recurrence_type"])
+            node.next = head
+            if head:
+                head.prev = node
+            head = node
+        del rows, t, node
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[label] = current
+        print(f"  {label:<36} {current / 2**20:8.1f} MiB  ({current / n:,.0f} B/node, "
+              f"peak {peak / 2**20:,.1f} MiB)")
+        del head
+
+    old, new = results.values()
+    print(f"  {'reduction':<36} {(1 - new / old) * 100:7.1f}%")
+
+
+def bench_analytics(n, workdir):
+    """Analytics NumPy: snapshot + laporan vectorized vs loop Python di atas DLL"""
+    from models import FinanceManager, LedgerAnalytics
+    from models.analytics import np
+
+    print_header(f"Analytics ({n:,} rows)")
+    if np is None:
+        print("  numpy tidak terinstall, dilewati")
+        return
+    manager = FinanceManager(os.path.join(workdir, "missing.json"))
+    manager._bulk_load(generate_transactions(n))
+
+    start = time.perf_counter()
+    by_month, by_category = {}, {}
+    current = manager.tail
+    while current:
+        key = "income" if current.trans_type == "Income" else "expense"
+        month = by_month.setdefault(current.date[:7], {"income": 0.0, "expense": 0.0})
+        month[key] += current.amount
+        category = by_category.setdefault(current.category, {"income": 0.0, "expense": 0.0})
+        category[key] += current.amount
+        current = current.prev
+    print_result("monthly + category (DLL loop)", time.perf_counter() - start, n)
+
+    analytics = LedgerAnalytics(manager)
+    start = time.perf_counter()
+    analytics.monthly_totals()
+    analytics.category_totals()
+    print_result("monthly + category (numpy snapshot)", time.perf_counter() - start, n)
+
+    start = time.perf_counter()
+    analytics.weekday_totals()
+    analytics.running_balance()
+    analytics.rolling_spend(30)
+    print_result("weekday + running + rolling 30d", time.perf_counter() - start, n)
+
+    start = time.perf_counter()
+    analytics.monthly_totals()
+    analytics.category_totals()
+    print_result("monthly + category (cached)", time.perf_counter() - start)
+    assert len(analytics.monthly_totals()) == len(by_month)
+
+
+def bench_binary_snapshot(n, workdir):
+    """Snapshot biner (mmap) vs json.load: decode, startup penuh dan ukuran file"""
+    from models import FinanceManager
+    from models.binary_snapshot import BinarySnapshot, convert_json_to_binary
+
+    print_header(f"Binary snapshot vs JSON ({n:,} rows)")
+    json_path = os.path.join(workdir, f"snapshot_{n}.json")
+    binary_path = os.path.join(workdir, f"snapshot_{n}.ftsnap")
+    write_snapshot(json_path, generate_transactions(n))
+
+    start = time.perf_counter()
+    convert_json_to_binary(json_path, binary_path)
+    print_result("convert JSON -> biner", time.perf_counter() - start, n)
+
+    start = time.perf_counter()
+    with open(json_path) as f:
+        data = json.load(f)
+    print_result("json.load", time.perf_counter() - start, n)
+
+    start = time.perf_counter()
+    with BinarySnapshot(binary_path) as snapshot:
+        rows = sum(1 for _ in snapshot.iter_rows())
+    print_result("mmap decode (iter_rows)", time.perf_counter() - start, n)
+    assert rows == len(data["transactions"])
+
+    start = time.perf_counter()
+    with BinarySnapshot(binary_path) as snapshot:
+        snapshot[n // 2]
+    print_result("mmap open + satu record", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    FinanceManager(json_path)
+    print_result("load_from_file (JSON)", time.perf_counter() - start, n)
+
+    start = time.perf_counter()
+    manager = FinanceManager(binary_path)
+    print_result("load_from_file (biner)", time.perf_counter() - start, n)
+    assert manager.transaction_count == n
+
+    json_size, binary_size = os.path.getsize(json_path), os.path.getsize(binary_path)
+    print(f"  {'ukuran file JSON / biner':<36} {json_size / 2**20:8.1f} / {binary_size / 2**20:.1f} MiB")
+
+
+def bench_date_index(n, workdir, inserts=1000):
+    """Date index: group_by_date view vs rebuild dict + sort, insert back-dated"""
+    from models import FinanceManager
+
+    print_header(f"Date-sorted index ({n:,} rows)")
+    transactions = generate_transactions(n)
+    manager = FinanceManager(os.path.join(workdir, "missing.json"))
+    start = time.perf_counter()
+    manager._bulk_load(transactions)
+    print_result("bulk load (termasuk date index)", time.perf_counter() - start, n)
+
+    start = time.perf_counter()
+    date_map = {}
+    current = manager.head
+    while current:
+        date_map.setdefault(current.date, []).append(current)
+        current = current.next
+    sorted_dates = sorted(date_map, reverse=True)
+    print_result("rebuild dict + sort (lama)", time.perf_counter() - start, n)
+
+    start = time.perf_counter()
+    view = manager.group_by_date()
+    dates = list(view)
+    print_result("group_by_date view + urutan tanggal", time.perf_counter() - start, n)
+    assert dates == sorted_dates
+
+    start = time.perf_counter()
+    list(manager.iter_transactions("2024-03-01", "2024-03-31"))
+    print_result("iter_transactions satu bulan", time.perf_counter() - start)
+
+    rng = random.Random(7)
+    start = time.perf_counter()
+    for i in range(inserts):
+        manager.insert_at_head(f"20{rng.randint(20, 24)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                               "Back-dated", 1000.0, "Expense", "Makan")
+    print_result("insert back-dated", time.perf_counter() - start, inserts)
+
+
+def bench_category_index(n, workdir):
+    """Category index: total dan transaksi per kategori vs scan DLL"""
+    from models import FinanceManager
+
+    print_header(f"Category index ({n:,} rows)")
+    manager = FinanceManager(os.path.join(workdir, "missing.json"))
+    manager._bulk_load(generate_transactions(n))
+    month_start, month_end = "2024-03-01", "2024-03-31"
+
+    start = time.perf_counter()
+    expense, matches = 0.0, []
+    current = manager.head
+    while current:
+        if current.category == "Makan":
+            if current.trans_type == "Expense" and current.date.startswith("2024-03"):
+                expense += current.amount
+            if month_start <= current.date <= month_end:
+                matches.append(current)
+        current = current.next
+    print_result("scan DLL (total + transaksi)", time.perf_counter() - start, n)
+
+    start = time.perf_counter()
+    totals = manager.get_category_totals("Makan", "2024-03")
+    print_result("get_category_totals (O(1))", time.perf_counter() - start)
+    assert abs(totals["expense"] - expense) < 1e-6
+
+    start = time.perf_counter()
+    result = manager.transactions_in_category("Makan", month_start, month_end)
+    print_result("transactions_in_category satu bulan", time.perf_counter() - start, len(result))
+    assert len(result) == len(matches)
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+
+    print("\n" + "=" * 60)
+    print("  FlowTrack Performance Benchmark")
+    print(f"  Sizes: {', '.join(f'{n:,}' for n in sizes)}")
+    print("=" * 60)
+
+    benchmarks = [
+        bench_memory,
+        bench_startup,
+        bench_partitioned,
+        bench_binary_snapshot,
+        bench_date_index,
+        bench_category_index,
+        bench_delete,
+        bench_batch,
+        bench_import,
+        bench_recurring,
+        bench_forecast,
+        bench_analytics,
+    ]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in sizes:
+            for bench in benchmarks:
+                bench(n, workdir)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
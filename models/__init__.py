@@ -3,6 +3,11 @@ from .transaction_node import TransactionNode
 from .max_heap import MaxHeap
 from .recurring_queue import RecurringTransactionQueue, ScheduledTransaction
 from .budget_bst import BudgetBST, BudgetNode
+from .journal import TransactionJournal
+from .sqlite_storage import SQLiteStorage
+from .analytics import LedgerAnalytics
+from .persistence_worker import PersistenceWorker
+from .binary_snapshot import BinarySnapshot
 
 __all__ = [
     'FinanceManager', 
@@ -11,5 +16,10 @@ __all__ = [
     'RecurringTransactionQueue',
     'ScheduledTransaction',
     'BudgetBST',
-    'BudgetNode'
+    'BudgetNode',
+    'TransactionJournal',
+    'SQLiteStorage',
+    'LedgerAnalytics',
+    'PersistenceWorker',
+    'BinarySnapshot'
 ]
\ No newline at end of file
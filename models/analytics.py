@@ -0,0 +1,249 @@
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # numpy opsional: hanya dibutuhkan oleh LedgerAnalytics
+    np = None
+
+
+class LedgerAnalytics:
+    """
+    Analytics engine berbasis NumPy untuk statistik dan laporan ledger
+
+    Ledger di-snapshot sekali ke array NumPy yang terurut berdasarkan tanggal:
+    - dates: datetime64[D]
+    - amounts: float64
+    - is_income: bool
+    - categories: int32 (kode kategori, lihat category_names)
+
+    Semua laporan dihitung secara vectorized (bincount / cumsum / searchsorted),
+    bukan loop Python di atas DLL. Snapshot dan hasil query di-cache dan hanya
+    dibangun ulang jika generation counter FinanceManager berubah (setiap
+    insert/update/delete menaikkan counter tersebut).
+
+    Time Complexities:
+        - snapshot: O(n log n) sekali per generation
+        - totals(): O(log n) dari prefix sum
+        - monthly_totals() / category_totals() / weekday_totals(): O(n + k)
+        - running_balance() / rolling_spend(): O(n + d), d = jumlah hari
+        - query berulang tanpa mutasi: O(1) dari cache
+
+    Requires:
+        numpy (opsional, pip install numpy)
+    """
+
+    WEEKDAY_NAMES = ("Senin", "Selasa", "Rabu", "Kamis", "Jumat", "Sabtu", "Minggu")
+
+    def __init__(self, manager):
+        if np is None:
+            raise ImportError("LedgerAnalytics membutuhkan numpy (pip install numpy)")
+        self.manager = manager
+        self._generation: Optional[int] = None
+        self._results: Dict[tuple, object] = {}
+
+        self.dates = np.empty(0, dtype="datetime64[D]")
+        self.amounts = np.empty(0, dtype=np.float64)
+        self.is_income = np.empty(0, dtype=bool)
+        self.categories = np.empty(0, dtype=np.int32)
+        self.category_names: List[str] = []
+        self._income_prefix = np.zeros(1)
+        self._expense_prefix = np.zeros(1)
+
+    # ==================== SNAPSHOT ====================
+
+    def _refresh(self):
+        """Bangun ulang snapshot jika ledger sudah berubah sejak snapshot terakhir"""
+        # Partitioned storage: analytics membutuhkan seluruh history
+        self.manager.ensure_loaded()
+        if self._generation == self.manager.generation:
+            return
+
+        dates, amounts, is_income, categories = [], [], [], []
+        category_codes: Dict[str, int] = {}
+        current = self.manager.tail
+        while current:
+            dates.append(current.date)
+            amounts.append(current.amount)
+            is_income.append(current.trans_type == "Income")
+            code = category_codes.get(current.category)
+            if code is None:
+                code = category_codes[current.category] = len(category_codes)
+            categories.append(code)
+            current = current.prev
+
+        date_array = np.array(dates, dtype="datetime64[D]")
+        order = np.argsort(date_array, kind="stable")
+        self.dates = date_array[order]
+        self.amounts = np.array(amounts, dtype=np.float64)[order]
+        self.is_income = np.array(is_income, dtype=bool)[order]
+        self.categories = np.array(categories, dtype=np.int32)[order]
+        self.category_names = list(category_codes)
+
+        # Prefix sum untuk totals() range apa pun dengan dua searchsorted
+        self._income_prefix = np.concatenate(([0.0], np.cumsum(self._income_amounts())))
+        self._expense_prefix = np.concatenate(([0.0], np.cumsum(self._expense_amounts())))
+
+        self._results.clear()
+        self._generation = self.manager.generation
+
+    def _cached(self, key: tuple, compute):
+        """Ambil hasil dari cache atau hitung (cache dikosongkan saat snapshot berubah)"""
+        self._refresh()
+        if key not in self._results:
+            self._results[key] = compute()
+        return self._results[key]
+
+    def _income_amounts(self):
+        return np.where(self.is_income, self.amounts, 0.0)
+
+    def _expense_amounts(self):
+        return np.where(self.is_income, 0.0, self.amounts)
+
+    def _range_slice(self, start_date: Optional[str], end_date: Optional[str]) -> slice:
+        """Slice baris snapshot (terurut tanggal) untuk range tanggal inklusif"""
+        left = 0 if start_date is None else int(
+            np.searchsorted(self.dates, np.datetime64(start_date, "D"), side="left"))
+        right = len(self.dates) if end_date is None else int(
+            np.searchsorted(self.dates, np.datetime64(end_date, "D"), side="right"))
+        return slice(left, max(left, right))
+
+    # ==================== REPORTS ====================
+
+    def totals(self, start_date: Optional[str] = None,
+               end_date: Optional[str] = None) -> Dict[str, float]:
+        """
+        Total pemasukan dan pengeluaran untuk range tanggal (semua jika None)
+
+        Time Complexity: O(log n) setelah snapshot
+
+        Returns:
+            Dictionary dengan income, expense, balance
+        """
+        self._refresh()
+        rows = self._range_slice(start_date, end_date)
+        income = float(self._income_prefix[rows.stop] - self._income_prefix[rows.start])
+        expense = float(self._expense_prefix[rows.stop] - self._expense_prefix[rows.start])
+        return {"income": income, "expense": expense, "balance": income - expense}
+
+    def monthly_totals(self) -> Dict[str, Dict[str, float]]:
+        """
+        Total per bulan: {YYYY-MM: {income, expense, balance, savings_rate}}
+
+        savings_rate = (income - expense) / income * 100, None jika tanpa pemasukan
+        """
+        def compute():
+            if not len(self.dates):
+                return {}
+            months = self.dates.astype("datetime64[M]")
+            first = months[0]
+            index = (months - first).astype(np.int64)
+            size = int(index[-1]) + 1
+            income = np.bincount(index, weights=self._income_amounts(), minlength=size)
+            expense = np.bincount(index, weights=self._expense_amounts(), minlength=size)
+            present = np.bincount(index, minlength=size) > 0
+
+            result = {}
+            for i in np.flatnonzero(present):
+                month_income, month_expense = float(income[i]), float(expense[i])
+                result[str(first + i)] = {
+                    "income": month_income,
+                    "expense": month_expense,
+                    "balance": month_income - month_expense,
+                    "savings_rate": ((month_income - month_expense) / month_income * 100
+                                     if month_income else None)
+                }
+            return result
+        return self._cached(("monthly",), compute)
+
+    def category_totals(self, start_date: Optional[str] = None,
+                        end_date: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Total per kategori untuk range tanggal: {category: {income, expense}}
+        """
+        def compute():
+            rows = self._range_slice(start_date, end_date)
+            codes = self.categories[rows]
+            is_income = self.is_income[rows]
+            amounts = self.amounts[rows]
+            size = len(self.category_names)
+            income = np.bincount(codes, weights=np.where(is_income, amounts, 0.0), minlength=size)
+            expense = np.bincount(codes, weights=np.where(is_income, 0.0, amounts), minlength=size)
+            counts = np.bincount(codes, minlength=size)
+            return {self.category_names[code]: {"income": float(income[code]),
+                                                "expense": float(expense[code])}
+                    for code in np.flatnonzero(counts)}
+        return self._cached(("category", start_date, end_date), compute)
+
+    def weekday_totals(self) -> Dict[str, Dict[str, float]]:
+        """
+        Total per hari dalam seminggu (Senin..Minggu): {hari: {income, expense}}
+        """
+        def compute():
+            # 1970-01-01 adalah hari Kamis (index 3 jika Senin = 0)
+            weekdays = (self.dates.astype(np.int64) + 3) % 7
+            income = np.bincount(weekdays, weights=self._income_amounts(), minlength=7)
+            expense = np.bincount(weekdays, weights=self._expense_amounts(), minlength=7)
+            return {name: {"income": float(income[i]), "expense": float(expense[i])}
+                    for i, name in enumerate(self.WEEKDAY_NAMES)}
+        return self._cached(("weekday",), compute)
+
+    def _daily_series(self):
+        """(hari pertama, income per hari, expense per hari) untuk setiap hari kalender"""
+        first = self.dates[0]
+        index = (self.dates - first).astype(np.int64)
+        size = int(index[-1]) + 1
+        income = np.bincount(index, weights=self._income_amounts(), minlength=size)
+        expense = np.bincount(index, weights=self._expense_amounts(), minlength=size)
+        return first, income, expense
+
+    def running_balance(self) -> Dict[str, float]:
+        """
+        Saldo kumulatif di akhir setiap hari yang memiliki transaksi
+
+        Returns:
+            Dictionary YYYY-MM-DD -> saldo berjalan (kronologis)
+        """
+        def compute():
+            if not len(self.dates):
+                return {}
+            first, income, expense = self._daily_series()
+            balance = np.cumsum(income - expense)
+            days = np.unique((self.dates - first).astype(np.int64))
+            return {str(first + int(day)): float(balance[day]) for day in days}
+        return self._cached(("running_balance",), compute)
+
+    def rolling_spend(self, window: int = 30) -> Dict[str, float]:
+        """
+        Total pengeluaran rolling window hari (default 30) untuk setiap hari kalender
+
+        Time Complexity: O(n + d) dengan selisih prefix sum
+
+        Returns:
+            Dictionary YYYY-MM-DD -> pengeluaran window hari terakhir (inklusif)
+        """
+        def compute():
+            if not len(self.dates):
+                return {}
+            first, _, expense = self._daily_series()
+            prefix = np.concatenate(([0.0], np.cumsum(expense)))
+            ends = np.arange(1, len(expense) + 1)
+            rolling = prefix[ends] - prefix[np.maximum(ends - window, 0)]
+            days = first + np.arange(len(expense))
+            return dict(zip(days.astype(str).tolist(), rolling.tolist()))
+        return self._cached(("rolling", window), compute)
+
+    def savings_rate(self, start_date: Optional[str] = None,
+                     end_date: Optional[str] = None) -> Optional[float]:
+        """
+        Savings rate (income - expense) / income * 100 untuk range tanggal
+
+        Returns:
+            Persentase, atau None jika tidak ada pemasukan dalam range
+        """
+        totals = self.totals(start_date, end_date)
+        if not totals["income"]:
+            return None
+        return totals["balance"] / totals["income"] * 100
+
+    def __str__(self) -> str:
+        return f"LedgerAnalytics[{len(self.dates)} rows, generation {self._generation}]"
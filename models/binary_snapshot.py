@@ -0,0 +1,273 @@
+import json
+import mmap
+import struct
+import sys
+from datetime import date as date_cls
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Format snapshot biner FlowTrack (little-endian):
+#
+#   header   MAGIC, version, record_count, string_count,
+#            offset records, offset string table, offset metadata, panjang metadata
+#   records  record_count x RECORD (fixed-width 32 byte)
+#   strings  (string_count + 1) x uint32 offset, lalu blob UTF-8 semua string
+#   metadata JSON ringkas: next_id, current_month, budgets, recurring_cursor, ...
+#
+# Title dan kategori disimpan sekali di string table (deduplikasi) dan record
+# hanya menyimpan index-nya.
+
+MAGIC = b"FTSN"
+VERSION = 2
+EXTENSION = ".ftsnap"
+HEADER = struct.Struct("<4sHxxIIQQQQ")
+# id, day-ordinal, amount (float64, sama persis dengan float di memori/JSON),
+# type, flags, title index, category index
+RECORD = struct.Struct("<qidBBxxII")
+
+TYPE_NAMES = ("Expense", "Income")
+TYPE_CODES = {"Expense": 0, "Income": 1}
+# flags: bit 0 = is_recurring, bit 1-2 = kode recurrence_type
+RECURRENCE_NAMES = (None, "weekly", "monthly", "")
+RECURRENCE_CODES = {None: 0, "weekly": 1, "monthly": 2, "": 3}
+
+
+def is_binary_snapshot(path: str) -> bool:
+    """True jika file diawali MAGIC snapshot biner"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def write_binary_snapshot(f, data: dict):
+    """
+    Tulis snapshot (format dictionary save_to_file) ke file object biner
+
+    Time Complexity: O(n + s) dimana s adalah total panjang string
+
+    Args:
+        f: File object yang dibuka dengan mode 'wb'
+        data: Dictionary snapshot dengan key "transactions" (oldest-first)
+
+    Raises:
+        ValueError: Jika type atau recurrence_type transaksi tidak bisa
+                    di-encode (tidak ada yang ditulis ke f)
+    """
+    strings: List[str] = []
+    string_index: Dict[str, int] = {}
+
+    def intern_string(value: str) -> int:
+        index = string_index.get(value)
+        if index is None:
+            index = string_index[value] = len(strings)
+            strings.append(value)
+        return index
+
+    transactions = data.get("transactions", [])
+    records = bytearray(RECORD.size * len(transactions))
+    ordinals: Dict[str, int] = {}
+    for i, trans in enumerate(transactions):
+        ordinal = ordinals.get(trans["date"])
+        if ordinal is None:
+            ordinal = ordinals[trans["date"]] = date_cls.fromisoformat(trans["date"]).toordinal()
+        type_code = TYPE_CODES.get(trans["type"])
+        if type_code is None:
+            raise ValueError(f"Transaksi {trans['id']}: type {trans['type']!r} "
+                             f"tidak didukung snapshot biner")
+        # recurrence_type di-encode apa adanya (None -> 0) agar load memberi nilai yang sama
+        recurrence_code = RECURRENCE_CODES.get(trans.get("recurrence_type"))
+        if recurrence_code is None:
+            raise ValueError(f"Transaksi {trans['id']}: recurrence_type "
+                             f"{trans['recurrence_type']!r} tidak didukung snapshot biner")
+        flags = (1 if trans.get("is_recurring") else 0) | (recurrence_code << 1)
+        RECORD.pack_into(records, i * RECORD.size, trans["id"], ordinal,
+                         trans["amount"], type_code, flags,
+                         intern_string(trans["title"]), intern_string(trans["category"]))
+
+    encoded = [value.encode("utf-8") for value in strings]
+    offsets = [0]
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+    string_table = struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(encoded)
+
+    metadata = json.dumps({key: value for key, value in data.items() if key != "transactions"},
+                          separators=(",", ":")).encode("utf-8")
+
+    records_offset = HEADER.size
+    strings_offset = records_offset + len(records)
+    metadata_offset = strings_offset + len(string_table)
+    f.write(HEADER.pack(MAGIC, VERSION, len(transactions), len(strings),
+                        records_offset, strings_offset, metadata_offset, len(metadata)))
+    f.write(records)
+    f.write(string_table)
+    f.write(metadata)
+
+
+class BinarySnapshot:
+    """
+    Reader snapshot biner berbasis mmap
+
+    File di-mmap read-only; record di-decode langsung dari buffer
+    (struct.iter_unpack atas memoryview, tanpa copy). String table di-decode
+    sekali saat dibutuhkan. snapshot[i] memberi view read-only satu record
+    tanpa membangun seluruh ledger.
+
+    Time Complexities:
+        - open: O(1) (hanya header dan metadata)
+        - __getitem__(): O(1), hanya string record tersebut yang di-decode
+        - iter_rows(): O(n + s)
+
+    Usage:
+        with BinarySnapshot("data.ftsnap") as snapshot:
+            for row in snapshot.iter_rows():
+                ...
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # File kosong tidak bisa di-mmap
+            self._file.close()
+            raise ValueError(f"Snapshot biner kosong: {path}")
+        self._buffer = memoryview(self._mmap)
+
+        (magic, version, self.record_count, self.string_count, self._records_offset,
+         self._strings_offset, metadata_offset, metadata_len) = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Bukan snapshot biner FlowTrack: {path}")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Versi snapshot biner tidak didukung: {version}")
+
+        self.metadata: dict = json.loads(
+            bytes(self._buffer[metadata_offset:metadata_offset + metadata_len]))
+        self._strings: Optional[List[str]] = None
+        self._dates: Dict[int, str] = {}
+
+    # ==================== DECODING ====================
+
+    def _string_table(self) -> List[str]:
+        """Decode seluruh string table sekali (di-cache)"""
+        if self._strings is None:
+            count = self.string_count + 1
+            offsets = struct.unpack_from(f"<{count}I", self._buffer, self._strings_offset)
+            blob_start = self._strings_offset + 4 * count
+            blob = bytes(self._buffer[blob_start:blob_start + offsets[-1]])
+            self._strings = [blob[offsets[i]:offsets[i + 1]].decode("utf-8")
+                             for i in range(self.string_count)]
+        return self._strings
+
+    def _string(self, index: int) -> str:
+        """Decode satu string langsung dari buffer (tanpa decode seluruh table)"""
+        if self._strings is not None:
+            return self._strings[index]
+        start, end = struct.unpack_from("<2I", self._buffer, self._strings_offset + 4 * index)
+        blob_start = self._strings_offset + 4 * (self.string_count + 1)
+        return str(self._buffer[blob_start + start:blob_start + end], "utf-8")
+
+    def _date(self, ordinal: int) -> str:
+        """Day-ordinal ke YYYY-MM-DD (di-cache per hari)"""
+        date_str = self._dates.get(ordinal)
+        if date_str is None:
+            date_str = self._dates[ordinal] = date_cls.fromordinal(ordinal).isoformat()
+        return date_str
+
+    def _records(self) -> memoryview:
+        end = self._records_offset + self.record_count * RECORD.size
+        return self._buffer[self._records_offset:end]
+
+    def _decode(self, record: Tuple) -> Tuple:
+        trans_id, ordinal, amount, type_code, flags, title, category = record
+        strings = self._strings
+        return (trans_id, self._date(ordinal), strings[title], amount,
+                TYPE_NAMES[type_code], strings[category], bool(flags & 1),
+                RECURRENCE_NAMES[flags >> 1])
+
+    def iter_rows(self) -> Iterator[Tuple]:
+        """
+        Iterasi semua record oldest-first
+
+        Yields:
+            Tuple (id, date, title, amount, type, category, is_recurring, recurrence_type)
+        """
+        self._string_table()
+        decode = self._decode
+        for record in RECORD.iter_unpack(self._records()):
+            yield decode(record)
+
+    def iter_transactions(self) -> Iterator[dict]:
+        """Iterasi semua record sebagai dictionary (format to_dict), oldest-first"""
+        for (trans_id, date, title, amount, trans_type, category,
+             is_recurring, recurrence_type) in self.iter_rows():
+            yield {
+                "id": trans_id,
+                "date": date,
+                "title": title,
+                "amount": amount,
+                "type": trans_type,
+                "category": category,
+                "is_recurring": is_recurring,
+                "recurrence_type": recurrence_type
+            }
+
+    def __getitem__(self, index: int) -> Tuple:
+        """View read-only satu record (tuple seperti iter_rows), langsung dari mmap"""
+        if index < 0:
+            index += self.record_count
+        if not 0 <= index < self.record_count:
+            raise IndexError("record index out of range")
+        (trans_id, ordinal, amount, type_code, flags,
+         title, category) = RECORD.unpack_from(self._buffer, self._records_offset + index * RECORD.size)
+        return (trans_id, self._date(ordinal), self._string(title), amount,
+                TYPE_NAMES[type_code], self._string(category), bool(flags & 1),
+                RECURRENCE_NAMES[flags >> 1])
+
+    def __len__(self) -> int:
+        return self.record_count
+
+    # ==================== LIFECYCLE ====================
+
+    def close(self):
+        """Lepaskan memoryview, mmap dan file"""
+        if self._buffer is not None:
+            self._buffer.release()
+            self._buffer = None
+            self._mmap.close()
+            self._file.close()
+
+    def __enter__(self) -> "BinarySnapshot":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __str__(self) -> str:
+        return f"BinarySnapshot[{self.record_count} records, {self.string_count} strings]"
+
+
+def convert_json_to_binary(json_path: str, binary_path: str) -> int:
+    """
+    Konversi snapshot JSON (data.json) ke snapshot biner
+
+    Returns:
+        Jumlah transaksi yang dikonversi
+    """
+    with open(json_path, 'r') as f:
+        data = json.load(f)
+    with open(binary_path, 'wb') as f:
+        write_binary_snapshot(f, data)
+    return len(data.get("transactions", []))
+
+
+if __name__ == "__main__":
+    # python -m models.binary_snapshot data.json data.ftsnap
+    if len(sys.argv) != 3:
+        print("Usage: python -m models.binary_snapshot <input.json> <output.ftsnap>")
+        sys.exit(1)
+    count = convert_json_to_binary(sys.argv[1], sys.argv[2])
+    print(f"{count} transaksi dikonversi ke {sys.argv[2]}")
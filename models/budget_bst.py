@@ -11,13 +11,17 @@ class BudgetNode:
         spent: Total pengeluaran untuk bulan tersebut
         left: Left child node
         right: Right child node
+        height: Tinggi subtree (untuk balancing AVL)
     """
+    __slots__ = ("month", "budget_limit", "spent", "left", "right", "height")
+    
     def __init__(self, month: str, budget_limit: float):
         self.month = month
         self.budget_limit = budget_limit
         self.spent = 0.0
         self.left: Optional[BudgetNode] = None
         self.right: Optional[BudgetNode] = None
+        self.height = 1
     
     def get_remaining(self) -> float:
         """Get sisa budget"""
@@ -46,10 +50,16 @@ class BudgetBST:
     Binary Search Tree untuk menyimpan Budget history per bulan
     Menggunakan bulan sebagai key untuk sorting (lexicographic order = chronological)
     
-    Data Structure: Binary Search Tree (BST)
-    - insert: O(log n) average, O(n) worst case
-    - search: O(log n) average, O(n) worst case
-    - delete: O(log n) average, O(n) worst case
+    Self-balancing (AVL): budget biasanya di-insert berurutan secara kronologis,
+    yang membuat BST biasa berubah menjadi linked list. Setelah setiap insert/delete,
+    node pada jalur pencarian di-rebalance dengan rotasi sehingga tinggi tree
+    selalu O(log n). Search, insert, dan traversal dilakukan secara iteratif
+    (tanpa rekursi) sehingga tidak terkena batas recursion Python.
+    
+    Data Structure: AVL Tree (Binary Search Tree seimbang)
+    - insert: O(log n)
+    - search: O(log n)
+    - delete: O(log n)
     - in-order traversal: O(n)
     
     Good for Demo: Menunjukkan BST data structure dan operations
@@ -58,12 +68,87 @@ class BudgetBST:
     def __init__(self):
         self.root: Optional[BudgetNode] = None
     
+    # ==================== AVL HELPERS ====================
+    
+    @staticmethod
+    def _height(node: Optional[BudgetNode]) -> int:
+        """Tinggi subtree (0 untuk None)"""
+        return node.height if node is not None else 0
+    
+    def _update_height(self, node: BudgetNode):
+        """Hitung ulang tinggi node dari kedua child-nya"""
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+    
+    def _balance_factor(self, node: BudgetNode) -> int:
+        """Selisih tinggi subtree kiri dan kanan"""
+        return self._height(node.left) - self._height(node.right)
+    
+    def _rotate_right(self, node: BudgetNode) -> BudgetNode:
+        """Rotasi kanan, return root subtree yang baru"""
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update_height(node)
+        self._update_height(pivot)
+        return pivot
+    
+    def _rotate_left(self, node: BudgetNode) -> BudgetNode:
+        """Rotasi kiri, return root subtree yang baru"""
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update_height(node)
+        self._update_height(pivot)
+        return pivot
+    
+    def _rebalance(self, node: BudgetNode) -> BudgetNode:
+        """
+        Update tinggi node lalu lakukan rotasi (LL, LR, RR, RL) jika tidak seimbang
+        
+        Returns:
+            Root subtree setelah rebalancing
+        """
+        self._update_height(node)
+        balance = self._balance_factor(node)
+        
+        if balance > 1:
+            if self._balance_factor(node.left) < 0:
+                node.left = self._rotate_left(node.left)  # LR case
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._balance_factor(node.right) > 0:
+                node.right = self._rotate_right(node.right)  # RL case
+            return self._rotate_left(node)
+        return node
+    
+    def _rebalance_path(self, path: list):
+        """
+        Rebalance setiap node di jalur pencarian dari bawah ke atas (iteratif)
+        dan sambungkan kembali root subtree hasil rotasi ke parent-nya
+        
+        Args:
+            path: List node dari root sampai node terdalam yang berubah
+        """
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            new_root = self._rebalance(node)
+            if depth == 0:
+                self.root = new_root
+            else:
+                parent = path[depth - 1]
+                if parent.left is node:
+                    parent.left = new_root
+                else:
+                    parent.right = new_root
+    
+    # ==================== OPERATIONS ====================
+    
     def insert(self, month: str, budget_limit: float) -> BudgetNode:
         """
         Insert atau update budget untuk bulan tertentu
-        Jika sudah ada, return node yang ada; jika belum, buat baru
+        Jika sudah ada, update limit node yang ada; jika belum, buat baru
         
-        Time Complexity: O(log n) average, O(n) worst case
+        Time Complexity: O(log n)
         
         Args:
             month: Bulan dalam format YYYY-MM
@@ -76,29 +161,32 @@ class BudgetBST:
             self.root = BudgetNode(month, budget_limit)
             return self.root
         
-        return self._insert_recursive(self.root, month, budget_limit)
-    
-    def _insert_recursive(self, node: Optional[BudgetNode], 
-                         month: str, budget_limit: float) -> BudgetNode:
-        """Helper untuk recursive insertion"""
-        if node is None:
-            return BudgetNode(month, budget_limit)
+        # Turun secara iteratif sambil mencatat jalur pencarian
+        path = []
+        current = self.root
+        while current is not None:
+            if month == current.month:
+                # Node dengan bulan yang sama, update saja
+                current.budget_limit = budget_limit
+                return current
+            path.append(current)
+            current = current.left if month < current.month else current.right
         
-        if month < node.month:
-            node.left = self._insert_recursive(node.left, month, budget_limit)
-        elif month > node.month:
-            node.right = self._insert_recursive(node.right, month, budget_limit)
+        new_node = BudgetNode(month, budget_limit)
+        parent = path[-1]
+        if month < parent.month:
+            parent.left = new_node
         else:
-            # Node dengan bulan yang sama, update saja
-            node.budget_limit = budget_limit
+            parent.right = new_node
         
-        return node
+        self._rebalance_path(path)
+        return new_node
     
     def search(self, month: str) -> Optional[BudgetNode]:
         """
         Cari budget untuk bulan tertentu
         
-        Time Complexity: O(log n) average, O(n) worst case
+        Time Complexity: O(log n)
         
         Args:
             month: Bulan dalam format YYYY-MM
@@ -106,25 +194,21 @@ class BudgetBST:
         Returns:
             BudgetNode if found, None otherwise
         """
-        return self._search_recursive(self.root, month)
-    
-    def _search_recursive(self, node: Optional[BudgetNode], month: str) -> Optional[BudgetNode]:
-        """Helper untuk recursive search"""
-        if node is None:
-            return None
-        
-        if month < node.month:
-            return self._search_recursive(node.left, month)
-        elif month > node.month:
-            return self._search_recursive(node.right, month)
-        else:
-            return node
+        current = self.root
+        while current is not None:
+            if month < current.month:
+                current = current.left
+            elif month > current.month:
+                current = current.right
+            else:
+                return current
+        return None
     
     def delete(self, month: str) -> bool:
         """
         Delete budget untuk bulan tertentu
         
-        Time Complexity: O(log n) average, O(n) worst case
+        Time Complexity: O(log n)
         
         Args:
             month: Bulan dalam format YYYY-MM
@@ -132,72 +216,57 @@ class BudgetBST:
         Returns:
             True if deletion was successful, False otherwise
         """
-        self.root, deleted = self._delete_recursive(self.root, month)
-        return deleted
-    
-    def _delete_recursive(self, node: Optional[BudgetNode], 
-                         month: str) -> tuple:
-        """Helper untuk recursive deletion, return (new_node, was_deleted)"""
-        if node is None:
-            return None, False
+        path = []
+        current = self.root
+        while current is not None and current.month != month:
+            path.append(current)
+            current = current.left if month < current.month else current.right
         
-        if month < node.month:
-            node.left, deleted = self._delete_recursive(node.left, month)
-            return node, deleted
-        elif month > node.month:
-            node.right, deleted = self._delete_recursive(node.right, month)
-            return node, deleted
-        else:
-            # Node ditemukan, hapus
-            # Case 1: No children (leaf node)
-            if node.left is None and node.right is None:
-                return None, True
-            
-            # Case 2: One child
-            if node.left is None:
-                return node.right, True
-            if node.right is None:
-                return node.left, True
-            
+        if current is None:
+            return False
+        
+        if current.left is not None and current.right is not None:
             # Case 3: Two children
-            # Find in-order successor (smallest in right subtree)
-            successor = self._find_min(node.right)
-            node.month = successor.month
-            node.budget_limit = successor.budget_limit
-            node.spent = successor.spent
-            node.right, _ = self._delete_recursive(node.right, successor.month)
-            return node, True
-    
-    def _find_min(self, node: BudgetNode) -> BudgetNode:
-        """Find node dengan nilai minimum (paling kiri)"""
-        current = node
-        while current.left is not None:
-            current = current.left
-        return current
+            # Salin in-order successor (paling kiri di subtree kanan) lalu hapus successor
+            path.append(current)
+            successor = current.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            current.month = successor.month
+            current.budget_limit = successor.budget_limit
+            current.spent = successor.spent
+            current = successor
+        
+        # Case 1 & 2: paling banyak satu child
+        child = current.left if current.left is not None else current.right
+        if not path:
+            self.root = child
+        else:
+            parent = path[-1]
+            if parent.left is current:
+                parent.left = child
+            else:
+                parent.right = child
+        
+        self._rebalance_path(path)
+        return True
     
     def get_all_budgets(self) -> list:
         """
-        Get semua budget dalam urutan chronological (in-order traversal)
+        Get semua budget dalam urutan chronological (in-order traversal iteratif)
         
         Time Complexity: O(n)
         
         Returns:
             List of BudgetNode in sorted order
         """
-        result = []
-        self._in_order_traversal(self.root, result)
-        return result
-    
-    def _in_order_traversal(self, node: Optional[BudgetNode], result: list):
-        """Helper untuk in-order traversal"""
-        if node is not None:
-            self._in_order_traversal(node.left, result)
-            result.append(node)
-            self._in_order_traversal(node.right, result)
+        return self.get_budgets_in_range("", "9999-99")
     
     def get_budgets_in_range(self, start_month: str, end_month: str) -> list:
         """
         Get budgets dalam range tertentu (untuk filter/view)
+        In-order traversal iteratif dengan stack, subtree di luar range dilewati
         
         Time Complexity: O(k + log n) dimana k adalah jumlah hasil
         
@@ -209,24 +278,22 @@ class BudgetBST:
             List of BudgetNode dalam range
         """
         result = []
-        self._range_search(self.root, start_month, end_month, result)
+        stack = []
+        current = self.root
+        while stack or current is not None:
+            # Turun ke kiri hanya jika subtree kiri mungkin berisi bulan >= start
+            while current is not None:
+                stack.append(current)
+                current = current.left if current.month >= start_month else None
+            
+            node = stack.pop()
+            if node.month > end_month:
+                break
+            if node.month >= start_month:
+                result.append(node)
+            current = node.right
         return result
     
-    def _range_search(self, node: Optional[BudgetNode], 
-                     start_month: str, end_month: str, result: list):
-        """Helper untuk range search"""
-        if node is None:
-            return
-        
-        if node.month >= start_month:
-            self._range_search(node.left, start_month, end_month, result)
-        
-        if start_month <= node.month <= end_month:
-            result.append(node)
-        
-        if node.month <= end_month:
-            self._range_search(node.right, start_month, end_month, result)
-    
     def get_current_month_budget(self, current_month: str) -> Optional[BudgetNode]:
         """
         Get budget untuk bulan saat ini (convenience method)
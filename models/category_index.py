@@ -0,0 +1,144 @@
+from typing import Dict, Iterable, Optional, Set
+
+from models.transaction_node import TransactionNode
+
+
+class CategoryIndex:
+    """
+    Inverted index kategori -> ID transaksi, dengan total all-time per kategori
+
+    Kategori (field "Catatan" di form) adalah free text, sehingga tanpa index
+    pertanyaan seperti "transaksi makan bulan ini" butuh scan seluruh DLL.
+    Index ini menyimpan:
+    - members: kategori -> set ID transaksi (node di-resolve lewat id_index
+      FinanceManager, tidak ada referensi node tambahan)
+    - all_time: kategori -> {income, expense, count}
+
+    Total per bulan tidak disimpan di sini: monthly stats FinanceManager sudah
+    memuat by_category untuk setiap bulan.
+
+    Keanggotaan (add/remove/move) dan total (apply) di-update terpisah:
+    FinanceManager memanggil apply() dari _apply_stats, sehingga total tetap
+    mengikuti aturan monthly stats (misalnya agregat dari manifest partitioned
+    storage untuk bulan yang belum dimuat).
+
+    Time Complexities:
+        - add() / remove() / move(): O(1)
+        - apply(): O(1)
+        - get_totals(): O(1)
+
+    Attributes:
+        members: Dictionary kategori -> set trans_id
+        all_time: Dictionary kategori -> {income, expense, count}
+    """
+
+    def __init__(self):
+        self.members: Dict[str, Set[int]] = {}
+        self.all_time: Dict[str, Dict[str, float]] = {}
+
+    # ==================== MEMBERSHIP ====================
+
+    def add(self, node: TransactionNode):
+        """Masukkan ID node ke index kategorinya"""
+        ids = self.members.get(node.category)
+        if ids is None:
+            ids = self.members[node.category] = set()
+        ids.add(node.trans_id)
+
+    def remove(self, node: TransactionNode, category: Optional[str] = None) -> bool:
+        """
+        Hapus node dari index kategori
+
+        Args:
+            node: Node yang dihapus
+            category: Kategori lama (default: node.category)
+
+        Returns:
+            True jika node ditemukan
+        """
+        category = node.category if category is None else category
+        ids = self.members.get(category)
+        if ids is None or node.trans_id not in ids:
+            return False
+        ids.discard(node.trans_id)
+        if not ids:
+            del self.members[category]
+        return True
+
+    def move(self, node: TransactionNode, old_category: str):
+        """Pindahkan node setelah kategorinya diubah (update)"""
+        if old_category != node.category and self.remove(node, old_category):
+            self.add(node)
+
+    def add_many(self, nodes: Iterable[TransactionNode]):
+        """
+        Masukkan banyak node sekaligus
+
+        Time Complexity: O(k)
+        """
+        members = self.members
+        for node in nodes:
+            ids = members.get(node.category)
+            if ids is None:
+                ids = members[node.category] = set()
+            ids.add(node.trans_id)
+
+    def ids(self, category: str) -> Set[int]:
+        """ID transaksi (yang sudah dimuat) dalam kategori tersebut"""
+        return self.members.get(category, set())
+
+    # ==================== TOTALS ====================
+
+    def apply(self, category: str, key: str, amount: float, sign: int):
+        """
+        Tambahkan kontribusi satu transaksi ke total all-time kategori
+
+        Time Complexity: O(1)
+
+        Args:
+            category: Kategori transaksi
+            key: "income" atau "expense"
+            amount: Jumlah bertanda (sudah dikali sign)
+            sign: 1 untuk menambah, -1 untuk mengurangi
+        """
+        overall = self.all_time.get(category)
+        if overall is None:
+            overall = self.all_time[category] = {"income": 0.0, "expense": 0.0, "count": 0}
+
+        overall[key] += amount
+        overall["count"] += sign
+
+        # Bersihkan entry kosong (sama seperti monthly stats)
+        if overall["count"] == 0:
+            del self.all_time[category]
+
+    def load_totals(self, monthly_stats: Dict[str, Dict]):
+        """
+        Bangun ulang total all-time dari monthly stats (by_category per bulan)
+
+        Time Complexity: O(m x c)
+        """
+        self.all_time.clear()
+        for stats in monthly_stats.values():
+            for category, category_stats in stats.get("by_category", {}).items():
+                overall = self.all_time.setdefault(
+                    category, {"income": 0.0, "expense": 0.0, "count": 0})
+                overall["income"] += category_stats["income"]
+                overall["expense"] += category_stats["expense"]
+                overall["count"] += category_stats["count"]
+
+    # ==================== QUERIES ====================
+
+    def get_totals(self, category: str) -> Dict[str, float]:
+        """
+        Total income/expense/count all-time satu kategori
+
+        Time Complexity: O(1)
+        """
+        totals = self.all_time.get(category)
+        if totals is None:
+            return {"income": 0.0, "expense": 0.0, "count": 0}
+        return dict(totals)
+
+    def __str__(self) -> str:
+        return f"CategoryIndex[{len(self.members)} categories]"
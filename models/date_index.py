@@ -0,0 +1,246 @@
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Mapping
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from models.transaction_node import TransactionNode
+
+
+class DateIndex:
+    """
+    Index transaksi terurut tanggal (sorted day buckets)
+
+    DLL menyimpan transaksi dalam urutan insert; index ini menyimpan node yang
+    sama terurut berdasarkan tanggal:
+    - days: list tanggal YYYY-MM-DD terurut ascending (binary search dengan bisect)
+    - buckets: tanggal -> {trans_id: node}, terurut dari ID terkecil
+
+    Transaksi pada hari yang sudah ada cukup O(1). Hari baru dicari dengan
+    binary search (O(log d)) lalu disisipkan ke list, yang menggeser elemen
+    setelahnya: O(d) worst case. d adalah jumlah hari berbeda (ratusan per
+    tahun) dan geserannya satu memmove pointer, sehingga list terurut tetap
+    lebih murah daripada tree di Python. Iterasi newest-first atau per range
+    tanggal tidak membutuhkan sort sama sekali.
+
+    Time Complexities:
+        - add(): O(1) untuk hari yang sudah ada, O(d) untuk hari baru
+          (O(log d) search + pergeseran list); O(g log g) jika ID lebih kecil
+          dari ID terakhir bucket (lazy load / rollback), g = ukuran bucket
+        - remove() / move(): O(1), O(d) jika hari menjadi kosong
+        - iter_nodes(): O(log d + k) untuk k transaksi dalam range
+        - add_many(): O(k + d log d)
+
+    Attributes:
+        days: Tanggal yang memiliki transaksi, ascending
+        buckets: Dictionary tanggal -> {trans_id: TransactionNode}
+    """
+
+    def __init__(self):
+        self.days: List[str] = []
+        self.buckets: Dict[str, Dict[int, TransactionNode]] = {}
+        self.count = 0
+
+    def add(self, node: TransactionNode):
+        """
+        Masukkan node ke bucket tanggalnya
+
+        Time Complexity: O(1), O(d) jika tanggal belum ada (insort)
+        """
+        bucket = self.buckets.get(node.date)
+        if bucket is None:
+            insort(self.days, node.date)
+            self.buckets[node.date] = {node.trans_id: node}
+        else:
+            out_of_order = next(reversed(bucket)) > node.trans_id
+            bucket[node.trans_id] = node
+            if out_of_order:
+                # Node lama (lazy load / rollback): urutkan ulang bucket kecil ini
+                self.buckets[node.date] = dict(sorted(bucket.items()))
+        self.count += 1
+
+    def remove(self, node: TransactionNode, date: Optional[str] = None) -> bool:
+        """
+        Hapus node dari bucket tanggalnya
+
+        Args:
+            node: Node yang dihapus
+            date: Tanggal bucket (default: node.date), dipakai jika tanggal node
+                  sudah diubah
+
+        Returns:
+            True jika node ditemukan
+        """
+        date = node.date if date is None else date
+        bucket = self.buckets.get(date)
+        if bucket is None or bucket.get(node.trans_id) is not node:
+            return False
+        del bucket[node.trans_id]
+        if not bucket:
+            del self.buckets[date]
+            del self.days[bisect_left(self.days, date)]
+        self.count -= 1
+        return True
+
+    def move(self, node: TransactionNode, old_date: str):
+        """Pindahkan node setelah tanggalnya diubah (update)"""
+        if old_date != node.date and self.remove(node, old_date):
+            self.add(node)
+
+    def add_many(self, nodes: Iterable[TransactionNode]):
+        """
+        Masukkan banyak node sekaligus (load / bulk insert): hari baru
+        digabung dan list hari di-sort sekali
+
+        Time Complexity: O(k + d log d)
+        """
+        new_days = []
+        reorder = set()
+        for node in nodes:
+            bucket = self.buckets.get(node.date)
+            if bucket is None:
+                bucket = self.buckets[node.date] = {}
+                new_days.append(node.date)
+            elif bucket and next(reversed(bucket)) > node.trans_id:
+                reorder.add(node.date)
+            bucket[node.trans_id] = node
+            self.count += 1
+        for date in reorder:
+            self.buckets[date] = dict(sorted(self.buckets[date].items()))
+        if new_days:
+            if len(new_days) == 1:
+                insort(self.days, new_days[0])
+            else:
+                self.days.extend(new_days)
+                self.days.sort()
+
+    def clear(self):
+        """Kosongkan index"""
+        self.days.clear()
+        self.buckets.clear()
+        self.count = 0
+
+    # ==================== QUERIES ====================
+
+    def day_range(self, start_date: Optional[str] = None,
+                  end_date: Optional[str] = None) -> Tuple[int, int]:
+        """
+        Posisi [left, right) pada days untuk range tanggal inklusif
+
+        Time Complexity: O(log d)
+        """
+        left = 0 if start_date is None else bisect_left(self.days, start_date)
+        right = len(self.days) if end_date is None else bisect_right(self.days, end_date)
+        return left, max(left, right)
+
+    def iter_days(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                  newest_first: bool = True) -> Iterator[str]:
+        """Iterasi tanggal yang memiliki transaksi dalam range"""
+        left, right = self.day_range(start_date, end_date)
+        if newest_first:
+            for i in range(right - 1, left - 1, -1):
+                yield self.days[i]
+        else:
+            for i in range(left, right):
+                yield self.days[i]
+
+    def iter_nodes(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                   newest_first: bool = True) -> Iterator[TransactionNode]:
+        """
+        Iterasi transaksi dalam range tanggal, terurut (tanggal, ID)
+
+        Time Complexity: O(log d + k)
+
+        Args:
+            start_date: Tanggal awal YYYY-MM-DD (inklusif, opsional)
+            end_date: Tanggal akhir YYYY-MM-DD (inklusif, opsional)
+            newest_first: True untuk tanggal/ID terbaru dulu
+
+        Yields:
+            TransactionNode
+        """
+        for date in self.iter_days(start_date, end_date, newest_first):
+            bucket = self.buckets[date]
+            yield from (reversed(bucket.values()) if newest_first else bucket.values())
+
+    def group(self, date: str) -> List[TransactionNode]:
+        """Transaksi pada satu tanggal, dari ID terbesar (terbaru)"""
+        bucket = self.buckets.get(date)
+        return list(reversed(bucket.values())) if bucket else []
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __str__(self) -> str:
+        return f"DateIndex[{self.count} transactions, {len(self.days)} days]"
+
+
+class DateGroupsView(Mapping):
+    """
+    View read-only tanggal -> list transaksi di atas DateIndex
+
+    Iterasi key berjalan dari tanggal terbaru ke terlama (tanpa sort) dan
+    selalu mencerminkan isi index saat ini; tidak ada dictionary yang dibangun
+    ulang. Nilai untuk setiap tanggal terurut dari ID terbesar.
+
+    Selain interface Mapping, view menyediakan akses posisional (tanggal
+    ke-i dari yang terbaru) dan iterasi grup tanpa copy, dipakai feed UI
+    untuk membaca index secara langsung.
+
+    Time Complexities:
+        - view[date]: O(k) untuk k transaksi pada tanggal tersebut
+        - date in view / group_size(): O(1)
+        - len(view) / date_at() / position(): O(log d), O(1) tanpa range
+        - iter_group(): O(skip + k)
+    """
+
+    def __init__(self, index: DateIndex, start_date: Optional[str] = None,
+                 end_date: Optional[str] = None):
+        self.index = index
+        self.start_date = start_date
+        self.end_date = end_date
+
+    def _in_range(self, date: str) -> bool:
+        return ((self.start_date is None or date >= self.start_date) and
+                (self.end_date is None or date <= self.end_date))
+
+    def __getitem__(self, date: str) -> List[TransactionNode]:
+        if not isinstance(date, str) or not self._in_range(date) or date not in self.index.buckets:
+            raise KeyError(date)
+        return self.index.group(date)
+
+    def __contains__(self, date) -> bool:
+        return isinstance(date, str) and self._in_range(date) and date in self.index.buckets
+
+    def __iter__(self) -> Iterator[str]:
+        return self.index.iter_days(self.start_date, self.end_date)
+
+    def __len__(self) -> int:
+        left, right = self.index.day_range(self.start_date, self.end_date)
+        return right - left
+
+    def date_at(self, position: int) -> str:
+        """Tanggal ke-position dari yang terbaru (0 = tanggal terbaru)"""
+        left, right = self.index.day_range(self.start_date, self.end_date)
+        if not 0 <= position < right - left:
+            raise IndexError("date position out of range")
+        return self.index.days[right - 1 - position]
+
+    def position(self, date: str) -> int:
+        """Posisi tanggal (harus ada di view) dari yang terbaru; kebalikan date_at()"""
+        _, right = self.index.day_range(self.start_date, self.end_date)
+        return right - 1 - bisect_left(self.index.days, date)
+
+    def group_size(self, date: str) -> int:
+        """Jumlah transaksi pada satu tanggal (0 jika tidak ada)"""
+        if not self._in_range(date):
+            return 0
+        return len(self.index.buckets.get(date, ()))
+
+    def iter_group(self, date: str, skip: int = 0) -> Iterator[TransactionNode]:
+        """Iterasi transaksi satu tanggal dari ID terbesar, melewati skip node pertama"""
+        bucket = self.index.buckets.get(date)
+        if bucket and self._in_range(date):
+            yield from islice(reversed(bucket.values()), skip, None)
+
+    def __repr__(self) -> str:
+        return f"DateGroupsView[{self.start_date or '...'} - {self.end_date or '...'}: {len(self)} days]"
@@ -0,0 +1,229 @@
+from datetime import date as date_cls
+from typing import Dict, Iterable, List, Tuple
+
+
+class FenwickTree:
+    """
+    Fenwick Tree (Binary Indexed Tree) untuk prefix sum dengan point update
+
+    Time Complexities:
+        - add(): O(log n)
+        - prefix_sum(): O(log n)
+        - range_sum(): O(log n)
+        - find_prefix(): O(log n)
+        - build() / point_values(): O(n)
+
+    Attributes:
+        size: Jumlah slot (index 0..size-1)
+        tree: Array internal 1-based
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.tree: List[float] = [0.0] * (size + 1)
+
+    def add(self, i: int, delta: float):
+        """
+        Tambahkan delta ke slot i
+        Time Complexity: O(log n)
+        """
+        i += 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, i: int) -> float:
+        """
+        Jumlah slot 0..i (inklusif), 0 jika i < 0
+        Time Complexity: O(log n)
+        """
+        total = 0.0
+        i = min(i, self.size - 1) + 1
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def range_sum(self, left: int, right: int) -> float:
+        """
+        Jumlah slot left..right (inklusif)
+        Time Complexity: O(log n)
+        """
+        if right < left:
+            return 0.0
+        return self.prefix_sum(right) - self.prefix_sum(left - 1)
+
+    def find_prefix(self, target: float) -> int:
+        """
+        Index terkecil i dengan prefix_sum(i) > target (binary lifting)
+        Hanya valid untuk nilai slot non-negatif; size jika tidak ada
+        Time Complexity: O(log n)
+        """
+        pos = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and self.tree[nxt] <= target:
+                pos = nxt
+                target -= self.tree[nxt]
+            step >>= 1
+        return pos
+
+    def point_values(self) -> List[float]:
+        """
+        Nilai per slot (kebalikan dari build)
+        Time Complexity: O(n)
+        """
+        tree = self.tree[:]
+        for i in range(self.size, 0, -1):
+            parent = i + (i & -i)
+            if parent <= self.size:
+                tree[parent] -= tree[i]
+        return tree[1:]
+
+    def build(self, values: List[float]):
+        """
+        Bangun ulang tree dari nilai per slot secara linear
+        Time Complexity: O(n)
+        """
+        self.size = len(values)
+        self.tree = [0.0] + list(values)
+        for i in range(1, self.size + 1):
+            parent = i + (i & -i)
+            if parent <= self.size:
+                self.tree[parent] += self.tree[i]
+
+
+class DailyTotals:
+    """
+    Total pemasukan dan pengeluaran per hari yang di-index dengan day-ordinal
+
+    Dua Fenwick Tree (income dan expense) dengan slot per hari, dimulai dari
+    base_ordinal. Kapasitas otomatis diperbesar (doubling) jika ada tanggal di
+    luar range, sehingga total untuk range tanggal apa pun bisa dihitung
+    dengan dua prefix sum.
+
+    Time Complexities:
+        - add(): O(log d) amortized, d = jumlah hari dalam range
+        - range_totals(): O(log d)
+
+    Attributes:
+        base_ordinal: Ordinal hari untuk slot 0
+        income: FenwickTree total pemasukan per hari
+        expense: FenwickTree total pengeluaran per hari
+    """
+
+    INITIAL_DAYS = 1024
+
+    def __init__(self):
+        self.base_ordinal = 0
+        self.income = FenwickTree(0)
+        self.expense = FenwickTree(0)
+        self._ordinal_cache: Dict[str, int] = {}
+
+    def _ordinal(self, date_str: str) -> int:
+        """Konversi YYYY-MM-DD ke day-ordinal (di-cache per tanggal)"""
+        ordinal = self._ordinal_cache.get(date_str)
+        if ordinal is None:
+            ordinal = date_cls.fromisoformat(date_str).toordinal()
+            self._ordinal_cache[date_str] = ordinal
+        return ordinal
+
+    def _ensure_range(self, low: int, high: int):
+        """
+        Pastikan ordinal low..high berada di dalam kapasitas tree
+        Jika tidak, base dan kapasitas diperbesar lalu tree dibangun ulang (O(d))
+        """
+        size = self.income.size
+        if size and self.base_ordinal <= low and high < self.base_ordinal + size:
+            return
+
+        if size:
+            old_end = self.base_ordinal + size - 1
+            # Tanggal sebelum base: perluas sisi bawah minimal sebesar kapasitas
+            # saat ini, agar back-dated insert beruntun tetap amortized (doubling)
+            new_base = self.base_ordinal
+            if low < self.base_ordinal:
+                new_base = min(low, self.base_ordinal - size)
+            new_size = size
+            while new_base + new_size <= max(high, old_end):
+                new_size *= 2
+        else:
+            new_base = low
+            new_size = self.INITIAL_DAYS
+            while new_base + new_size <= high:
+                new_size *= 2
+
+        offset = self.base_ordinal - new_base
+        for tree in (self.income, self.expense):
+            values = [0.0] * new_size
+            for i, value in enumerate(tree.point_values()):
+                values[i + offset] = value
+            tree.build(values)
+        self.base_ordinal = new_base
+
+    def add(self, date_str: str, trans_type: str, amount: float):
+        """
+        Tambahkan amount ke total hari tersebut
+
+        Args:
+            date_str: Tanggal YYYY-MM-DD
+            trans_type: "Income" atau "Expense"
+            amount: Jumlah (negatif untuk mengurangi)
+        """
+        ordinal = self._ordinal(date_str)
+        self._ensure_range(ordinal, ordinal)
+        tree = self.income if trans_type == "Income" else self.expense
+        tree.add(ordinal - self.base_ordinal, amount)
+
+    def add_many(self, points: Iterable[Tuple[str, str, float]]):
+        """
+        Bulk add (dipakai saat load): akumulasi per hari lalu build sekali
+
+        Time Complexity: O(k + d)
+
+        Args:
+            points: Iterable of (date_str, trans_type, amount)
+        """
+        income_days: Dict[int, float] = {}
+        expense_days: Dict[int, float] = {}
+        for date_str, trans_type, amount in points:
+            ordinal = self._ordinal(date_str)
+            days = income_days if trans_type == "Income" else expense_days
+            days[ordinal] = days.get(ordinal, 0.0) + amount
+
+        ordinals = list(income_days) + list(expense_days)
+        if not ordinals:
+            return
+        self._ensure_range(min(ordinals), max(ordinals))
+
+        for tree, days in ((self.income, income_days), (self.expense, expense_days)):
+            values = tree.point_values()
+            for ordinal, amount in days.items():
+                values[ordinal - self.base_ordinal] += amount
+            tree.build(values)
+
+    def range_totals(self, start_date: str, end_date: str) -> Dict[str, float]:
+        """
+        Total pemasukan dan pengeluaran antara dua tanggal (inklusif)
+
+        Time Complexity: O(log d)
+
+        Args:
+            start_date: Tanggal awal YYYY-MM-DD
+            end_date: Tanggal akhir YYYY-MM-DD
+
+        Returns:
+            Dictionary dengan income, expense, balance
+        """
+        if not self.income.size:
+            return {"income": 0.0, "expense": 0.0, "balance": 0.0}
+
+        left = self._ordinal(start_date) - self.base_ordinal
+        right = self._ordinal(end_date) - self.base_ordinal
+        left = max(left, 0)
+        right = min(right, self.income.size - 1)
+
+        income = self.income.range_sum(left, right)
+        expense = self.expense.range_sum(left, right)
+        return {"income": income, "expense": expense, "balance": income - expense}
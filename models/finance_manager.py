@@ -1,12 +1,44 @@
+import calendar
+import heapq
+from contextlib import contextmanager
 import json
 import os
 import csv
+import functools
+import stat
+import tempfile
+import threading
+import time
+from sys import intern
 from models.max_heap import MaxHeap
 from models.transaction_node import TransactionNode
-from models.recurring_queue import RecurringTransactionQueue
+from models.recurring_queue import RecurringTransactionQueue, ScheduledTransaction
 from models.budget_bst import BudgetBST
-from typing import Optional, Dict, List
-from datetime import datetime
+from models.journal import TransactionJournal
+from models.fenwick_tree import DailyTotals
+from models.date_index import DateIndex, DateGroupsView
+from models.category_index import CategoryIndex
+from models.sqlite_storage import SQLiteStorage
+from models.persistence_worker import PersistenceWorker
+from models import binary_snapshot
+from utils.helpers import CurrencyHelper
+from typing import Iterator, Mapping, Optional, Dict, List, Tuple
+from datetime import date as date_cls, datetime
+
+# umask proses, untuk permission file baru yang ditulis lewat temp file
+# (mkstemp selalu membuat file 0600)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _synchronized(method):
+    """Jalankan method mutasi sambil memegang self.lock (lihat PersistenceWorker)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class FinanceManager:
     """
@@ -15,51 +47,138 @@ class FinanceManager:
     Struktur data yang digunakan:
     1. Doubly Linked List - Menyimpan transaksi sesuai urutan insertion
     2. Max-Heap - Melacak pengeluaran tertinggi
-    3. Hash Map - Mengelompokkan transaksi berdasarkan tanggal
+    3. Hash Map - Mengelompokkan transaksi berdasarkan tanggal dan index ID -> node
+    4. Append-only Journal - Write-ahead log untuk persistensi O(1) per mutasi
+    5. SQLite Storage (opsional) - Backend durable, bulan lain dimuat lewat indexed query
+    6. Materialized Monthly View - Agregat per bulan yang di-update O(1) per mutasi
+    7. Fenwick Tree - Total harian untuk query range tanggal O(log n)
     
     Responsibilities:
         - Operasi CRUD pada transaksi
         - Manajemen Strukdata
-        - Penyimpanan file (JSON)
+        - Penyimpanan file (JSON snapshot + journal opsional, atau SQLite)
         - Perhitungan statistik
     """
     
-    def __init__(self, data_file: str = "data.json"):
+    def __init__(self, data_file: str = "data.json", journal_mode: bool = False,
+                 compact_threshold: int = 1000,
+                 storage: Optional[SQLiteStorage] = None,
+                 background_save: bool = False, save_debounce: float = 0.5,
+                 partitioned: bool = False):
         """
         Inisialisasi Finance Manager
         
         Args:
-            data_file: Path to JSON file for data persistence
+            data_file: Path to JSON file for data persistence. File berekstensi
+                       .ftsnap (atau berisi header snapshot biner) disimpan dan
+                       dimuat dalam format biner (models/binary_snapshot.py)
+            journal_mode: Jika True, setiap mutasi di-append ke journal
+                          (data_file + ".journal") alih-alih menulis ulang snapshot
+            compact_threshold: Jumlah record journal sebelum compaction ke snapshot
+            storage: Storage backend SQLite (opsional). Jika diisi, database menjadi
+                     sumber data utama dan data_file hanya dipakai untuk import/export.
+                     Seperti partitioned storage, hanya bulan berjalan yang dimuat saat
+                     startup; bulan lain dimuat lewat indexed query saat dibutuhkan
+            background_save: Jika True, persist() hanya menandai dirty dan penulisan
+                             (snapshot/journal) dilakukan PersistenceWorker di thread
+                             terpisah. Tidak berlaku untuk storage backend (koneksi
+                             SQLite terikat ke thread pembuatnya)
+            save_debounce: Jeda debounce (detik) PersistenceWorker
+            partitioned: Jika True, ledger disimpan per bulan (satu file per YYYY-MM
+                         plus manifest berisi agregat per bulan) dan bulan yang sudah
+                         tutup baru dimuat saat dibutuhkan. Tidak bisa digabung dengan
+                         journal_mode atau storage backend
         """
+        if partitioned and (journal_mode or storage is not None):
+            raise ValueError("partitioned storage tidak bisa digabung dengan journal_mode/storage")
         self.data_file = data_file
+        # Snapshot biner (lihat models/binary_snapshot.py) dipilih dari ekstensi
+        # atau isi file yang sudah ada; selain itu snapshot JSON
+        self.binary_snapshot = (data_file.endswith(binary_snapshot.EXTENSION) or
+                                binary_snapshot.is_binary_snapshot(data_file))
+        
+        # STORAGE BACKEND (SQLite)
+        self.storage = storage
+        
+        # WRITE-AHEAD JOURNAL (tidak dipakai jika storage backend aktif)
+        self.journal: Optional[TransactionJournal] = (
+            TransactionJournal(data_file + ".journal")
+            if journal_mode and storage is None else None
+        )
+        self.compact_threshold = compact_threshold
+        # Generation compaction terakhir (disimpan di snapshot dan header journal)
+        self.journal_generation = 0
+        self._replaying = False
+        
+        # Semua mutasi memegang lock ini agar PersistenceWorker selalu
+        # men-serialize snapshot yang konsisten
+        self.lock = threading.RLock()
+        
+        # UNIT OF WORK (lihat batch()): None jika tidak sedang dalam batch
+        self._batch: Optional[Dict] = None
         
         # DOUBLY LINKED LIST
         self.head: Optional[TransactionNode] = None
         self.tail: Optional[TransactionNode] = None
         self.transaction_count = 0
         
+        # HASH MAP INDEX: trans_id -> TransactionNode (lookup O(1))
+        self.id_index: Dict[int, TransactionNode] = {}
+        
+        # DATE INDEX: node yang sama terurut tanggal (sorted day buckets),
+        # dipakai group_by_date dan iterasi per range tanggal tanpa sort
+        self.date_index = DateIndex()
+        
+        # CATEGORY INDEX: kategori -> set ID transaksi + total all-time per kategori
+        self.category_index = CategoryIndex()
+        
         # MAX-HEAP
         self.expense_heap = MaxHeap()
         
         # RECURRING TRANSACTIONS QUEUE
         self.recurring_queue = RecurringTransactionQueue()
+        # Schedule cursor: trans_id template -> tanggal occurrence berikutnya yang
+        # belum diposting (dipersist agar materialisasi idempotent antar restart)
+        self.recurring_cursor: Dict[int, str] = {}
         
         # BUDGET BST
         self.budget_bst = BudgetBST()
         
-        # Statistics
-        self.total_income = 0.0
-        self.total_expense = 0.0
+        # MATERIALIZED MONTHLY VIEW
+        # {month: {"income", "expense", "count", "by_category": {category: {...}}}}
+        self.monthly_stats: Dict[str, Dict] = {}
+        
+        # FENWICK TREE: total income/expense per hari
+        self.daily_totals = DailyTotals()
+        
+        # GENERATION COUNTER: naik setiap kali isi ledger berubah
+        # (dipakai cache snapshot, misalnya LedgerAnalytics)
+        self.generation = 0
+        
+        # MONTH-PARTITIONED STORAGE (lihat ensure_loaded)
+        # _partitions: {month: {"ids": [min, max], "max_expense": float}}
+        # untuk setiap file bulan di disk; None jika tidak memakai partitioned storage.
+        # _loaded_months juga dipakai storage backend (bulan dimuat dari SQLite)
+        self.partition_dir = os.path.splitext(data_file)[0] + "_partitions"
+        self._partitions: Optional[Dict[str, Dict]] = {} if partitioned else None
+        self._loaded_months: set = set()
+        self._dirty_months: set = set()
         
         # Month tracking untuk monthly reset
         self.current_month = datetime.now().strftime("%Y-%m")
-        self.monthly_history = {}  # Store monthly stats: {month: {income, expense}}
         
         # Load existing data
         self.load_from_file()
+        
+        # BACKGROUND PERSISTENCE (dimulai setelah load)
+        self.persistence_worker: Optional[PersistenceWorker] = (
+            PersistenceWorker(self, save_debounce)
+            if background_save and storage is None else None
+        )
     
     # ==================== MONTHLY RESET CHECK ====================
     
+    @_synchronized
     def check_and_reset_monthly(self) -> bool:
         """
         Check apakah bulan sudah berubah, jika iya, simpan stats bulan lalu dan reset
@@ -76,6 +195,9 @@ class FinanceManager:
           riwayat (history), sehingga pengguna tetap dapat melihat laporan cashflow bulan-bulan 
           sebelumnya kapan saja
         
+        Karena total per bulan sudah dimaterialisasi di monthly_stats, "reset" cukup
+        memindahkan current_month; total bulan lalu otomatis menjadi history.
+        
         Time Complexity: O(1)
         
         Returns:
@@ -84,25 +206,17 @@ class FinanceManager:
         new_month = datetime.now().strftime("%Y-%m")
         
         if new_month != self.current_month:
-            # Save stats dari bulan lalu ke history
-            self.monthly_history[self.current_month] = {
-                "income": self.total_income,
-                "expense": self.total_expense,
-                "balance": self.total_income - self.total_expense
-            }
-            
-            # Reset untuk bulan baru
-            self.total_income = 0.0
-            self.total_expense = 0.0
             self.current_month = new_month
-            
+            self._log_mutation({"op": "month", "current_month": self.current_month})
             return True
         
         return False
     
     def get_monthly_history(self, month: str = None) -> Dict:
         """
-        Get statistik untuk bulan tertentu dari history
+        Get statistik untuk bulan tertentu dari materialized monthly view
+        
+        Time Complexity: O(1)
         
         Args:
             month: Bulan dalam format YYYY-MM (default: bulan sebelumnya)
@@ -116,23 +230,54 @@ class FinanceManager:
             last_month_date = datetime.now() - timedelta(days=30)
             month = last_month_date.strftime("%Y-%m")
         
-        return self.monthly_history.get(month, {
-            "income": 0.0,
-            "expense": 0.0,
-            "balance": 0.0
-        })
+        stats = self.monthly_stats.get(month)
+        if stats is None:
+            return {"income": 0.0, "expense": 0.0, "balance": 0.0}
+        return {
+            "income": stats["income"],
+            "expense": stats["expense"],
+            "balance": stats["income"] - stats["expense"]
+        }
+    
+    @property
+    def monthly_history(self) -> Dict[str, Dict[str, float]]:
+        """
+        Riwayat bulan-bulan selain bulan berjalan: {month: {income, expense, balance}}
+        
+        Time Complexity: O(m) dimana m adalah jumlah bulan (tanpa scan transaksi)
+        """
+        return {
+            month: self.get_monthly_history(month)
+            for month in self.monthly_stats
+            if month != self.current_month
+        }
+    
+    @property
+    def total_income(self) -> float:
+        """Total pemasukan bulan berjalan"""
+        stats = self.monthly_stats.get(self.current_month)
+        return stats["income"] if stats else 0.0
+    
+    @property
+    def total_expense(self) -> float:
+        """Total pengeluaran bulan berjalan"""
+        stats = self.monthly_stats.get(self.current_month)
+        return stats["expense"] if stats else 0.0
     
     # ==================== DLL OPERATIONS ====================
     
+    @_synchronized
     def insert_at_head(self, date: str, title: str, amount: float, 
                        trans_type: str, category: str, 
                        is_recurring: bool = False, 
-                       recurrence_type: Optional[str] = None) -> TransactionNode:
+                       recurrence_type: Optional[str] = None,
+                       trans_id: Optional[int] = None) -> TransactionNode:
         """
         Memasukkan transaksi baru di awal Doubly Linked List (DLL)
         Sehingga memastikan transaksi terbaru muncul di urutan pertama.
         
-        Time Complexity: O(1) + O(1) if recurring transaction
+        Time Complexity: O(1) + O(1) if recurring transaction,
+                         O(d) untuk date index jika tanggalnya belum ada
         
         Args:
             date: Transaction date (YYYY-MM-DD)
@@ -142,14 +287,28 @@ class FinanceManager:
             category: Transaction category
             is_recurring: Whether this is a recurring transaction
             recurrence_type: "monthly" or "weekly" if is_recurring=True
+            trans_id: ID yang sudah ada (saat load/replay), default: ID baru
         
         Returns:
             The newly created TransactionNode
+        
+        Raises:
+            ValueError: Jika recurrence_type bukan "weekly" atau "monthly"
         """
-        self.transaction_count += 1
+        if (is_recurring and recurrence_type and
+                recurrence_type not in RecurringTransactionQueue.RECURRENCE_TYPES):
+            raise ValueError(f"recurrence_type tidak didukung: {recurrence_type!r}")
+        if trans_id is None:
+            self.transaction_count += 1
+            trans_id = self.transaction_count
+        else:
+            self.transaction_count = max(self.transaction_count, trans_id)
         new_node = TransactionNode(date, title, amount, trans_type, 
-                                   category, self.transaction_count,
+                                   category, trans_id,
                                    is_recurring, recurrence_type)
+        self.id_index[trans_id] = new_node
+        self.date_index.add(new_node)
+        self.category_index.add(new_node)
         
         if not self.head:  # Empty list
             self.head = self.tail = new_node
@@ -159,30 +318,25 @@ class FinanceManager:
             self.head.prev = new_node
             self.head = new_node
         
-        # Update statistics
-        if trans_type == "Income":
-            self.total_income += amount
-        else:
-            self.total_expense += amount
-            # INSERT INTO MAX-HEAP
-            self.expense_heap.insert(amount, new_node)
-            # UPDATE BUDGET BST
-            month_key = date[:7]  # Extract YYYY-MM from date
-            budget_node = self.budget_bst.search(month_key)
-            if budget_node:
-                budget_node.spent += amount
+        # Update statistics + INSERT INTO MAX-HEAP
+        self._apply_stats(new_node, 1)
+        self._sync_heap(new_node)
+        self._record_undo(("insert", new_node))
         
         # Schedule recurring transaction if applicable
-        if is_recurring and recurrence_type:
+        # (saat load/replay, penjadwalan dilakukan sekali di akhir load_from_file)
+        if is_recurring and recurrence_type and not self._replaying:
             self.recurring_queue.schedule_recurring_transaction(new_node, date)
         
+        self._log_mutation({"op": "insert", "txn": new_node.to_dict()})
         return new_node
     
+    @_synchronized
     def delete_node(self, node: TransactionNode) -> bool:
         """
         Menghaous node dari Doubly Linked List (DLL)
         
-        Time Complexity: O(1) for deletion + O(n) for heap rebuild if expense
+        Time Complexity: O(1) for deletion + O(log n) heap removal if expense
         
         Args:
             node: The node to delete
@@ -190,37 +344,32 @@ class FinanceManager:
         Returns:
             True if deletion was successful
         """
-        if not node:
+        # Node yang sudah tidak ada di index (misalnya sudah dihapus) diabaikan
+        if not node or self.id_index.get(node.trans_id) is not node:
             return False
         
+        # Penyimpanan lazy: muat bulan node dulu (misalnya template recurring dari
+        # bulan tutup), agar barisnya tidak ikut dimuat ulang setelah dihapus
+        self._load_months((node.date[:7],))
+        
         # Update statistics
-        if node.trans_type == "Income":
-            self.total_income -= node.amount
-        else:
-            self.total_expense -= node.amount
-            # UPDATE BUDGET BST
-            month_key = node.date[:7]  # Extract YYYY-MM from date
-            budget_node = self.budget_bst.search(month_key)
-            if budget_node:
-                budget_node.spent -= node.amount
+        self._apply_stats(node, -1)
+        self._record_undo(("delete", node, node.prev, node.next))
         
         # Handle DLL pointers
-        if node.prev:
-            node.prev.next = node.next
-        else:  # node is head
-            self.head = node.next
+        self._unlink(node)
+        self.id_index.pop(node.trans_id, None)
+        self.date_index.remove(node)
+        self.category_index.remove(node)
+        self.recurring_cursor.pop(node.trans_id, None)
         
-        if node.next:
-            node.next.prev = node.prev
-        else:  # node is tail
-            self.tail = node.prev
-        
-        # Rebuild heap if expense was deleted
-        if node.trans_type == "Expense":
-            self.expense_heap.rebuild_from_dll(self.head)
+        # Remove dari heap berdasarkan posisinya (tanpa rebuild)
+        self._sync_heap(node)
         
+        self._log_mutation({"op": "delete", "id": node.trans_id})
         return True
     
+    @_synchronized
     def update_node(self, node: TransactionNode, date: str = None, 
                    title: str = None, amount: float = None, 
                    trans_type: str = None, category: str = None) -> bool:
@@ -228,7 +377,10 @@ class FinanceManager:
         Update node di DLL tanpa delete-insert (in-place update)
         Cocok untuk demo: menunjukkan operasi update pada DLL
         
-        Time Complexity: O(1) + O(n) if expense amount changed (heap rebuild)
+        Statistik dikoreksi dengan mengurangi kontribusi lama lalu menambahkan
+        kontribusi baru, sehingga perubahan amount, tipe dan bulan ikut tertangani.
+        
+        Time Complexity: O(1) + O(log n) if expense amount/type changed (heap sift)
         
         Args:
             node: The node to update
@@ -241,134 +393,406 @@ class FinanceManager:
         Returns:
             True if update was successful
         """
-        if not node:
+        if not node or self.id_index.get(node.trans_id) is not node:
             return False
         
-        old_amount = node.amount
-        old_type = node.trans_type
+        self._record_undo(("update", node, (node.date, node.title, node.amount,
+                                            node.trans_type, node.category)))
+        self._apply_stats(node, -1)
+        old_date, old_category = node.date, node.category
         
         # Update fields (hanya yang disediakan)
         if date is not None:
-            node.date = date
+            node.date = intern(date)
         if title is not None:
             node.title = title
         if category is not None:
-            node.category = category
+            node.category = intern(category)
         if trans_type is not None:
-            node.trans_type = trans_type
+            node.trans_type = intern(trans_type)
+        if amount is not None:
+            node.amount = amount
+        
+        self._apply_stats(node, 1)
+        self.date_index.move(node, old_date)
+        self.category_index.move(node, old_category)
+        
+        # Sesuaikan MAX-HEAP: update key, remove, atau insert
+        self._sync_heap(node)
         
-        # Handle amount change (update statistics)
-        if amount is not None and amount != old_amount:
-            # Adjust old statistics
-            if old_type == "Income":
-                self.total_income -= old_amount
+        self._log_mutation({"op": "update", "txn": node.to_dict()})
+        return True
+    
+    def _apply_stats(self, node: TransactionNode, sign: int, update_daily: bool = True):
+        """
+        Tambah (sign=1) atau kurangi (sign=-1) kontribusi node ke
+        materialized monthly view (bulan dari tanggal transaksi)
+        dan ke Fenwick Tree total harian serta total kategori, dan menaikkan
+        generation counter
+        
+        Time Complexity: O(1) + O(log d) untuk Fenwick Tree
+        
+        Args:
+            node: Transaction node
+            sign: 1 untuk menambah, -1 untuk mengurangi
+            update_daily: False jika total harian di-update secara bulk oleh pemanggil
+        """
+        self.generation += 1
+        month_key = node.date[:7]  # Extract YYYY-MM from date
+        if self._partitions is not None and not self._replaying:
+            self._dirty_months.add(month_key)
+        stats = self.monthly_stats.get(month_key)
+        if stats is None:
+            stats = self.monthly_stats[month_key] = {
+                "income": 0.0, "expense": 0.0, "count": 0, "by_category": {}
+            }
+        category_stats = stats["by_category"].get(node.category)
+        if category_stats is None:
+            category_stats = stats["by_category"][node.category] = {
+                "income": 0.0, "expense": 0.0, "count": 0
+            }
+        
+        key = "income" if node.trans_type == "Income" else "expense"
+        amount = node.amount * sign
+        stats[key] += amount
+        stats["count"] += sign
+        category_stats[key] += amount
+        category_stats["count"] += sign
+        self.category_index.apply(node.category, key, amount, sign)
+        
+        if update_daily:
+            if self._batch is not None:
+                # Ditunda sampai commit, delta per hari digabung
+                pending = self._batch["daily"]
+                day_key = (node.date, node.trans_type)
+                pending[day_key] = pending.get(day_key, 0.0) + amount
             else:
-                self.total_expense -= old_amount
-                # Adjust budget for old amount
-                month_key = node.date[:7]
-                budget_node = self.budget_bst.search(month_key)
-                if budget_node:
-                    budget_node.spent -= old_amount
-            
-            # Add new statistics
-            if trans_type == "Income" or (trans_type is None and old_type == "Income"):
-                self.total_income += amount
+                self.daily_totals.add(node.date, node.trans_type, amount)
+        
+        # Bersihkan entry kosong agar history tidak menampilkan bulan tanpa transaksi
+        if category_stats["count"] == 0:
+            del stats["by_category"][node.category]
+        if stats["count"] == 0:
+            del self.monthly_stats[month_key]
+    
+    def _unlink(self, node: TransactionNode):
+        """Lepas node dari DLL (pointer node sendiri tidak diubah)"""
+        if node.prev:
+            node.prev.next = node.next
+        else:  # node is head
+            self.head = node.next
+        
+        if node.next:
+            node.next.prev = node.prev
+        else:  # node is tail
+            self.tail = node.prev
+    
+    def _sync_heap(self, node: TransactionNode):
+        """
+        Samakan keberadaan/key node di MAX-HEAP dengan state node saat ini:
+        update key, remove, atau insert. Di dalam batch() hanya dicatat dan
+        diperbaiki sekali saat commit.
+        
+        Time Complexity: O(log n)
+        """
+        if self._batch is not None:
+            self._batch["heap"][node.trans_id] = node
+            return
+        
+        wanted = (node.trans_type == "Expense" and
+                  self.id_index.get(node.trans_id) is node)
+        if self.expense_heap.contains(node):
+            if wanted:
+                self.expense_heap.update(node, node.amount)
             else:
-                self.total_expense += amount
-                # Adjust budget for new amount
-                month_key = node.date[:7]
-                budget_node = self.budget_bst.search(month_key)
-                if budget_node:
-                    budget_node.spent += amount
-            
-            # Update amount
-            node.amount = amount
-            
-            # Rebuild heap if expense amount changed
-            if (old_type == "Expense" or 
-                (trans_type == "Expense" and trans_type is not None)):
-                self.expense_heap.rebuild_from_dll(self.head)
-        
-        # Handle date change (update budget if date month changed)
-        if date is not None and date != node.date:
-            old_month = node.date[:7]
-            new_month = date[:7]
-            if old_month != new_month and node.trans_type == "Expense":
-                # Remove from old month budget
-                old_budget = self.budget_bst.search(old_month)
-                if old_budget:
-                    old_budget.spent -= node.amount
-                # Add to new month budget
-                new_budget = self.budget_bst.search(new_month)
-                if new_budget:
-                    new_budget.spent += node.amount
+                self.expense_heap.remove(node)
+        elif wanted:
+            self.expense_heap.insert(node.amount, node)
+    
+    @_synchronized
+    def set_budget(self, month: str, budget_limit: float):
+        """
+        Atur budget untuk bulan tertentu (insert/update di BudgetBST)
         
-        return True
+        Args:
+            month: Bulan dalam format YYYY-MM
+            budget_limit: Budget amount untuk bulan tersebut
+        
+        Returns:
+            The BudgetNode (baru atau existing)
+        """
+        if self._batch is not None:
+            previous = self.budget_bst.search(month)
+            self._record_undo(("budget", month, previous.budget_limit if previous else None))
+        budget_node = self.budget_bst.insert(month, budget_limit)
+        self._log_mutation({"op": "budget", "month": month, "limit": budget_limit})
+        return self._sync_budget_spent(budget_node)
     
-    def export_to_csv(self, filename: str = "transactions_export.csv") -> bool:
+    def get_budget(self, month: str):
         """
-        Export semua transaksi ke file CSV dengan traversal DLL
-        Good for demo: menunjukkan traversal DLL ke professor
+        Cari budget untuk bulan tertentu dengan spent yang diambil dari
+        materialized monthly view
+        
+        Time Complexity: O(log m) dimana m adalah jumlah budget
+        
+        Args:
+            month: Bulan dalam format YYYY-MM
+        
+        Returns:
+            BudgetNode or None
+        """
+        return self._sync_budget_spent(self.budget_bst.search(month))
+    
+    def get_budgets_in_range(self, start_month: str, end_month: str) -> list:
+        """
+        Get budgets dalam range bulan dengan spent yang sudah tersinkron
+        
+        Time Complexity: O(k + log m) dimana k adalah jumlah hasil
+        """
+        return [self._sync_budget_spent(budget)
+                for budget in self.budget_bst.get_budgets_in_range(start_month, end_month)]
+    
+    def _sync_budget_spent(self, budget_node):
+        """Set spent budget dari total expense bulan tersebut (O(1))"""
+        if budget_node is not None:
+            stats = self.monthly_stats.get(budget_node.month)
+            budget_node.spent = stats["expense"] if stats else 0.0
+        return budget_node
+    
+    EXPORT_HEADER = ['ID', 'Date', 'Title', 'Amount', 'Type', 'Category',
+                     'Recurring', 'Recurrence Type']
+    
+    def export_to_csv(self, filename: str = "transactions_export.csv",
+                      start_date: Optional[str] = None, end_date: Optional[str] = None,
+                      trans_type: Optional[str] = None, category: Optional[str] = None,
+                      fmt: Optional[str] = None, chunk_size: int = 1000) -> bool:
+        """
+        Export transaksi ke file CSV atau JSON Lines secara streaming
+        
+        Baris ditulis langsung dari date index (urutan tanggal) dalam chunk
+        berukuran chunk_size, tanpa membangun list seluruh ledger. Dengan storage backend, baris di-stream dari
+        cursor SQL dan filter dijalankan sebagai indexed query.
         
         Time Complexity: O(n) dimana n adalah jumlah transaksi
         
         Args:
-            filename: Output CSV filename
+            filename: Output filename
+            start_date: Filter tanggal awal YYYY-MM-DD (inklusif, opsional)
+            end_date: Filter tanggal akhir YYYY-MM-DD (inklusif, opsional)
+            trans_type: Filter "Income" atau "Expense" (opsional)
+            category: Filter kategori (opsional)
+            fmt: "csv" atau "jsonl" (default: dari ekstensi filename)
+            chunk_size: Jumlah baris per penulisan
         
         Returns:
             True if export was successful
         """
+        if fmt is None:
+            fmt = "jsonl" if filename.endswith((".jsonl", ".ndjson")) else "csv"
         try:
-            current = self.head
-            transactions = []
-            
-            # Traverse DLL dan collect data
-            while current:
-                transactions.append({
-                    'ID': current.trans_id,
-                    'Date': current.date,
-                    'Title': current.title,
-                    'Amount': current.amount,
-                    'Type': current.trans_type,
-                    'Category': current.category,
-                    'Recurring': 'Yes' if current.is_recurring else 'No',
-                    'Recurrence Type': current.recurrence_type or '-'
-                })
-                current = current.next
-            
-            # Reverse to maintain chronological order
-            transactions.reverse()
-            
-            # Write to CSV
-            if transactions:
-                with open(filename, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=[
-                        'ID', 'Date', 'Title', 'Amount', 'Type', 'Category', 
-                        'Recurring', 'Recurrence Type'
-                    ])
-                    writer.writeheader()
-                    writer.writerows(transactions)
-                
-                return True
+            if self.storage is not None:
+                rows = self.storage.iter_rows(start_date, end_date, trans_type, category)
             else:
-                # Create empty CSV if no transactions
-                with open(filename, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=[
-                        'ID', 'Date', 'Title', 'Amount', 'Type', 'Category', 
-                        'Recurring', 'Recurrence Type'
-                    ])
-                    writer.writeheader()
-                
-                return True
+                rows = ((node.trans_id, node.date, node.title, node.amount, node.trans_type,
+                         node.category, node.is_recurring, node.recurrence_type)
+                        for node in self.iter_transactions(start_date, end_date,
+                                                           trans_type, category))
+            
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 16) as f:
+                if fmt == "jsonl":
+                    self._write_jsonl(f, rows, chunk_size)
+                else:
+                    self._write_csv(f, rows, chunk_size)
+            return True
         except Exception as e:
             print(f"Error exporting to CSV: {e}")
             return False
     
+    def _write_csv(self, f, rows: Iterator[tuple], chunk_size: int):
+        """Tulis baris export sebagai CSV per chunk"""
+        writer = csv.writer(f)
+        writer.writerow(self.EXPORT_HEADER)
+        chunk = []
+        for (trans_id, date, title, amount, trans_type, category,
+             is_recurring, recurrence_type) in rows:
+            chunk.append((trans_id, date, title, amount, trans_type, category,
+                          'Yes' if is_recurring else 'No', recurrence_type or '-'))
+            if len(chunk) >= chunk_size:
+                writer.writerows(chunk)
+                chunk.clear()
+        writer.writerows(chunk)
+    
+    @staticmethod
+    def _write_jsonl(f, rows: Iterator[tuple], chunk_size: int):
+        """Tulis baris export sebagai JSON Lines (format to_dict) per chunk"""
+        dumps = json.dumps
+        chunk = []
+        for (trans_id, date, title, amount, trans_type, category,
+             is_recurring, recurrence_type) in rows:
+            chunk.append(dumps({
+                "id": trans_id,
+                "date": date,
+                "title": title,
+                "amount": amount,
+                "type": trans_type,
+                "category": category,
+                "is_recurring": bool(is_recurring),
+                "recurrence_type": recurrence_type
+            }, ensure_ascii=False))
+            if len(chunk) >= chunk_size:
+                f.write("\n".join(chunk))
+                f.write("\n")
+                chunk.clear()
+        if chunk:
+            f.write("\n".join(chunk))
+            f.write("\n")
+    
+    def iter_transactions(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                          trans_type: Optional[str] = None,
+                          category: Optional[str] = None) -> Iterator[TransactionNode]:
+        """
+        Iterasi transaksi terurut tanggal (terlama dulu) dengan filter opsional
+        
+        Range tanggal dibaca langsung dari date index, tanpa traversal seluruh
+        DLL. Jika monthly view menunjukkan tidak ada transaksi yang cocok dengan
+        filter kategori/periode, iterasi dilewati sama sekali.
+        
+        Time Complexity: O(log d + k) untuk k transaksi dalam range,
+                         O(m) jika tidak ada yang cocok (m = jumlah bulan)
+        
+        Args:
+            start_date: Tanggal awal YYYY-MM-DD (inklusif, opsional)
+            end_date: Tanggal akhir YYYY-MM-DD (inklusif, opsional)
+            trans_type: "Income" atau "Expense" (opsional)
+            category: Kategori (opsional)
+        
+        Yields:
+            TransactionNode yang cocok dengan semua filter
+        """
+        start_month = start_date[:7] if start_date else ""
+        end_month = end_date[:7] if end_date else "9999-99"
+        if not any(start_month <= month <= end_month and
+                   (category is None or category in stats["by_category"])
+                   for month, stats in self.monthly_stats.items()):
+            return
+        self.ensure_loaded(start_date[:7] if start_date else None,
+                           end_date[:7] if end_date else None)
+        
+        for node in self.date_index.iter_nodes(start_date or None, end_date or None,
+                                               newest_first=False):
+            if ((trans_type is None or node.trans_type == trans_type) and
+                    (category is None or node.category == category)):
+                yield node
+    
+    CSV_COLUMN_MAPPING = {
+        "date": "Date",
+        "title": "Title",
+        "amount": "Amount",
+        "type": "Type",
+        "category": "Category",
+    }
+    INCOME_TYPE_VALUES = {"income", "pemasukan", "masuk", "kredit", "credit", "cr"}
+    
+    @_synchronized
+    def import_from_csv(self, filename: str, column_mapping: Optional[Dict[str, str]] = None,
+                        chunk_size: int = 5000, date_format: str = "%Y-%m-%d",
+                        default_category: str = "Lainnya",
+                        delimiter: str = ",") -> Dict[str, float]:
+        """
+        Import transaksi dari CSV secara streaming dalam chunk
+        
+        File dibaca baris per baris; setiap chunk_size baris di-insert lewat
+        bulk_insert (satu heap fix-up dan satu update Fenwick Tree per chunk)
+        lalu di-persist sekali. Memori tambahan dibatasi ukuran chunk, tidak
+        bergantung pada ukuran file. Jumlah dibaca dengan format Indonesia
+        (CurrencyHelper.parse_amount), kecuali file hasil export_to_csv (header
+        EXPORT_HEADER) yang menulis jumlah sebagai float biasa. Jika kolom type tidak ada/kosong, tanda
+        jumlah menentukan tipe (negatif = Expense). Baris yang tidak valid dilewati.
+        
+        Time Complexity: O(r log n) dimana r adalah jumlah baris CSV
+        
+        Args:
+            filename: Path file CSV
+            column_mapping: Field -> nama kolom CSV untuk date, title, amount,
+                            type dan category (default: header export_to_csv)
+            chunk_size: Jumlah baris per chunk
+            date_format: Format tanggal di CSV (strptime)
+            default_category: Kategori jika kolom category tidak ada/kosong
+            delimiter: Pemisah kolom CSV
+        
+        Returns:
+            Dictionary dengan rows, skipped, seconds dan rows_per_sec
+        """
+        mapping = dict(self.CSV_COLUMN_MAPPING)
+        mapping.update(column_mapping or {})
+        date_col, title_col, amount_col = mapping["date"], mapping["title"], mapping["amount"]
+        type_col, category_col = mapping.get("type"), mapping.get("category")
+        iso_dates = date_format == "%Y-%m-%d"
+        
+        start = time.perf_counter()
+        imported = skipped = 0
+        chunk: List[dict] = []
+        
+        def flush():
+            nonlocal imported
+            if chunk:
+                # Urutkan per tanggal agar transaksi terbaru berada di dekat head
+                chunk.sort(key=lambda trans: trans["date"])
+                self.bulk_insert(chunk)
+                self.persist()
+                imported += len(chunk)
+                chunk.clear()
+        
+        with open(filename, newline='', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f, delimiter=delimiter)
+            # File export sendiri: jumlah ditulis sebagai float ("50000.0")
+            parse_amount = (float if reader.fieldnames == self.EXPORT_HEADER
+                            else CurrencyHelper.parse_amount)
+            for row in reader:
+                try:
+                    raw_date = row[date_col].strip()
+                    if iso_dates:
+                        trans_date = date_cls.fromisoformat(raw_date).isoformat()
+                    else:
+                        trans_date = datetime.strptime(raw_date, date_format).strftime("%Y-%m-%d")
+                    amount = parse_amount(row[amount_col])
+                    raw_type = (row.get(type_col) or "").strip().lower() if type_col else ""
+                except (KeyError, ValueError, AttributeError):
+                    skipped += 1
+                    continue
+                
+                if raw_type:
+                    trans_type = "Income" if raw_type in self.INCOME_TYPE_VALUES else "Expense"
+                else:
+                    trans_type = "Expense" if amount < 0 else "Income"
+                chunk.append({
+                    "date": trans_date,
+                    "title": (row.get(title_col) or "").strip() or "-",
+                    "amount": abs(amount),
+                    "type": trans_type,
+                    "category": ((row.get(category_col) or "").strip() if category_col else "")
+                                or default_category,
+                    "is_recurring": False,
+                    "recurrence_type": None
+                })
+                if len(chunk) >= chunk_size:
+                    flush()
+            flush()
+        
+        seconds = time.perf_counter() - start
+        return {
+            "rows": imported,
+            "skipped": skipped,
+            "seconds": seconds,
+            "rows_per_sec": imported / seconds if seconds > 0 else 0.0
+        }
+    
     def find_node_by_id(self, trans_id: int) -> Optional[TransactionNode]:
         """
-        Menelusuri DLL untuk menemukan node berdasarkan ID
+        Mencari node berdasarkan ID lewat Hash Map index (id_index)
+        tanpa menelusuri DLL
         
-        Time Complexity: O(n)
+        Time Complexity: O(1), atau O(log n + k) jika bulannya belum dimuat
         
         Args:
             trans_id: Transaction ID to find
@@ -376,12 +800,23 @@ class FinanceManager:
         Returns:
             TransactionNode if found, None otherwise
         """
-        current = self.head
-        while current:
-            if current.trans_id == trans_id:
-                return current
-            current = current.next
-        return None
+        node = self.id_index.get(trans_id)
+        if node is None and self.storage is not None:
+            # Storage backend: bulan transaksi dicari lewat primary key
+            month = self.storage.month_of(trans_id)
+            if month is not None and month not in self._loaded_months:
+                self._load_months((month,))
+                node = self.id_index.get(trans_id)
+        elif node is None and self._partitions is not None:
+            # Partitioned storage: muat bulan yang range ID-nya memuat trans_id
+            for month, meta in sorted(self._partitions.items(), reverse=True):
+                low, high = meta["ids"]
+                if low <= trans_id <= high and month not in self._loaded_months:
+                    self._load_months((month,))
+                    node = self.id_index.get(trans_id)
+                    if node is not None:
+                        break
+        return node
     
     def get_all_transactions(self) -> List[TransactionNode]:
         """
@@ -392,6 +827,7 @@ class FinanceManager:
         Returns:
             List of all TransactionNodes
         """
+        self.ensure_loaded()
         transactions = []
         current = self.head
         while current:
@@ -401,36 +837,30 @@ class FinanceManager:
     
     # ==================== HASH MAP ====================
     
-    def group_by_date(self) -> Dict[str, List[TransactionNode]]:
+    def group_by_date(self, start_date: Optional[str] = None,
+                      end_date: Optional[str] = None) -> Mapping[str, List[TransactionNode]]:
         """
-        Mengelompokkan transaksi berdasarkan tanggal menggunakan Hash Map (Dictionary)
+        Mengelompokkan transaksi berdasarkan tanggal
         
-        Menunjukkan struktur data Hash Map di mana:
-        - Key: Date string (contoh, "2024-12-05")
-        - Value: List of TransactionNode objects for that date
+        Mengembalikan view terurut di atas date index (tanpa membangun dictionary
+        baru dan tanpa sort):
+        - Key: Date string (contoh, "2024-12-05"), dari tanggal terbaru
+        - Value: List of TransactionNode pada tanggal tersebut, dari ID terbesar
         
-        Time Complexity: O(n) dimana n adalah jumlah total transaksi
-        Space Complexity: O(n)
+        View selalu mencerminkan isi ledger saat ini.
         
-        Returns:
-            Dictionary mapping dates to lists of transactions
-        """
-        date_map: Dict[str, List[TransactionNode]] = {}
+        Time Complexity: O(log d) untuk membuat view, O(1) lookup per tanggal
         
-        # Menelusuri DLLnya
-        current = self.head
-        while current:
-            date_key = current.date
-            
-            # Hash Map operation: check if key exists
-            if date_key not in date_map:
-                date_map[date_key] = []
-            
-            # Hash Map operation: append to value list
-            date_map[date_key].append(current)
-            current = current.next
+        Args:
+            start_date: Batas bawah tanggal YYYY-MM-DD (inklusif, opsional)
+            end_date: Batas atas tanggal YYYY-MM-DD (inklusif, opsional)
         
-        return date_map
+        Returns:
+            Mapping read-only dari tanggal ke list transaksi
+        """
+        self.ensure_loaded(start_date[:7] if start_date else None,
+                           end_date[:7] if end_date else None)
+        return DateGroupsView(self.date_index, start_date or None, end_date or None)
     
     # ==================== HEAP ====================
     
@@ -443,8 +873,64 @@ class FinanceManager:
         Returns:
             TransactionNode with highest expense, or None if no expenses
         """
+        if self._partitions is not None:
+            # Partitioned storage: cukup muat satu bulan tutup dengan max_expense
+            # terbesar (dari manifest) jika bisa mengalahkan maksimum yang sudah dimuat
+            highest = self.expense_heap.get_max()
+            unloaded = [(meta["max_expense"], month) for month, meta in self._partitions.items()
+                        if month not in self._loaded_months]
+            if unloaded:
+                max_expense, month = max(unloaded)
+                if max_expense > (highest.amount if highest else 0.0):
+                    self._load_months((month,))
+        elif self.storage is not None and not self._loaded_months.issuperset(self.monthly_stats):
+            # Storage backend: bulan pengeluaran terbesar dari index (type, amount)
+            month = self.storage.highest_expense_month()
+            if month is not None:
+                self._load_months((month,))
         return self.expense_heap.get_max()
     
+    def get_top_expenses(self, k: int = 10, month: Optional[str] = None,
+                         category: Optional[str] = None) -> List[TransactionNode]:
+        """
+        Mendapatkan k pengeluaran tertinggi (non-destruktif)
+        
+        Tanpa filter, hasil diambil dari Max-Heap. Dengan filter, kandidat
+        diambil dari date index (bulan) atau category index (kategori) lalu
+        dipilih dengan heapq.nlargest, sehingga biaya query tidak bergantung
+        pada ukuran heap.
+        
+        Time Complexity: O(k log k) tanpa filter; O(log d + m log k) dengan
+        filter, m = jumlah transaksi bulan/kategori tersebut
+        
+        Args:
+            k: Jumlah pengeluaran yang diambil
+            month: Filter bulan YYYY-MM (opsional)
+            category: Filter kategori (opsional)
+        
+        Returns:
+            List of TransactionNode, terurut dari amount terbesar
+        """
+        if month is None and category is None:
+            self.ensure_loaded()
+            return self.expense_heap.top_k(k)
+        if k <= 0:
+            return []
+        
+        start_date = end_date = None
+        if month is not None:
+            start_date, end_date = f"{month}-01", f"{month}-31"
+        if category is not None:
+            candidates = self.transactions_in_category(category, start_date, end_date)
+        else:
+            self.ensure_loaded(month, month)
+            candidates = self.date_index.iter_nodes(start_date, end_date)
+        return heapq.nlargest(
+            k,
+            (node for node in candidates if node.trans_type == "Expense"),
+            key=lambda node: node.amount
+        )
+    
     # ==================== STATISTIK ====================
     
     def get_balance(self) -> float:
@@ -456,28 +942,587 @@ class FinanceManager:
         """
         return self.total_income - self.total_expense
     
-    def get_stats(self) -> Dict[str, float]:
+    def get_stats(self, start_date: Optional[str] = None,
+                  end_date: Optional[str] = None) -> Dict[str, float]:
         """
         Get semua statistik keuangan
         
+        Tanpa argumen: statistik bulan berjalan. Dengan start_date/end_date:
+        statistik untuk periode tersebut dari Fenwick Tree total harian.
+        
+        Args:
+            start_date: Tanggal awal YYYY-MM-DD (opsional)
+            end_date: Tanggal akhir YYYY-MM-DD (opsional)
+        
         Returns:
             Dictionary with balance, income, expense, and highest_expense
         """
         highest = self.get_highest_expense()
+        if start_date is None and end_date is None:
+            income, expense = self.total_income, self.total_expense
+        else:
+            totals = self.range_totals(start_date or "0001-01-01", end_date or "9999-12-31")
+            income, expense = totals["income"], totals["expense"]
         return {
-            "balance": self.get_balance(),
-            "total_income": self.total_income,
-            "total_expense": self.total_expense,
+            "balance": income - expense,
+            "total_income": income,
+            "total_expense": expense,
             "highest_expense": highest.amount if highest else 0.0
         }
     
+    def range_totals(self, start_date: str, end_date: str) -> Dict[str, float]:
+        """
+        Total pemasukan dan pengeluaran untuk range tanggal apa pun
+        (misalnya 2025-03-03 s/d 2025-04-17) tanpa menelusuri DLL
+        
+        Time Complexity: O(log d) dimana d adalah jumlah hari dalam ledger
+        
+        Args:
+            start_date: Tanggal awal YYYY-MM-DD (inklusif)
+            end_date: Tanggal akhir YYYY-MM-DD (inklusif)
+        
+        Returns:
+            Dictionary dengan income, expense, balance
+        """
+        self.ensure_loaded(start_date[:7], end_date[:7])
+        return self.daily_totals.range_totals(start_date, end_date)
+    
+    # ==================== CATEGORY INDEX ====================
+    
+    def get_category_totals(self, category: str, month: Optional[str] = None) -> Dict[str, float]:
+        """
+        Total pemasukan dan pengeluaran satu kategori tanpa scan DLL
+        
+        Total per bulan dibaca dari monthly stats (by_category), total semua
+        bulan dari category index.
+        
+        Time Complexity: O(1)
+        
+        Args:
+            category: Kategori (field "Catatan")
+            month: Bulan YYYY-MM (opsional, default: semua bulan)
+        
+        Returns:
+            Dictionary dengan income, expense, balance, count
+        """
+        if month is None:
+            totals = self.category_index.get_totals(category)
+        else:
+            category_stats = self.monthly_stats.get(month, {}).get("by_category", {}).get(category)
+            totals = (dict(category_stats) if category_stats is not None
+                      else {"income": 0.0, "expense": 0.0, "count": 0})
+        totals["balance"] = totals["income"] - totals["expense"]
+        return totals
+    
+    def transactions_in_category(self, category: str, start_date: Optional[str] = None,
+                                 end_date: Optional[str] = None) -> List[TransactionNode]:
+        """
+        Transaksi satu kategori dalam range tanggal, dari yang terbaru
+        
+        Sumber kandidat dipilih dari jumlah transaksi di monthly stats: jika
+        range tanggal memuat lebih sedikit transaksi daripada kategori, date
+        index di-scan per range dan difilter per kategori; selain itu ID
+        kategori di-resolve lewat id_index, difilter per tanggal lalu di-sort.
+        Dengan partitioned storage, hanya bulan yang dibutuhkan yang dimuat.
+        
+        Time Complexity: O(m + min(r, c log c)), m = jumlah bulan, r = jumlah
+        transaksi dalam range, c = jumlah transaksi kategori
+        
+        Args:
+            category: Kategori (field "Catatan")
+            start_date: Tanggal awal YYYY-MM-DD (inklusif, opsional)
+            end_date: Tanggal akhir YYYY-MM-DD (inklusif, opsional)
+        
+        Returns:
+            List of TransactionNode, terurut dari tanggal terbaru
+        """
+        start_date, end_date = start_date or None, end_date or None
+        start_month = start_date[:7] if start_date else ""
+        end_month = end_date[:7] if end_date else "9999-99"
+        months = [month for month in self.monthly_stats if start_month <= month <= end_month]
+        in_range = sum(self.monthly_stats[month]["count"] for month in months)
+        
+        if in_range < self.category_index.get_totals(category)["count"]:
+            # Range tanggal sempit: scan date index lebih murah daripada sort ID kategori
+            self._load_months(months)
+            return [node for node in self.date_index.iter_nodes(start_date, end_date)
+                    if node.category == category]
+        
+        self._load_months(month for month in months
+                          if category in self.monthly_stats[month]["by_category"])
+        id_index = self.id_index
+        nodes = [id_index[trans_id] for trans_id in self.category_index.ids(category)]
+        if start_date or end_date:
+            nodes = [node for node in nodes
+                     if (start_date is None or node.date >= start_date) and
+                        (end_date is None or node.date <= end_date)]
+        nodes.sort(key=lambda node: (node.date, node.trans_id), reverse=True)
+        return nodes
+    
+    # ==================== BATCH (UNIT OF WORK) ====================
+    
+    @contextmanager
+    def batch(self):
+        """
+        Unit of work untuk banyak mutasi sekaligus:
+        
+            with manager.batch():
+                for row in rows:
+                    manager.insert_at_head(...)
+        
+        Selama batch, perbaikan MAX-HEAP, update Fenwick Tree total harian,
+        penulisan journal/storage dan persist() ditunda. Saat commit semuanya
+        diterapkan sekali: heap di-fix per node yang berubah (atau di-heapify
+        ulang jika perubahannya banyak), delta harian digabung per hari, record
+        ditulis lalu persist() dipanggil sekali. Jika terjadi exception, semua
+        mutasi dibatalkan dengan undo log dan tidak ada yang ditulis ke disk.
+        Batch terluar memegang self.lock selama berjalan.
+        
+        Agregat per bulan tetap di-update langsung, tetapi get_highest_expense(),
+        get_top_expenses() tanpa filter dan range_totals() baru mencerminkan isi batch
+        setelah commit. Batch bersarang digabung ke batch terluar.
+        """
+        if self._batch is not None:
+            yield self
+            return
+        
+        with self.lock:
+            self._batch = {
+                "undo": [],          # undo log (dibatalkan dalam urutan terbalik)
+                "records": [],       # record journal/storage yang ditunda
+                "heap": {},          # trans_id -> node yang posisinya di heap perlu diperbaiki
+                "daily": {},         # (date, type) -> delta total harian
+                "transaction_count": self.transaction_count,
+                "current_month": self.current_month,
+                "recurring_queue": self.recurring_queue.snapshot(),
+                "recurring_cursor": dict(self.recurring_cursor),
+            }
+            try:
+                yield self
+            except BaseException:
+                self._rollback_batch()
+                raise
+            self._commit_batch()
+    
+    def _record_undo(self, entry: tuple):
+        """Catat entry undo log jika sedang dalam batch"""
+        if self._batch is not None:
+            self._batch["undo"].append(entry)
+    
+    def _commit_batch(self):
+        """
+        Terapkan semua pekerjaan yang ditunda batch() sekali, lalu persist
+        
+        Time Complexity: O(k log n), atau O(n) jika k node heap berubah dan
+        k log n > n (heap di-heapify ulang)
+        """
+        batch, self._batch = self._batch, None
+        
+        touched = batch["heap"]
+        heap_size = max(self.expense_heap.size(), 1)
+        if len(touched) * heap_size.bit_length() > heap_size:
+            self.expense_heap.rebuild_from_dll(self.head)
+        else:
+            for node in touched.values():
+                self._sync_heap(node)
+        
+        for (date, trans_type), amount in batch["daily"].items():
+            if amount:
+                self.daily_totals.add(date, trans_type, amount)
+        
+        for record in batch["records"]:
+            self._log_mutation(record)
+        if batch["records"]:
+            self.persist()
+    
+    def _rollback_batch(self):
+        """Batalkan semua mutasi batch dari undo log (urutan terbalik)"""
+        batch = self._batch
+        
+        for entry in reversed(batch["undo"]):
+            kind, node = entry[0], entry[1]
+            if kind == "insert":
+                self._apply_stats(node, -1)
+                self._unlink(node)
+                self.id_index.pop(node.trans_id, None)
+                self.date_index.remove(node)
+                self.category_index.remove(node)
+            elif kind == "delete":
+                _, node, prev, nxt = entry
+                node.prev, node.next = prev, nxt
+                if prev:
+                    prev.next = node
+                else:
+                    self.head = node
+                if nxt:
+                    nxt.prev = node
+                else:
+                    self.tail = node
+                self.id_index[node.trans_id] = node
+                self.date_index.add(node)
+                self.category_index.add(node)
+                self._apply_stats(node, 1)
+            elif kind == "update":
+                self._apply_stats(node, -1)
+                new_date, new_category = node.date, node.category
+                (node.date, node.title, node.amount,
+                 node.trans_type, node.category) = entry[2]
+                self._apply_stats(node, 1)
+                self.date_index.move(node, new_date)
+                self.category_index.move(node, new_category)
+            elif kind == "budget":
+                month, previous_limit = entry[1], entry[2]
+                if previous_limit is None:
+                    self.budget_bst.delete(month)
+                else:
+                    self.budget_bst.insert(month, previous_limit)
+        
+        self.transaction_count = batch["transaction_count"]
+        self.current_month = batch["current_month"]
+        self.recurring_queue.restore(batch["recurring_queue"])
+        self.recurring_cursor = batch["recurring_cursor"]
+        # Heap, total harian dan record belum pernah diterapkan, cukup dibuang
+        self._batch = None
+    
+    # ==================== JOURNAL / STORAGE ====================
+    
+    def _log_mutation(self, record: dict):
+        """
+        Teruskan satu record mutasi ke journal atau storage backend (jika aktif)
+        Tidak menulis apa pun saat load/replay agar data tidak terduplikasi
+        
+        Time Complexity: O(1) journal, O(log n) SQLite
+        """
+        if self._replaying:
+            return
+        if self._batch is not None:
+            self._batch["records"].append(record)
+            return
+        if self.journal is not None:
+            self.journal.append(record)
+        if self.storage is not None:
+            self.storage.apply(record)
+    
+    def _apply_journal_record(self, record: dict):
+        """
+        Terapkan satu record journal ke struktur data in-memory (replay)
+        
+        Args:
+            record: Record dari TransactionJournal.replay()
+        """
+        op = record.get("op")
+        if op == "insert":
+            trans = record["txn"]
+            self.insert_at_head(
+                trans["date"],
+                trans["title"],
+                trans["amount"],
+                trans["type"],
+                trans["category"],
+                trans.get("is_recurring", False),
+                trans.get("recurrence_type", None),
+                trans_id=trans["id"]
+            )
+        elif op == "update":
+            trans = record["txn"]
+            node = self.find_node_by_id(trans["id"])
+            if node:
+                self.update_node(node, trans["date"], trans["title"], trans["amount"],
+                                 trans["type"], trans["category"])
+        elif op == "delete":
+            node = self.find_node_by_id(record["id"])
+            if node:
+                self.delete_node(node)
+        elif op == "budget":
+            self.set_budget(record["month"], record["limit"])
+        elif op == "month":
+            self.current_month = record["current_month"]
+        elif op == "cursor":
+            self.recurring_cursor[record["id"]] = record["next_due"]
+    
+    def persist(self):
+        """
+        Persist perubahan terakhir ke disk
+        
+        - Storage backend: commit satu transaksi SQLite berisi semua perubahan tertunda
+        - Journal mode: flush journal (O(1)), compaction ke snapshot hanya
+          dilakukan setelah compact_threshold record
+        - Snapshot mode: tulis ulang seluruh snapshot (save_to_file)
+        
+        Di dalam batch(), persist ditunda sampai batch di-commit. Dengan
+        background_save, persist hanya menandai dirty (O(1)) dan penulisan
+        digabung oleh PersistenceWorker.
+        """
+        if self._batch is not None:
+            return
+        if self.persistence_worker is not None:
+            self.persistence_worker.mark_dirty()
+            return
+        self._persist_now()
+    
+    def _persist_now(self):
+        """Penulisan persist() yang sebenarnya (sinkron, dipanggil juga oleh worker)"""
+        if self.storage is not None:
+            self.storage.set_meta("next_id", str(self.transaction_count + 1))
+            self.storage.commit()
+            return
+        
+        if self.journal is None:
+            self.save_to_file()
+            return
+        
+        with self.lock:
+            self.journal.flush()
+            if self.journal.record_count >= self.compact_threshold:
+                self.compact()
+    
+    def close(self):
+        """
+        Flush semua perubahan tertunda ke disk secara durable lalu hentikan
+        PersistenceWorker (dipanggil saat aplikasi ditutup)
+        
+        Raises:
+            OSError: Jika penulisan terakhir gagal; close() boleh dipanggil lagi
+                     (penulisan berikutnya dilakukan sinkron)
+        """
+        try:
+            if self.persistence_worker is not None:
+                worker, self.persistence_worker = self.persistence_worker, None
+                worker.stop()
+            else:
+                self.persist()
+        finally:
+            if self.journal is not None:
+                self.journal.flush(sync=True)
+                self.journal.close()
+    
+    def compact(self):
+        """
+        Compaction: tulis snapshot lengkap lalu kosongkan journal
+        
+        Time Complexity: O(n)
+        """
+        self.save_to_file()
+    
+    # ==================== PARTITIONED STORAGE ====================
+    
+    def _partition_path(self, month: str) -> str:
+        return os.path.join(self.partition_dir, f"{month}.json")
+    
+    def _manifest_path(self) -> str:
+        return os.path.join(self.partition_dir, "manifest.json")
+    
+    def _stored_months(self) -> Optional[Dict[str, Dict]]:
+        """
+        Bulan yang tersimpan di penyimpanan lazy: file bulan (partitioned
+        storage) atau monthly stats (storage backend, berasal dari agregat
+        SQLite). None jika seluruh ledger dimuat saat startup.
+        """
+        if self._partitions is not None:
+            return self._partitions
+        if self.storage is not None:
+            return self.monthly_stats
+        return None
+    
+    def ensure_loaded(self, start_month: Optional[str] = None, end_month: Optional[str] = None):
+        """
+        Pastikan semua bulan dalam range (inklusif, None = tanpa batas) sudah
+        dimuat dari partitioned storage atau storage backend. No-op jika
+        seluruh ledger sudah dimuat saat startup.
+        
+        Dipanggil otomatis oleh view, export, pencarian dan query range yang
+        membutuhkan transaksi bulan yang sudah tutup.
+        
+        Time Complexity: O(k) untuk k transaksi di bulan yang belum dimuat
+        """
+        stored = self._stored_months()
+        if stored is None or self._loaded_months.issuperset(stored):
+            return
+        self._load_months([
+            month for month in stored
+            if (start_month is None or month >= start_month) and
+               (end_month is None or month <= end_month)
+        ])
+    
+    def _load_months(self, months):
+        """
+        Muat bulan-bulan yang belum dimuat, dari yang terbaru (di-link di belakang
+        tail): file bulan, atau indexed query per bulan untuk storage backend
+        """
+        stored = self._stored_months()
+        if stored is None:
+            return
+        pending = sorted({month for month in months
+                          if month in stored and month not in self._loaded_months},
+                         reverse=True)
+        if not pending:
+            return
+        
+        with self.lock:
+            # Load bukan mutasi: tidak dicatat ke undo log batch maupun dirty months
+            batch, self._batch = self._batch, None
+            replaying, self._replaying = self._replaying, True
+            try:
+                for month in pending:
+                    if self.storage is not None:
+                        transactions = self.storage.iter_month(month)
+                    else:
+                        with open(self._partition_path(month), 'r') as f:
+                            transactions = json.load(f)["transactions"]
+                    # Template recurring (dan transaksi yang di-insert ke bulan
+                    # yang belum dimuat) sudah ada di memori
+                    self._bulk_load((trans for trans in transactions
+                                     if trans["id"] not in self.id_index), at_tail=True)
+                    self._loaded_months.add(month)
+            finally:
+                self._batch = batch
+                self._replaying = replaying
+    
+    def _load_partitioned(self):
+        """
+        Startup partitioned storage: manifest (agregat per bulan, budget, cursor,
+        template recurring) lalu hanya bulan berjalan dan bulan setelahnya.
+        Agregat manifest tetap menjadi monthly stats untuk semua bulan, sehingga
+        header, budget dan history benar tanpa memuat bulan yang sudah tutup.
+        Tanpa manifest, data_file lama dimuat penuh lalu dipecah per bulan.
+        """
+        if not os.path.exists(self._manifest_path()):
+            if os.path.exists(self.data_file):
+                self._load_snapshot()
+                self._dirty_months = set(self.monthly_stats)
+                self._save_partitions()
+            return
+        
+        with open(self._manifest_path(), 'r') as f:
+            manifest = json.load(f)
+        
+        self.transaction_count = manifest.get("next_id", 1) - 1
+        self.current_month = manifest.get("current_month", self.current_month)
+        for month, budget_limit in manifest.get("budgets", {}).items():
+            self.budget_bst.insert(month, budget_limit)
+        self.recurring_cursor = {
+            int(trans_id): next_due
+            for trans_id, next_due in manifest.get("recurring_cursor", {}).items()
+        }
+        # Agregat bulan yang belum dimuat tetap tersedia untuk header, budget dan history
+        self.monthly_stats = manifest.get("months", {})
+        self.category_index.load_totals(self.monthly_stats)
+        self._partitions = manifest.get("partitions", {})
+        
+        open_month = min(self.current_month, datetime.now().strftime("%Y-%m"))
+        self._load_months(month for month in self._partitions if month >= open_month)
+        # Template recurring dari bulan yang belum dimuat (untuk queue dan forecast)
+        with self.lock:
+            self._bulk_load((trans for trans in manifest.get("recurring", [])
+                             if trans["id"] not in self.id_index), at_tail=True)
+    
+    def _save_partitions(self):
+        """
+        Tulis ulang file bulan yang berubah sejak persist terakhir, lalu manifest
+        
+        Time Complexity: O(k) dimana k adalah jumlah transaksi yang sudah dimuat
+        (bukan seluruh history)
+        
+        Raises:
+            OSError: Jika file bulan atau manifest gagal ditulis (bulan tetap dirty)
+        """
+        with self.lock:
+            dirty, self._dirty_months = self._dirty_months, set()
+            # File bulan ditulis ulang dari node di memori, jadi bulan yang berubah
+            # (misalnya insert ke bulan tutup) harus dimuat lengkap dulu
+            self._load_months(dirty)
+            rows: Dict[str, List[dict]] = {month: [] for month in dirty}
+            if rows:
+                current = self.tail
+                while current:
+                    month_rows = rows.get(current.date[:7])
+                    if month_rows is not None:
+                        month_rows.append(current.to_dict())
+                    current = current.prev
+            
+            for month, month_rows in rows.items():
+                self._loaded_months.add(month)
+                if not month_rows:
+                    self._partitions.pop(month, None)
+                    continue
+                expenses = [row["amount"] for row in month_rows if row["type"] == "Expense"]
+                ids = [row["id"] for row in month_rows]
+                self._partitions[month] = {
+                    "ids": [min(ids), max(ids)],
+                    "max_expense": max(expenses, default=0.0)
+                }
+            
+            manifest = {
+                "next_id": self.transaction_count + 1,
+                "current_month": self.current_month,
+                "budgets": {
+                    budget.month: budget.budget_limit
+                    for budget in self.budget_bst.get_all_budgets()
+                },
+                "recurring_cursor": {
+                    str(trans_id): next_due
+                    for trans_id, next_due in self.recurring_cursor.items()
+                },
+                "months": self.monthly_stats,
+                "partitions": self._partitions,
+                # Semua template recurring selalu ada di memori (dimuat saat startup)
+                "recurring": [node.to_dict() for node in self.id_index.values()
+                              if node.is_recurring]
+            }
+            # Serialisasi di dalam lock agar manifest konsisten dengan file bulan
+            manifest = json.loads(json.dumps(manifest))
+        
+        try:
+            os.makedirs(self.partition_dir, exist_ok=True)
+            for month, month_rows in rows.items():
+                path = self._partition_path(month)
+                if month_rows:
+                    self._write_json(path, {"month": month, "transactions": month_rows})
+                elif os.path.exists(path):
+                    os.remove(path)
+            self._write_json(self._manifest_path(), manifest)
+        except Exception:
+            # Bulan-bulan ini (dan manifest) ditulis ulang pada save berikutnya
+            with self.lock:
+                self._dirty_months |= set(rows)
+            raise
+    
     # ==================== SAVE FILE ====================
     
     def save_to_file(self):
         """
         Simpan semua transaksi ke file JSON termasuk monthly history
         Menelusuri DLL dan men-serialisasikan setiap node ke format kamus
+        
+        Snapshot diambil di bawah self.lock lalu ditulis secara atomik. Dalam
+        journal mode lock dipegang sampai journal dikosongkan, agar tidak ada
+        record baru yang hilang di antara snapshot dan truncate.
+        
+        Raises:
+            OSError: Jika snapshot gagal ditulis (file lama tidak berubah)
         """
+        if self._partitions is not None:
+            self._save_partitions()
+            return
+        with self.lock:
+            if self.journal is not None:
+                # Snapshot sudah memuat semua mutasi, journal bisa dikosongkan.
+                # Generation baru dicatat di snapshot dan header journal: jika crash
+                # terjadi sebelum truncate, journal lama dikenali saat load
+                self.journal_generation += 1
+                try:
+                    self._write_snapshot_file(self._snapshot_data())
+                except Exception:
+                    self.journal_generation -= 1
+                    raise
+                self.journal.truncate(self.journal_generation)
+                return
+            data = self._snapshot_data()
+        self._write_snapshot_file(data)
+    
+    def _snapshot_data(self) -> dict:
+        """Serialisasi seluruh state ke dictionary snapshot (format data.json)"""
+        self.ensure_loaded()
         transactions = []
         current = self.head
         
@@ -489,20 +1534,76 @@ class FinanceManager:
         # Reverse to maintain chronological order in file
         transactions.reverse()
         
-        data = {
+        return {
             "transactions": transactions,
             "next_id": self.transaction_count + 1,
             "current_month": self.current_month,
             "total_income": self.total_income,
             "total_expense": self.total_expense,
-            "monthly_history": self.monthly_history
+            "monthly_history": self.monthly_history,
+            "budgets": {
+                budget.month: budget.budget_limit
+                for budget in self.budget_bst.get_all_budgets()
+            },
+            "recurring_cursor": {
+                str(trans_id): next_due
+                for trans_id, next_due in self.recurring_cursor.items()
+            },
+            "journal_generation": self.journal_generation
         }
+    
+    def _write_snapshot_file(self, data: dict):
+        """Tulis snapshot ke data_file dalam format biner atau JSON (atomik)"""
+        if self.binary_snapshot:
+            self._write_atomic(
+                self.data_file, lambda f: binary_snapshot.write_binary_snapshot(f, data), binary=True)
+        else:
+            self._write_json(self.data_file, data)
+    
+    @classmethod
+    def _write_json(cls, path: str, data: dict):
+        """Tulis file JSON ringkas secara atomik"""
+        # Tanpa indent agar json memakai encoder C (jauh lebih cepat untuk ledger besar)
+        cls._write_atomic(path, lambda f: json.dump(data, f, separators=(",", ":")))
+    
+    @staticmethod
+    def _write_atomic(path: str, write, binary: bool = False):
+        """
+        Tulis file secara atomik: temp file di direktori yang sama, fsync,
+        lalu os.replace. Crash di tengah penulisan tidak pernah meninggalkan
+        file yang terpotong.
+        
+        Permission file lama dipertahankan; file baru mendapat permission
+        default (0666 dikurangi umask), sama seperti open().
+        
+        Args:
+            path: File tujuan
+            write: Callable yang menulis isi file ke file object
+            binary: Buka temp file dalam mode biner
         
+        Raises:
+            OSError (atau error dari write): file tujuan tidak berubah dan temp
+            file dihapus; pemanggil yang memutuskan retry
+        """
+        directory = os.path.dirname(os.path.abspath(path))
         try:
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            print(f"Error saving data: {e}")
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        fd, tmp_path = tempfile.mkstemp(dir=directory,
+                                        prefix=os.path.basename(path) + ".",
+                                        suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb' if binary else 'w') as f:
+                write(f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
     
     def load_from_file(self):
         """
@@ -510,33 +1611,418 @@ class FinanceManager:
         Membangun ulang DLL dan Max-Heap dari data yang disimpan
         Juga load recurring transactions ke queue
         Restore monthly history untuk bulan-bulan sebelumnya
+        Dalam journal mode, record journal di-replay setelah snapshot
+        Dengan storage backend, data dimuat dari SQLite (data_file di-import
+        sekali jika database masih kosong): agregat per bulan, bulan berjalan
+        dan template recurring
+        Dengan partitioned storage, hanya bulan berjalan (dan bulan berisi
+        template recurring) yang dimuat
         """
-        if not os.path.exists(self.data_file):
-            return
+        # Selama load, mutasi tidak boleh ditulis ulang ke journal
+        self._replaying = True
+        try:
+            if self.storage is not None:
+                if self.storage.is_empty() and os.path.exists(self.data_file):
+                    self.import_from_json(self.data_file)
+                self._load_from_storage()
+            elif self._partitions is not None:
+                self._load_partitioned()
+            elif os.path.exists(self.data_file):
+                self._load_snapshot()
+            
+            if self.journal is not None:
+                for record in self.journal.replay():
+                    if self.journal.generation < self.journal_generation:
+                        break
+                    self._apply_journal_record(record)
+                if self.journal.generation < self.journal_generation:
+                    # Crash setelah snapshot ditulis tapi sebelum journal dikosongkan:
+                    # semua record journal sudah termasuk di snapshot
+                    self.journal.truncate(self.journal_generation)
+        except Exception as e:
+            print(f"Error loading data: {e}")
+        finally:
+            self._replaying = False
+        
+        self._schedule_recurring()
+    
+    def _schedule_recurring(self):
+        """
+        Jadwalkan semua template recurring sekali setelah load (heapify sekali)
+        Jadwal dimulai dari schedule cursor jika ada, selain itu dari tanggal template
+        """
+        self.recurring_queue.schedule_many(
+            (node for node in self.id_index.values() if node.is_recurring),
+            self.recurring_cursor
+        )
+    
+    def import_from_json(self, filename: str):
+        """
+        Import file JSON (format save_to_file) ke storage backend
+        Semua baris ditulis dengan executemany dalam satu transaksi SQLite
+        
+        Args:
+            filename: Path file JSON
+        """
+        with open(filename, 'r') as f:
+            data = json.load(f)
+        
+        self.storage.insert_many(data.get("transactions", []))
+        for month, budget_limit in data.get("budgets", {}).items():
+            self.storage.apply({"op": "budget", "month": month, "limit": budget_limit})
+        self.storage.apply({
+            "op": "month",
+            "current_month": data.get("current_month", datetime.now().strftime("%Y-%m"))
+        })
+        for trans_id, next_due in data.get("recurring_cursor", {}).items():
+            self.storage.apply({"op": "cursor", "id": int(trans_id), "next_due": next_due})
+        self.storage.set_meta("next_id", str(data.get("next_id", 1)))
+        self.storage.commit()
+    
+    def _load_from_storage(self):
+        """
+        Startup storage backend: metadata, budget, cursor dan agregat per bulan
+        (tabel month_totals), lalu hanya transaksi bulan berjalan, bulan
+        setelahnya dan template recurring. Bulan lain dimuat lewat indexed
+        query saat dibutuhkan (lihat ensure_loaded).
+        
+        Time Complexity: O(b + k), b = baris agregat, k = transaksi yang dimuat
+        """
+        self.transaction_count = int(self.storage.get_meta("next_id", "1")) - 1
+        self.current_month = self.storage.get_meta(
+            "current_month", datetime.now().strftime("%Y-%m"))
+        
+        for month, budget_limit in self.storage.load_budgets().items():
+            self.budget_bst.insert(month, budget_limit)
+        self.recurring_cursor = self.storage.load_recurring_cursor()
+        self.monthly_stats = self.storage.load_month_totals()
+        self.category_index.load_totals(self.monthly_stats)
         
+        open_month = min(self.current_month, datetime.now().strftime("%Y-%m"))
+        self._load_months([month for month in self.monthly_stats if month >= open_month])
+        with self.lock:
+            self._bulk_load((trans for trans in self.storage.iter_recurring()
+                             if trans["id"] not in self.id_index), at_tail=True)
+    
+    def _load_snapshot(self):
+        """Muat snapshot JSON atau biner (data_file) ke struktur data in-memory"""
         try:
+            if self.binary_snapshot:
+                self._load_binary_snapshot()
+                return
             with open(self.data_file, 'r') as f:
                 data = json.load(f)
             
-            self.transaction_count = data.get("next_id", 1) - 1
-            self.current_month = data.get("current_month", datetime.now().strftime("%Y-%m"))
-            self.monthly_history = data.get("monthly_history", {})
+            self._apply_snapshot_metadata(data)
+            self._bulk_load(data.get("transactions", []))
+        except Exception as e:
+            print(f"Error loading data: {e}")
+    
+    def _load_binary_snapshot(self):
+        """
+        Muat snapshot biner: file di-mmap dan node dibangun langsung dari
+        record fixed-width di buffer (tanpa parsing JSON)
+        
+        Time Complexity: O(n + s)
+        """
+        with binary_snapshot.BinarySnapshot(self.data_file) as snapshot:
+            self._apply_snapshot_metadata(snapshot.metadata)
+            self._bulk_load(snapshot.iter_transactions())
+    
+    def _apply_snapshot_metadata(self, data: dict):
+        """Terapkan next_id, current_month, budgets, recurring_cursor dan journal generation"""
+        self.transaction_count = data.get("next_id", 1) - 1
+        self.journal_generation = data.get("journal_generation", 0)
+        self.current_month = data.get("current_month", datetime.now().strftime("%Y-%m"))
+        
+        for month, budget_limit in data.get("budgets", {}).items():
+            self.budget_bst.insert(month, budget_limit)
+        self.recurring_cursor = {
+            int(trans_id): next_due
+            for trans_id, next_due in data.get("recurring_cursor", {}).items()
+        }
+    
+    def _bulk_load(self, transactions, at_tail: bool = False):
+        """
+        Bulk-construction path untuk load: membangun semua struktur data sekaligus
+        
+        Dibandingkan memanggil insert_at_head per record:
+        - DLL di-link dalam satu pass (record oldest-first, node terakhir jadi head)
+        - Max-Heap dibangun sekali dengan Floyd's algorithm (O(n), bukan n x sift-up)
+        - Agregat per bulan dihitung dalam pass yang sama (tanpa BST search)
+        - Fenwick Tree total harian dibangun sekali secara linear
+        - Date index menggabungkan hari baru dan men-sort daftar hari sekali
+        - ID yang tersimpan dipertahankan (tidak di-renumber), record tanpa
+          "id" mendapat ID baru
+        
+        Node baru di-link di depan head yang sudah ada, sehingga path ini juga
+        dipakai bulk_insert untuk menambah banyak transaksi sekaligus. Dengan
+        at_tail=True blok node di-link di belakang tail dan monthly stats tidak
+        diubah (blok dimuat lazy oleh partitioned storage atau storage backend,
+        agregatnya sudah berasal dari manifest/month_totals).
+        
+        Time Complexity: O(n + k)
+        
+        Args:
+            transactions: Iterable dictionary transaksi (format to_dict), oldest-first
+            at_tail: Link blok di belakang tail, bukan di depan head
+        
+        Returns:
+            List of TransactionNode yang dibuat, oldest-first
+        """
+        head = None if at_tail else self.head
+        block_tail = None
+        expense_items = []
+        daily_points = []
+        max_id = self.transaction_count
+        nodes = []
+        
+        for trans in transactions:
+            trans_id = trans.get("id")
+            if trans_id is None:
+                max_id += 1
+                trans_id = max_id
+            elif trans_id > max_id:
+                max_id = trans_id
             
-            transactions = data.get("transactions", [])
+            amount = trans["amount"]
+            trans_type = trans["type"]
+            date = trans["date"]
+            recurrence_type = trans.get("recurrence_type")
+            node = TransactionNode(date, trans["title"], amount, trans_type,
+                                   trans["category"], trans_id,
+                                   trans.get("is_recurring", False), recurrence_type)
             
-            # Reconstruct DLL (insert in reverse to maintain newest-first order)
-            for trans in reversed(transactions):
-                is_recurring = trans.get("is_recurring", False)
-                recurrence_type = trans.get("recurrence_type", None)
-                
-                self.insert_at_head(
-                    trans["date"],
-                    trans["title"],
-                    trans["amount"],
-                    trans["type"],
-                    trans["category"],
-                    is_recurring,
-                    recurrence_type
-                )
-        except Exception as e:
-            print(f"Error loading data: {e}")
\ No newline at end of file
+            # Link di depan head sebelumnya (node yang lebih baru = lebih dekat ke head)
+            if head is None:
+                block_tail = node
+            else:
+                node.next = head
+                head.prev = node
+            head = node
+            
+            if at_tail:
+                # Blok yang dimuat lazy: agregat bulan sudah ada di monthly stats
+                self.generation += 1
+            else:
+                self._apply_stats(node, 1, update_daily=False)
+            daily_points.append((date, trans_type, amount))
+            if trans_type == "Expense":
+                expense_items.append((amount, node))
+            
+            nodes.append(node)
+            self.id_index[trans_id] = node
+        
+        if not at_tail:
+            self.head = head
+            if block_tail is not None:
+                self.tail = block_tail
+        elif nodes:
+            if self.tail is None:
+                self.head = head
+            else:
+                self.tail.next = head
+                head.prev = self.tail
+            self.tail = block_tail
+        self.transaction_count = max_id
+        self.date_index.add_many(nodes)
+        self.category_index.add_many(nodes)
+        
+        if self._batch is not None:
+            # Di dalam batch: heap dan total harian diperbaiki saat commit
+            for node in nodes:
+                self._record_undo(("insert", node))
+            for amount, node in expense_items:
+                self._batch["heap"][node.trans_id] = node
+            pending = self._batch["daily"]
+            for date, trans_type, amount in daily_points:
+                pending[(date, trans_type)] = pending.get((date, trans_type), 0.0) + amount
+            return nodes
+        
+        # Fenwick Tree total harian dibangun sekali (linear)
+        self.daily_totals.add_many(daily_points)
+        
+        # Satu heap fix-up: heapify ulang jika batch lebih besar dari heap yang
+        # sudah ada, selain itu cukup sift-up per item (O(k log n))
+        if len(expense_items) > self.expense_heap.size():
+            self.expense_heap.build(self.expense_heap.heap + expense_items)
+        else:
+            for amount, node in expense_items:
+                self.expense_heap.insert(amount, node)
+        
+        return nodes
+    
+    @_synchronized
+    def bulk_insert(self, transactions: List[dict]) -> List[TransactionNode]:
+        """
+        Tambahkan banyak transaksi sekaligus lewat bulk-construction path
+        
+        Satu kali heap fix-up dan satu kali update Fenwick Tree untuk seluruh
+        batch; setiap transaksi tetap di-log ke journal/storage. Pemanggil cukup
+        memanggil persist() sekali setelahnya.
+        
+        Time Complexity: O(k log n) atau O(n + k) (lihat _bulk_load)
+        
+        Args:
+            transactions: List dictionary transaksi (format to_dict tanpa "id"), oldest-first
+        
+        Returns:
+            List of TransactionNode baru, oldest-first
+        """
+        nodes = self._bulk_load(transactions)
+        for node in nodes:
+            self._log_mutation({"op": "insert", "txn": node.to_dict()})
+        return nodes
+    
+    # ==================== RECURRING ====================
+    
+    @_synchronized
+    def materialize_recurring(self, today: Optional[str] = None) -> List[TransactionNode]:
+        """
+        Posting semua occurrence recurring yang sudah jatuh tempo (catch-up)
+        
+        Semua ScheduledTransaction yang due diambil dari queue, setiap occurrence
+        yang terlewat dibuat sebagai transaksi biasa (bukan template recurring),
+        lalu di-insert dalam satu bulk_insert dan di-persist sekali. Jadwal
+        berikutnya di-enqueue ulang dan schedule cursor dicatat, sehingga
+        occurrence yang sama tidak pernah diposting dua kali meskipun aplikasi
+        di-restart.
+        
+        Time Complexity: O(d log q + k log n), d = jadwal due, q = ukuran queue,
+        k = jumlah occurrence yang diposting
+        
+        Args:
+            today: Tanggal acuan YYYY-MM-DD (default: hari ini)
+        
+        Returns:
+            List of TransactionNode yang baru diposting, oldest-first
+        """
+        today = today or datetime.now().strftime("%Y-%m-%d")
+        due = self.recurring_queue.get_due_transactions(today)
+        if not due:
+            return []
+        
+        occurrences = []
+        for scheduled in due:
+            template = scheduled.node
+            # Template yang sudah dihapus tidak dijadwalkan lagi
+            if self.id_index.get(template.trans_id) is not template or not template.is_recurring:
+                continue
+            if template.recurrence_type not in RecurringTransactionQueue.RECURRENCE_TYPES:
+                continue
+            
+            anchor_day = RecurringTransactionQueue.anchor_day(template)
+            next_date = scheduled.next_due_date
+            while next_date <= today:
+                occurrences.append({
+                    "date": next_date,
+                    "title": template.title,
+                    "amount": template.amount,
+                    "type": template.trans_type,
+                    "category": template.category,
+                    "is_recurring": False,
+                    "recurrence_type": None
+                })
+                following = RecurringTransactionQueue._calculate_next_date(
+                    next_date, template.recurrence_type, anchor_day)
+                if following <= next_date:  # tanggal tidak maju: jadwal dihentikan
+                    break
+                next_date = following
+            else:
+                self.recurring_queue.enqueue(ScheduledTransaction(template, next_date))
+            self.recurring_cursor[template.trans_id] = next_date
+            self._log_mutation({"op": "cursor", "id": template.trans_id, "next_due": next_date})
+        
+        occurrences.sort(key=lambda trans: trans["date"])
+        nodes = self.bulk_insert(occurrences)
+        self.persist()
+        return nodes
+    
+    @staticmethod
+    def _shift_month(month: str, months: int) -> str:
+        """Geser bulan YYYY-MM sebanyak months bulan"""
+        year, mon = int(month[:4]), int(month[5:7])
+        index = year * 12 + (mon - 1) + months
+        return f"{index // 12:04d}-{index % 12 + 1:02d}"
+    
+    @staticmethod
+    def _tag_occurrences(month_counts: Iterator[Tuple[int, int]], seq: int,
+                         template: TransactionNode) -> Iterator[Tuple[int, int, float]]:
+        """Ubah stream (month_key, count) menjadi (month_key, seq, total) untuk k-way merge"""
+        signed = template.amount if template.trans_type == "Income" else -template.amount
+        for month_key, count in month_counts:
+            yield month_key, seq, signed * count
+    
+    def forecast(self, months_ahead: int = 3, today: Optional[str] = None) -> List[Dict]:
+        """
+        Proyeksi cash flow per bulan dari jadwal recurring (tanpa menulis ke ledger)
+        
+        Setiap jadwal di RecurringTransactionQueue di-expand secara lazy sebagai
+        generator occurrence yang sudah diagregasi per bulan, lalu semua generator
+        digabung berurutan bulan dengan k-way merge (heapq.merge). Stream hasil
+        merge langsung dijumlahkan per bulan, sehingga tidak ada list per
+        hari/per occurrence yang dibangun.
+        Total aktual per bulan (monthly_stats) ditambah total proyeksi; occurrence
+        yang sudah jatuh tempo tapi belum diposting dihitung ke bulan pertama.
+        
+        Time Complexity: O(e + s * m log s + h), s = jumlah jadwal, e = jumlah
+        occurrence, m = jumlah bulan, h = jumlah bulan di monthly_stats
+        
+        Args:
+            months_ahead: Jumlah bulan setelah bulan berjalan yang diproyeksikan
+            today: Tanggal acuan YYYY-MM-DD (default: hari ini)
+        
+        Returns:
+            List of dictionary per bulan (bulan berjalan dulu) dengan month, income,
+            expense, balance, projected_income, projected_expense, running_balance,
+            budget_limit dan budget_utilization (persen, None jika tidak ada budget)
+        """
+        today = today or datetime.now().strftime("%Y-%m-%d")
+        first_month = today[:7]
+        months = [self._shift_month(first_month, i) for i in range(months_ahead + 1)]
+        last_month = months[-1]
+        end_date = f"{last_month}-{calendar.monthrange(int(last_month[:4]), int(last_month[5:]))[1]:02d}"
+        
+        streams = [
+            self._tag_occurrences(RecurringTransactionQueue.expand_monthly(scheduled, end_date),
+                                  seq, scheduled.node)
+            for seq, scheduled in enumerate(self.recurring_queue.iter_scheduled())
+            if self.id_index.get(scheduled.node.trans_id) is scheduled.node
+        ]
+        
+        # Agregasi per bulan langsung dari stream (month_key: year * 12 + month - 1)
+        first_key = int(first_month[:4]) * 12 + int(first_month[5:7]) - 1
+        income_by_month = [0.0] * len(months)
+        expense_by_month = [0.0] * len(months)
+        for month_key, _, total in heapq.merge(*streams):
+            index = max(month_key - first_key, 0)
+            if total >= 0:
+                income_by_month[index] += total
+            else:
+                expense_by_month[index] -= total
+        
+        # Saldo awal: agregat bulan-bulan sebelum bulan pertama forecast (dari
+        # monthly_stats, tanpa memuat partisi bulan yang sudah tutup)
+        running = sum(stats["income"] - stats["expense"]
+                      for month, stats in self.monthly_stats.items() if month < first_month)
+        result = []
+        for index, month in enumerate(months):
+            actual = self.monthly_stats.get(month, {})
+            income = actual.get("income", 0.0) + income_by_month[index]
+            expense = actual.get("expense", 0.0) + expense_by_month[index]
+            running += income - expense
+            
+            budget = self.budget_bst.search(month)
+            result.append({
+                "month": month,
+                "income": income,
+                "expense": expense,
+                "balance": income - expense,
+                "projected_income": income_by_month[index],
+                "projected_expense": expense_by_month[index],
+                "running_balance": running,
+                "budget_limit": budget.budget_limit if budget else None,
+                "budget_utilization": (expense / budget.budget_limit * 100
+                                       if budget and budget.budget_limit > 0 else None)
+            })
+        return result
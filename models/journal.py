@@ -0,0 +1,141 @@
+import json
+import os
+from typing import Iterator
+
+
+class TransactionJournal:
+    """
+    Write-ahead journal (append-only log) untuk mutasi FinanceManager
+
+    Setiap insert/update/delete/budget ditulis sebagai satu baris JSON ringkas
+    (JSON Lines) di akhir file, sehingga biaya tulis per mutasi O(1) dan tidak
+    bergantung pada ukuran ledger. Snapshot lengkap (data.json) hanya ditulis
+    ulang saat compaction.
+
+    Format record:
+        {"op": "insert", "txn": {...}}
+        {"op": "update", "txn": {...}}
+        {"op": "delete", "id": 12}
+        {"op": "budget", "month": "2024-12", "limit": 2000000.0}
+        {"op": "month", "current_month": "2024-12"}
+        {"op": "cursor", "id": 7, "next_due": "2025-01-10"}
+
+    Baris pertama setelah compaction adalah header {"op": "generation",
+    "generation": N}. Snapshot menyimpan generation yang sama
+    (journal_generation), sehingga journal lama yang belum sempat dikosongkan
+    saat crash (snapshot sudah ditulis, truncate belum) dapat dikenali dan
+    tidak di-replay dua kali.
+
+    Time Complexities:
+        - append(): O(1)
+        - replay(): O(k) dimana k adalah jumlah record di journal
+        - truncate(): O(1)
+
+    Attributes:
+        path: Path file journal
+        record_count: Jumlah record sejak compaction terakhir
+        generation: Generation journal (dari header, 0 jika tidak ada)
+    """
+
+    def __init__(self, path: str, fsync: bool = False):
+        """
+        Args:
+            path: Path file journal (e.g., "data.json.journal")
+            fsync: Jika True, setiap flush() juga memanggil os.fsync
+        """
+        self.path = path
+        self.fsync = fsync
+        self.record_count = 0
+        self.generation = 0
+        self._file = None
+
+    def _open(self):
+        """Buka file journal dalam mode append (lazy)"""
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        return self._file
+
+    def append(self, record: dict):
+        """
+        Tambahkan satu record ke akhir journal
+
+        Time Complexity: O(1)
+
+        Args:
+            record: Dictionary record (lihat format di docstring class)
+        """
+        f = self._open()
+        f.write(json.dumps(record, separators=(',', ':')))
+        f.write('\n')
+        self.record_count += 1
+
+    def flush(self, sync: bool = False):
+        """
+        Flush buffer journal ke disk
+
+        Args:
+            sync: Paksa os.fsync walaupun fsync=False (misalnya saat aplikasi ditutup)
+        """
+        if self._file is not None:
+            self._file.flush()
+            if self.fsync or sync:
+                os.fsync(self._file.fileno())
+
+    def replay(self) -> Iterator[dict]:
+        """
+        Baca semua record di journal secara berurutan
+
+        Baris terakhir yang rusak (misalnya karena crash saat menulis) diabaikan.
+        Header generation tidak di-yield, tetapi disimpan di self.generation.
+
+        Yields:
+            Record dictionary sesuai urutan penulisan
+        """
+        self.record_count = 0
+        self.generation = 0
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Torn write di akhir file, sisa journal tidak bisa dipercaya
+                    break
+                if record.get("op") == "generation":
+                    self.generation = record["generation"]
+                    continue
+                self.record_count += 1
+                yield record
+
+    def truncate(self, generation: int = 0):
+        """
+        Kosongkan journal setelah snapshot berhasil ditulis (compaction)
+
+        Time Complexity: O(1)
+
+        Args:
+            generation: Generation snapshot yang baru ditulis (ditulis sebagai header)
+        """
+        self.close()
+        with open(self.path, 'w', encoding='utf-8') as f:
+            if generation:
+                f.write(json.dumps({"op": "generation", "generation": generation},
+                                   separators=(',', ':')))
+                f.write('\n')
+        self.record_count = 0
+        self.generation = generation
+
+    def close(self):
+        """Tutup file handle journal"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __str__(self) -> str:
+        """Representation string"""
+        return f"TransactionJournal[{self.record_count} records]"
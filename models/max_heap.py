@@ -1,5 +1,6 @@
+import heapq
 from models.transaction_node import TransactionNode
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 class MaxHeap:
     """
@@ -8,17 +9,26 @@ class MaxHeap:
     Heap ini menyimpan pengeluaran tertinggi di akar/root, memungkinkan akses O(1)
     ke pengeluaran tertinggi dan insertion O(log n).
     
+    Indexed heap: posisi setiap node di array heap dicatat (trans_id -> index),
+    sehingga remove dan update amount cukup satu sift O(log n) tanpa rebuild.
+    
     Time Complexities:
         - insert(): O(log n)
+        - remove(): O(log n)
+        - update(): O(log n)
         - get_max(): O(1)
+        - top_k(): O(k log k)
+        - build(): O(n)
         - rebuild_from_dll(): O(n)
     
     Attributes:
         heap: List of tuples (amount, node) where amount is the key
+        position: Dictionary trans_id -> index node di dalam heap
     """
     
     def __init__(self):
         self.heap: List[Tuple[float, TransactionNode]] = []
+        self.position: Dict[int, int] = {}
     
     def _parent(self, i: int) -> int:
         """Get parent index"""
@@ -33,8 +43,10 @@ class MaxHeap:
         return 2 * i + 2
     
     def _swap(self, i: int, j: int):
-        """Swap two elements in the heap"""
+        """Swap two elements in the heap (dan update posisinya)"""
         self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+        self.position[self.heap[i][1].trans_id] = i
+        self.position[self.heap[j][1].trans_id] = j
     
     def _heapify_up(self, i: int):
         """
@@ -81,8 +93,63 @@ class MaxHeap:
             node: The transaction node reference
         """
         self.heap.append((amount, node))
+        self.position[node.trans_id] = len(self.heap) - 1
         self._heapify_up(len(self.heap) - 1)
     
+    def remove(self, node: TransactionNode) -> bool:
+        """
+        Menghapus node dari heap berdasarkan posisinya (tanpa rebuild)
+        Elemen terakhir dipindah ke posisi yang kosong lalu di-sift up/down
+        Time Complexity: O(log n)
+        
+        Args:
+            node: The transaction node to remove
+        
+        Returns:
+            True jika node ada di heap dan berhasil dihapus
+        """
+        i = self.position.pop(node.trans_id, None)
+        if i is None:
+            return False
+        
+        last = self.heap.pop()
+        if i < len(self.heap):
+            self.heap[i] = last
+            self.position[last[1].trans_id] = i
+            self._sift(i)
+        return True
+    
+    def update(self, node: TransactionNode, amount: float) -> bool:
+        """
+        Mengubah key (amount) node yang sudah ada di heap
+        Time Complexity: O(log n)
+        
+        Args:
+            node: The transaction node
+            amount: New expense amount
+        
+        Returns:
+            True jika node ada di heap dan berhasil di-update
+        """
+        i = self.position.get(node.trans_id)
+        if i is None:
+            return False
+        
+        self.heap[i] = (amount, node)
+        self._sift(i)
+        return True
+    
+    def _sift(self, i: int):
+        """Sift up jika lebih besar dari parent, selain itu sift down"""
+        if i > 0 and self.heap[i][0] > self.heap[self._parent(i)][0]:
+            self._heapify_up(i)
+        else:
+            self._heapify_down(i)
+    
+    def contains(self, node: TransactionNode) -> bool:
+        """Check apakah node ada di heap. Time Complexity: O(1)"""
+        return node.trans_id in self.position
+    
     def get_max(self) -> Optional[TransactionNode]:
         """
         Mencari pengeluaran tertinggi tanpa menghapusnya
@@ -93,28 +160,80 @@ class MaxHeap:
         """
         return self.heap[0][1] if self.heap else None
     
+    def build(self, items: List[Tuple[float, TransactionNode]]):
+        """
+        Bangun heap sekaligus dari list (amount, node) dengan Floyd's algorithm
+        Time Complexity: O(n), lebih cepat dari n kali insert() yang O(n log n)
+        
+        Args:
+            items: List of tuples (amount, node); list ini dipakai langsung sebagai heap
+        """
+        self.heap = items
+        self.position = {node.trans_id: i for i, (_, node) in enumerate(items)}
+        
+        # Build heap from bottom up (Floyd's algorithm)
+        for i in range(len(self.heap) // 2 - 1, -1, -1):
+            self._heapify_down(i)
+    
+    def top_k(self, k: int) -> List[TransactionNode]:
+        """
+        Mengambil k pengeluaran tertinggi tanpa mengubah heap (non-destruktif)
+        
+        Best-first traversal pada array heap: mulai dari root, frontier disimpan
+        di heap bantu (heapq), setiap pop mengeluarkan kandidat terbesar lalu
+        memasukkan kedua child-nya. Karena parent >= child, urutan pop sudah
+        descending sehingga traversal berhenti setelah k hasil.
+        
+        Query dengan filter bulan/kategori tidak dijawab di sini (traversal
+        akan mengunjungi hampir seluruh heap), lihat
+        FinanceManager.get_top_expenses().
+        
+        Time Complexity: O(k log k)
+        
+        Args:
+            k: Jumlah hasil maksimum
+        
+        Returns:
+            List of TransactionNode, terurut dari amount terbesar
+        """
+        result: List[TransactionNode] = []
+        if k <= 0 or not self.heap:
+            return result
+        
+        size = len(self.heap)
+        # heapq adalah min-heap, jadi amount dinegasikan; index sebagai tie-breaker
+        frontier = [(-self.heap[0][0], 0)]
+        while frontier and len(result) < k:
+            _, i = heapq.heappop(frontier)
+            result.append(self.heap[i][1])
+            
+            for child in (self._left_child(i), self._right_child(i)):
+                if child < size:
+                    heapq.heappush(frontier, (-self.heap[child][0], child))
+        
+        return result
+    
     def rebuild_from_dll(self, head: Optional[TransactionNode]):
         """
         Membuat ulang heap dari semua transaksi pengeluaran dalam DLL
         Time Complexity: O(n)
         
-        Dinamakan saat pengeluaran dihapus untuk menjaga integritas heap.
+        Tidak lagi dipanggil per delete/update (lihat remove() dan update()),
+        tetap tersedia untuk membangun ulang heap dari awal.
         
         Args:
             head: Head of the doubly linked list
         """
-        self.heap = []
+        items = []
         current = head
         
         # Collect all expense transactions
         while current:
             if current.trans_type == "Expense":
-                self.heap.append((current.amount, current))
+                items.append((current.amount, current))
             current = current.next
         
-        # Build heap from bottom up (Floyd's algorithm)
-        for i in range(len(self.heap) // 2 - 1, -1, -1):
-            self._heapify_down(i)
+        self.build(items)
     
     def size(self) -> int:
         """Return jumlah element dari dalam heap"""
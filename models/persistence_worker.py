@@ -0,0 +1,154 @@
+import threading
+import time
+from typing import Optional
+
+
+class PersistenceWorker:
+    """
+    Background thread yang memiliki semua penulisan FinanceManager ke disk
+
+    Mutasi hanya menandai ledger dirty (mark_dirty, O(1)); worker menunggu
+    sampai tidak ada mutasi baru selama debounce detik (paling lama max_delay
+    sejak mutasi pertama yang belum tersimpan), lalu menjalankan satu
+    penulisan untuk semua mutasi tersebut. Snapshot diambil di bawah
+    manager.lock sehingga selalu konsisten, dan ditulis secara atomik
+    (temp file + os.replace) oleh FinanceManager._persist_now.
+
+    flush() menulis semua perubahan tertunda secara sinkron (dipakai saat
+    aplikasi ditutup); stop() melakukan flush lalu menghentikan thread.
+
+    Ledger hanya ditandai bersih setelah penulisan berhasil. Penulisan yang
+    gagal di thread worker diulang dengan exponential backoff (debounce x 2^n,
+    maksimal MAX_RETRY_DELAY detik); flush() dan stop() meneruskan error ke
+    pemanggil.
+
+    Attributes:
+        manager: FinanceManager yang di-persist
+        debounce: Jeda tanpa mutasi (detik) sebelum menulis
+        max_delay: Batas waktu maksimum (detik) sebuah mutasi belum tersimpan
+        save_count: Jumlah penulisan yang sudah dilakukan
+        failures: Jumlah penulisan gagal berturut-turut
+    """
+
+    MAX_RETRY_DELAY = 30.0
+
+    def __init__(self, manager, debounce: float = 0.5, max_delay: float = 5.0):
+        self.manager = manager
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.save_count = 0
+        self.failures = 0
+
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()  # satu penulisan pada satu waktu
+        self._version = 0          # naik setiap mark_dirty()
+        self._saved_version = 0    # versi terakhir yang sudah tersimpan
+        self._first_dirty: Optional[float] = None
+        self._last_dirty = 0.0
+        self._retry_at = 0.0       # penulisan berikutnya tidak sebelum waktu ini (backoff)
+        self._stopping = False
+
+        self._thread = threading.Thread(target=self._run, name="FlowTrackPersistence",
+                                        daemon=True)
+        self._thread.start()
+
+    @property
+    def dirty(self) -> bool:
+        """True jika ada mutasi yang belum tersimpan"""
+        with self._cond:
+            return self._version != self._saved_version
+
+    def mark_dirty(self):
+        """
+        Tandai ledger berubah; penulisan digabung dan dijadwalkan oleh worker
+
+        Time Complexity: O(1)
+        """
+        with self._cond:
+            now = time.monotonic()
+            if self._version == self._saved_version:
+                self._first_dirty = now
+            self._version += 1
+            self._last_dirty = now
+            self._cond.notify()
+
+    def _run(self):
+        """Loop worker: tunggu dirty, debounce, lalu tulis"""
+        while True:
+            with self._cond:
+                while not self._stopping and self._version == self._saved_version:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                # Debounce: tunggu sampai tidak ada mutasi baru selama debounce detik
+                while not self._stopping:
+                    deadline = max(min(self._last_dirty + self.debounce,
+                                       self._first_dirty + self.max_delay),
+                                   self._retry_at)
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._stopping:
+                    return
+                version = self._version
+            try:
+                self._save(version)
+            except Exception as e:
+                # Tetap dirty: diulang setelah backoff
+                print(f"Error saving data: {e}")
+
+    def _save(self, version: int):
+        """
+        Tulis ledger jika versi tersebut belum tersimpan
+
+        Raises:
+            Exception: Error penulisan; ledger tetap dirty dan backoff diperpanjang
+        """
+        with self._write_lock:
+            with self._cond:
+                if version <= self._saved_version:
+                    return
+            try:
+                self.manager._persist_now()
+            except Exception:
+                with self._cond:
+                    self.failures += 1
+                    delay = min(max(self.debounce, 0.1) * 2 ** (self.failures - 1),
+                                self.MAX_RETRY_DELAY)
+                    self._retry_at = time.monotonic() + delay
+                raise
+            with self._cond:
+                self._saved_version = max(self._saved_version, version)
+                self.save_count += 1
+                self.failures = 0
+                self._retry_at = 0.0
+                self._cond.notify_all()
+
+    def flush(self):
+        """
+        Tulis semua perubahan tertunda sekarang (sinkron, di thread pemanggil)
+
+        Raises:
+            Exception: Jika penulisan gagal (ledger tetap dirty)
+        """
+        with self._cond:
+            version = self._version
+        self._save(version)
+
+    def stop(self):
+        """
+        Flush lalu hentikan worker thread (thread tetap dihentikan walaupun
+        flush gagal; error diteruskan ke pemanggil)
+        """
+        try:
+            self.flush()
+        finally:
+            with self._cond:
+                self._stopping = True
+                self._cond.notify_all()
+            self._thread.join()
+
+    def __str__(self) -> str:
+        state = "dirty" if self.dirty else "clean"
+        return f"PersistenceWorker[{state}, {self.save_count} saves]"
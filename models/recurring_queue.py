@@ -1,7 +1,11 @@
-from typing import Optional, List
-from datetime import datetime, timedelta
+import calendar
+import heapq
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple
+from datetime import date, datetime, timedelta
 from models.transaction_node import TransactionNode
 
+ONE_WEEK = timedelta(weeks=1)
+
 
 class ScheduledTransaction:
     """
@@ -10,10 +14,14 @@ class ScheduledTransaction:
     Attributes:
         node: Original TransactionNode
         next_due_date: Tanggal kapan transaksi recurring ini harus dijalankan
+        due_ordinal: next_due_date sebagai day-ordinal (key untuk heap)
     """
+    __slots__ = ("node", "next_due_date", "due_ordinal")
+    
     def __init__(self, node: TransactionNode, next_due_date: str):
         self.node = node
         self.next_due_date = next_due_date
+        self.due_ordinal = date.fromisoformat(next_due_date).toordinal()
     
     def __str__(self) -> str:
         return f"Scheduled: {self.node.title} on {self.next_due_date}"
@@ -21,46 +29,67 @@ class ScheduledTransaction:
 
 class RecurringTransactionQueue:
     """
-    Queue untuk menyimpan Scheduled Transactions yang akan diproses
-    Menggunakan FIFO (First In First Out) principle
+    Priority queue untuk menyimpan Scheduled Transactions yang akan diproses
     
-    Data Structure: Queue (menggunakan Python list dengan append/pop(0))
-    - enqueue: O(1) - tambah ke belakang
-    - dequeue: O(n) - ambil dari depan (tapi praktis O(1) untuk single item)
-    - peek: O(1) - lihat item paling depan tanpa remove
+    Data Structure: Min-Heap (heapq) dengan key day-ordinal next_due_date,
+    sehingga jadwal yang paling cepat jatuh tempo selalu berada di root.
+    Entry heap berupa tuple (due_ordinal, seq, scheduled); seq menjaga urutan
+    FIFO untuk jadwal dengan tanggal yang sama.
     
-    Good for Demo: Menunjukkan Queue data structure dan scheduling logic
+    Time Complexities:
+        - enqueue(): O(log n)
+        - enqueue_many(): O(n + k)
+        - dequeue(): O(log n) - ambil jadwal paling awal
+        - peek(): O(1)
+        - get_due_transactions(): O(k log n) untuk k jadwal yang due
     """
     
+    RECURRENCE_TYPES = ("weekly", "monthly")
+    
     def __init__(self):
-        self.queue: List[ScheduledTransaction] = []
+        self.queue: List[Tuple[int, int, ScheduledTransaction]] = []
+        self._seq = 0
+    
+    def _entry(self, scheduled_trans: ScheduledTransaction) -> Tuple[int, int, ScheduledTransaction]:
+        """Buat entry heap (due_ordinal, seq, scheduled)"""
+        self._seq += 1
+        return (scheduled_trans.due_ordinal, self._seq, scheduled_trans)
     
     def enqueue(self, scheduled_trans: ScheduledTransaction):
         """
         Tambahkan scheduled transaction ke queue
         
-        Time Complexity: O(1)
+        Time Complexity: O(log n)
+        """
+        heapq.heappush(self.queue, self._entry(scheduled_trans))
+    
+    def enqueue_many(self, scheduled_list: Iterable[ScheduledTransaction]):
         """
-        self.queue.append(scheduled_trans)
+        Tambahkan banyak scheduled transaction lalu heapify sekali
+        
+        Time Complexity: O(n + k)
+        """
+        self.queue.extend(self._entry(scheduled) for scheduled in scheduled_list)
+        heapq.heapify(self.queue)
     
     def dequeue(self) -> Optional[ScheduledTransaction]:
         """
-        Ambil scheduled transaction dari depan queue (FIFO)
+        Ambil scheduled transaction dengan due date paling awal
         
-        Time Complexity: O(n) due to list pop(0), but practically O(1) for single item
+        Time Complexity: O(log n)
         """
-        if len(self.queue) > 0:
-            return self.queue.pop(0)
+        if self.queue:
+            return heapq.heappop(self.queue)[2]
         return None
     
     def peek(self) -> Optional[ScheduledTransaction]:
         """
-        Lihat scheduled transaction di depan tanpa menghapusnya
+        Lihat scheduled transaction paling awal tanpa menghapusnya
         
         Time Complexity: O(1)
         """
-        if len(self.queue) > 0:
-            return self.queue[0]
+        if self.queue:
+            return self.queue[0][2]
         return None
     
     def is_empty(self) -> bool:
@@ -79,27 +108,95 @@ class RecurringTransactionQueue:
         """
         return len(self.queue)
     
+    def snapshot(self) -> Tuple[List[Tuple[int, int, ScheduledTransaction]], int]:
+        """
+        Salin state queue (dipakai untuk rollback batch)
+        
+        Time Complexity: O(n)
+        """
+        return list(self.queue), self._seq
+    
+    def restore(self, state: Tuple[List[Tuple[int, int, ScheduledTransaction]], int]):
+        """Kembalikan state queue dari snapshot()"""
+        self.queue, self._seq = state
+    
     def get_due_transactions(self, today: str) -> List[ScheduledTransaction]:
         """
-        Dapatkan semua transaksi yang harus dijalankan pada tanggal tertentu
+        Dapatkan (dan keluarkan) semua transaksi yang harus dijalankan sampai tanggal tertentu
         
-        Time Complexity: O(n) dimana n adalah ukuran queue
+        Time Complexity: O(k log n) dimana k adalah jumlah transaksi yang due
         
         Args:
             today: Current date in YYYY-MM-DD format
         
         Returns:
-            List of ScheduledTransaction yang due date <= today
+            List of ScheduledTransaction yang due date <= today, terurut dari yang paling awal
         """
+        today_ordinal = date.fromisoformat(today).toordinal()
         due = []
-        i = 0
-        while i < len(self.queue):
-            if self.queue[i].next_due_date <= today:
-                due.append(self.queue.pop(i))
-            else:
-                i += 1
+        while self.queue and self.queue[0][0] <= today_ordinal:
+            due.append(heapq.heappop(self.queue)[2])
         return due
     
+    def iter_scheduled(self) -> Iterator[ScheduledTransaction]:
+        """
+        Iterasi semua jadwal tanpa mengeluarkannya dari queue (urutan heap, bukan tanggal)
+        
+        Time Complexity: O(n)
+        """
+        for _, _, scheduled in self.queue:
+            yield scheduled
+    
+    @classmethod
+    def expand(cls, scheduled: ScheduledTransaction, end_date: str) -> Iterator[date]:
+        """
+        Generator tanggal occurrence sebuah jadwal, mulai dari next_due_date
+        sampai end_date (inklusif). Occurrence dihitung lazily satu per satu.
+        
+        Args:
+            scheduled: ScheduledTransaction yang akan di-expand
+            end_date: Batas akhir YYYY-MM-DD
+        
+        Yields:
+            Tanggal occurrence (objek date), terurut naik
+        """
+        next_date = date.fromisoformat(scheduled.next_due_date)
+        end = date.fromisoformat(end_date)
+        recurrence_type = scheduled.node.recurrence_type
+        anchor_day = cls.anchor_day(scheduled.node)
+        while next_date <= end:
+            yield next_date
+            following = cls._next_date(next_date, recurrence_type, anchor_day)
+            if following <= next_date:  # recurrence_type tidak dikenal
+                return
+            next_date = following
+    
+    @classmethod
+    def expand_monthly(cls, scheduled: ScheduledTransaction,
+                       end_date: str) -> Iterator[Tuple[int, int]]:
+        """
+        Stream occurrence sebuah jadwal yang diagregasi per bulan
+        
+        Args:
+            scheduled: ScheduledTransaction yang akan di-expand
+            end_date: Batas akhir YYYY-MM-DD
+        
+        Yields:
+            Tuple (month_key, jumlah occurrence), month_key = year * 12 + month - 1,
+            terurut naik
+        """
+        current_key = None
+        count = 0
+        for occurrence in cls.expand(scheduled, end_date):
+            key = occurrence.year * 12 + occurrence.month - 1
+            if key != current_key:
+                if count:
+                    yield current_key, count
+                current_key, count = key, 0
+            count += 1
+        if count:
+            yield current_key, count
+    
     def schedule_recurring_transaction(self, node: TransactionNode, 
                                     start_date: str = None) -> None:
         """
@@ -109,7 +206,7 @@ class RecurringTransactionQueue:
             node: TransactionNode dengan is_recurring=True
             start_date: Tanggal mulai (default: hari ini)
         """
-        if not node.is_recurring or not node.recurrence_type:
+        if not node.is_recurring or node.recurrence_type not in self.RECURRENCE_TYPES:
             return
         
         start_date = start_date or datetime.now().strftime("%Y-%m-%d")
@@ -118,32 +215,82 @@ class RecurringTransactionQueue:
         scheduled = ScheduledTransaction(node, next_date)
         self.enqueue(scheduled)
     
+    def schedule_many(self, nodes: Iterable[TransactionNode],
+                      cursors: Optional[Dict[int, str]] = None) -> None:
+        """
+        Schedule banyak recurring transaction sekaligus (dipakai saat load)
+        Jadwal pertama diambil dari cursor jika ada, selain itu dihitung dari
+        tanggal masing-masing node; lalu heapify sekali
+        
+        Time Complexity: O(n + k)
+        
+        Args:
+            nodes: TransactionNode dengan is_recurring=True
+            cursors: Dictionary trans_id -> next_due_date yang tersimpan (opsional)
+        """
+        cursors = cursors or {}
+        self.enqueue_many(
+            ScheduledTransaction(
+                node,
+                cursors.get(node.trans_id) or
+                self._calculate_next_date(node.date, node.recurrence_type)
+            )
+            for node in nodes
+            if node.is_recurring and node.recurrence_type in self.RECURRENCE_TYPES
+        )
+    
     @staticmethod
-    def _calculate_next_date(current_date: str, recurrence_type: str) -> str:
+    def anchor_day(node: TransactionNode) -> int:
+        """Tanggal (hari dalam bulan) asli template, acuan jadwal bulanan"""
+        return int(node.date[8:10])
+    
+    @staticmethod
+    def _next_date(date_obj: date, recurrence_type: str,
+                   anchor_day: Optional[int] = None) -> date:
         """
-        Hitung tanggal berikutnya berdasarkan tipe recurrence
+        Hitung tanggal berikutnya (objek date) berdasarkan tipe recurrence
         
         Args:
-            current_date: Tanggal saat ini (YYYY-MM-DD)
+            date_obj: Tanggal saat ini
             recurrence_type: "monthly" atau "weekly"
+            anchor_day: Hari asli template untuk jadwal bulanan (default: hari
+                        date_obj). Tanpa anchor, jadwal tanggal 31 yang sudah
+                        di-clamp ke 29 Februari akan tetap di tanggal 29
         
         Returns:
-            Tanggal berikutnya dalam format YYYY-MM-DD
+            Tanggal berikutnya (sama dengan date_obj jika tipe tidak dikenal)
         """
-        date_obj = datetime.strptime(current_date, "%Y-%m-%d")
-        
         if recurrence_type == "weekly":
-            next_date = date_obj + timedelta(weeks=1)
-        elif recurrence_type == "monthly":
+            return date_obj + ONE_WEEK
+        if recurrence_type == "monthly":
             # Tambah 1 bulan (handle end of month dengan hati-hati)
             if date_obj.month == 12:
-                next_date = date_obj.replace(year=date_obj.year + 1, month=1)
+                year, month = date_obj.year + 1, 1
             else:
-                next_date = date_obj.replace(month=date_obj.month + 1)
-        else:
-            next_date = date_obj
+                year, month = date_obj.year, date_obj.month + 1
+            # Clamp tanggal 29-31 ke hari terakhir bulan berikutnya
+            day = anchor_day or date_obj.day
+            if day > 28:
+                day = min(day, calendar.monthrange(year, month)[1])
+            return date(year, month, day)
+        return date_obj
+    
+    @classmethod
+    def _calculate_next_date(cls, current_date: str, recurrence_type: str,
+                             anchor_day: Optional[int] = None) -> str:
+        """
+        Hitung tanggal berikutnya berdasarkan tipe recurrence
         
-        return next_date.strftime("%Y-%m-%d")
+        Args:
+            current_date: Tanggal saat ini (YYYY-MM-DD)
+            recurrence_type: "monthly" atau "weekly"
+            anchor_day: Hari asli template untuk jadwal bulanan (opsional)
+        
+        Returns:
+            Tanggal berikutnya dalam format YYYY-MM-DD
+        """
+        return cls._next_date(date.fromisoformat(current_date), recurrence_type,
+                              anchor_day).isoformat()
     
     def __str__(self) -> str:
         """Representation string"""
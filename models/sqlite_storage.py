@@ -0,0 +1,345 @@
+import sqlite3
+from typing import Dict, Iterator, List, Optional
+
+
+class SQLiteStorage:
+    """
+    Storage backend berbasis SQLite (stdlib sqlite3) untuk FinanceManager
+
+    Transaksi disimpan di tabel dengan index pada date, month, type dan
+    category. FinanceManager tidak memuat seluruh tabel saat startup: yang
+    dimuat hanya agregat per bulan (tabel month_totals, dijaga trigger),
+    transaksi bulan berjalan dan template recurring. Bulan lain dibaca saat
+    dibutuhkan lewat indexed query:
+        - tanggal/bulan: iter_month() (index month)
+        - ID: month_of() (primary key)
+        - kategori: bulan yang memuat kategori dipilih dari month_totals
+        - pengeluaran tertinggi: highest_expense_month() (index type, amount)
+        - export: iter_rows() (index date, type, category)
+
+    Semua penulisan dikumpulkan dalam satu transaksi SQLite dan baru ditulis
+    ke disk saat commit() dipanggil (batched writes).
+
+    Time Complexities:
+        - apply(): O(log n) per record (B-tree insert/update/delete + trigger agregat)
+        - iter_month(): O(log n + k) untuk k transaksi di bulan tersebut
+        - month_of(), highest_expense_month(): O(log n)
+        - load_month_totals(): O(b) untuk b baris (bulan, kategori, tipe)
+        - iter_rows(): O(log n + k) dengan filter tanggal/tipe/kategori
+
+    Attributes:
+        db_path: Path file database SQLite
+        conn: Koneksi sqlite3
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS transactions (
+            id INTEGER PRIMARY KEY,
+            date TEXT NOT NULL,
+            month TEXT NOT NULL,
+            title TEXT NOT NULL,
+            amount REAL NOT NULL,
+            type TEXT NOT NULL,
+            category TEXT NOT NULL,
+            is_recurring INTEGER NOT NULL DEFAULT 0,
+            recurrence_type TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(date);
+        CREATE INDEX IF NOT EXISTS idx_transactions_type ON transactions(type);
+        CREATE INDEX IF NOT EXISTS idx_transactions_category ON transactions(category);
+        CREATE INDEX IF NOT EXISTS idx_transactions_month ON transactions(month);
+        CREATE INDEX IF NOT EXISTS idx_transactions_type_amount ON transactions(type, amount);
+        CREATE INDEX IF NOT EXISTS idx_transactions_recurring ON transactions(id)
+            WHERE is_recurring = 1;
+        -- Agregat per (bulan, kategori, tipe), dijaga trigger di bawah
+        CREATE TABLE IF NOT EXISTS month_totals (
+            month TEXT NOT NULL,
+            category TEXT NOT NULL,
+            type TEXT NOT NULL,
+            amount REAL NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (month, category, type)
+        ) WITHOUT ROWID;
+        CREATE TRIGGER IF NOT EXISTS trg_transactions_insert AFTER INSERT ON transactions
+        BEGIN
+            INSERT INTO month_totals (month, category, type, amount, count)
+            VALUES (NEW.month, NEW.category, NEW.type, NEW.amount, 1)
+            ON CONFLICT (month, category, type)
+            DO UPDATE SET amount = amount + excluded.amount, count = count + 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_transactions_delete AFTER DELETE ON transactions
+        BEGIN
+            UPDATE month_totals SET amount = amount - OLD.amount, count = count - 1
+            WHERE month = OLD.month AND category = OLD.category AND type = OLD.type;
+            DELETE FROM month_totals
+            WHERE month = OLD.month AND category = OLD.category AND type = OLD.type
+              AND count = 0;
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_transactions_update
+        AFTER UPDATE OF month, category, type, amount ON transactions
+        BEGIN
+            UPDATE month_totals SET amount = amount - OLD.amount, count = count - 1
+            WHERE month = OLD.month AND category = OLD.category AND type = OLD.type;
+            DELETE FROM month_totals
+            WHERE month = OLD.month AND category = OLD.category AND type = OLD.type
+              AND count = 0;
+            INSERT INTO month_totals (month, category, type, amount, count)
+            VALUES (NEW.month, NEW.category, NEW.type, NEW.amount, 1)
+            ON CONFLICT (month, category, type)
+            DO UPDATE SET amount = amount + excluded.amount, count = count + 1;
+        END;
+        CREATE TABLE IF NOT EXISTS budgets (
+            month TEXT PRIMARY KEY,
+            budget_limit REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS recurring_cursor (
+            id INTEGER PRIMARY KEY,
+            next_due TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    COLUMNS = ("id", "date", "title", "amount", "type", "category",
+               "is_recurring", "recurrence_type")
+    SELECT_COLUMNS = ("SELECT id, date, title, amount, type, category, is_recurring, "
+                      "recurrence_type FROM transactions")
+
+    # Upsert (bukan INSERT OR REPLACE): REPLACE menghapus baris lama tanpa
+    # menjalankan trigger delete, sehingga month_totals akan terhitung ganda
+    UPSERT = (
+        "INSERT INTO transactions "
+        "(id, date, month, title, amount, type, category, is_recurring, recurrence_type) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT (id) DO UPDATE SET date = excluded.date, month = excluded.month, "
+        "title = excluded.title, amount = excluded.amount, type = excluded.type, "
+        "category = excluded.category, is_recurring = excluded.is_recurring, "
+        "recurrence_type = excluded.recurrence_type"
+    )
+
+    def __init__(self, db_path: str = "data.db"):
+        """
+        Args:
+            db_path: Path file database (":memory:" untuk database in-memory)
+        """
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(self.SCHEMA)
+        # Database dari versi sebelum month_totals: isi agregat sekali
+        if (self.conn.execute("SELECT NOT EXISTS (SELECT 1 FROM month_totals)").fetchone()[0] and
+                self.conn.execute("SELECT EXISTS (SELECT 1 FROM transactions)").fetchone()[0]):
+            self.conn.execute(
+                "INSERT INTO month_totals (month, category, type, amount, count) "
+                "SELECT month, category, type, SUM(amount), COUNT(*) FROM transactions "
+                "GROUP BY month, category, type"
+            )
+        self.conn.commit()
+
+    # ==================== WRITE ====================
+
+    @staticmethod
+    def _row_params(trans: dict) -> tuple:
+        """Konversi dictionary transaksi (format to_dict) ke parameter SQL"""
+        return (
+            trans["id"],
+            trans["date"],
+            trans["date"][:7],
+            trans["title"],
+            trans["amount"],
+            trans["type"],
+            trans["category"],
+            1 if trans.get("is_recurring") else 0,
+            trans.get("recurrence_type")
+        )
+
+    def apply(self, record: dict):
+        """
+        Terapkan satu record mutasi (format yang sama dengan TransactionJournal)
+
+        Perubahan belum di-commit sampai commit() dipanggil.
+
+        Args:
+            record: {"op": "insert"|"update"|"delete"|"budget"|"month"|"cursor", ...}
+        """
+        op = record.get("op")
+        if op in ("insert", "update"):
+            self.conn.execute(self.UPSERT, self._row_params(record["txn"]))
+        elif op == "delete":
+            self.conn.execute("DELETE FROM transactions WHERE id = ?", (record["id"],))
+            self.conn.execute("DELETE FROM recurring_cursor WHERE id = ?", (record["id"],))
+        elif op == "budget":
+            self.conn.execute(
+                "INSERT OR REPLACE INTO budgets (month, budget_limit) VALUES (?, ?)",
+                (record["month"], record["limit"])
+            )
+        elif op == "month":
+            self.set_meta("current_month", record["current_month"])
+        elif op == "cursor":
+            self.conn.execute(
+                "INSERT OR REPLACE INTO recurring_cursor (id, next_due) VALUES (?, ?)",
+                (record["id"], record["next_due"])
+            )
+
+    def insert_many(self, transactions: List[dict]):
+        """
+        Bulk insert transaksi dalam satu executemany (dipakai saat import JSON)
+
+        Args:
+            transactions: List of dictionary transaksi (format to_dict)
+        """
+        self.conn.executemany(self.UPSERT,
+                              (self._row_params(trans) for trans in transactions))
+
+    def set_meta(self, key: str, value: str):
+        """Simpan nilai metadata (current_month, next_id)"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    def commit(self):
+        """Commit semua perubahan yang tertunda dalam satu transaksi"""
+        self.conn.commit()
+
+    def rollback(self):
+        """Batalkan semua perubahan yang belum di-commit"""
+        self.conn.rollback()
+
+    def close(self):
+        """Commit lalu tutup koneksi database"""
+        self.conn.commit()
+        self.conn.close()
+
+    # ==================== READ ====================
+
+    def is_empty(self) -> bool:
+        """Check apakah database belum berisi transaksi maupun metadata"""
+        cur = self.conn.execute(
+            "SELECT (SELECT COUNT(*) FROM transactions) + (SELECT COUNT(*) FROM meta)"
+        )
+        return cur.fetchone()[0] == 0
+
+    def get_meta(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Ambil nilai metadata, atau default jika belum ada"""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _row_to_dict(self, row: tuple) -> dict:
+        """Konversi row SQL ke dictionary dengan format yang sama seperti to_dict()"""
+        trans = dict(zip(self.COLUMNS, row))
+        trans["is_recurring"] = bool(trans["is_recurring"])
+        return trans
+
+    def iter_month(self, month: str) -> Iterator[dict]:
+        """
+        Iterasi transaksi satu bulan oldest-first (urutan ID), lewat index month
+
+        Args:
+            month: Bulan YYYY-MM
+
+        Yields:
+            Dictionary transaksi (format to_dict)
+        """
+        cur = self.conn.execute(self.SELECT_COLUMNS + " WHERE month = ? ORDER BY id", (month,))
+        for row in cur:
+            yield self._row_to_dict(row)
+
+    def iter_recurring(self) -> Iterator[dict]:
+        """
+        Iterasi semua template recurring (partial index is_recurring)
+
+        Yields:
+            Dictionary transaksi (format to_dict)
+        """
+        cur = self.conn.execute(self.SELECT_COLUMNS + " WHERE is_recurring = 1 ORDER BY id")
+        for row in cur:
+            yield self._row_to_dict(row)
+
+    def month_of(self, trans_id: int) -> Optional[str]:
+        """Bulan (YYYY-MM) transaksi dengan ID tersebut, atau None jika tidak ada"""
+        row = self.conn.execute(
+            "SELECT month FROM transactions WHERE id = ?", (trans_id,)).fetchone()
+        return row[0] if row else None
+
+    def highest_expense_month(self) -> Optional[str]:
+        """Bulan pengeluaran terbesar (index type, amount), atau None jika tidak ada"""
+        row = self.conn.execute(
+            "SELECT month FROM transactions WHERE type = 'Expense' "
+            "ORDER BY amount DESC LIMIT 1"
+        ).fetchone()
+        return row[0] if row else None
+
+    def load_month_totals(self) -> Dict[str, Dict]:
+        """
+        Agregat per bulan dari month_totals dalam format monthly stats
+        FinanceManager: {month: {"income", "expense", "count", "by_category"}}
+        """
+        months: Dict[str, Dict] = {}
+        for month, category, trans_type, amount, count in self.conn.execute(
+                "SELECT month, category, type, amount, count FROM month_totals"):
+            stats = months.get(month)
+            if stats is None:
+                stats = months[month] = {
+                    "income": 0.0, "expense": 0.0, "count": 0, "by_category": {}
+                }
+            category_stats = stats["by_category"].get(category)
+            if category_stats is None:
+                category_stats = stats["by_category"][category] = {
+                    "income": 0.0, "expense": 0.0, "count": 0
+                }
+            key = "income" if trans_type == "Income" else "expense"
+            stats[key] += amount
+            stats["count"] += count
+            category_stats[key] += amount
+            category_stats["count"] += count
+        return months
+
+    def load_budgets(self) -> Dict[str, float]:
+        """Ambil semua budget sebagai {month: budget_limit}"""
+        return dict(self.conn.execute("SELECT month, budget_limit FROM budgets"))
+
+    def load_recurring_cursor(self) -> Dict[int, str]:
+        """Ambil schedule cursor recurring sebagai {trans_id: next_due}"""
+        return dict(self.conn.execute("SELECT id, next_due FROM recurring_cursor"))
+    
+    def iter_rows(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                  trans_type: Optional[str] = None,
+                  category: Optional[str] = None) -> Iterator[tuple]:
+        """
+        Stream baris transaksi (urutan tanggal, lalu ID) dengan filter yang dijalankan
+        sebagai indexed query (index date, type dan category)
+        
+        Args:
+            start_date: Batas bawah tanggal (inklusif, opsional)
+            end_date: Batas atas tanggal (inklusif, opsional)
+            trans_type: Filter tipe (opsional)
+            category: Filter kategori (opsional)
+        
+        Yields:
+            Tuple (id, date, title, amount, type, category, is_recurring, recurrence_type)
+        """
+        clauses, params = [], []
+        if start_date:
+            clauses.append("date >= ?")
+            params.append(start_date)
+        if end_date:
+            clauses.append("date <= ?")
+            params.append(end_date)
+        if trans_type:
+            clauses.append("type = ?")
+            params.append(trans_type)
+        if category:
+            clauses.append("category = ?")
+            params.append(category)
+        
+        sql = self.SELECT_COLUMNS
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY date, id"
+        yield from self.conn.execute(sql, params)
+    
+    def __str__(self) -> str:
+        """Representation string"""
+        count = self.conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+        return f"SQLiteStorage[{self.db_path}: {count} transactions]"
@@ -1,3 +1,4 @@
+from sys import intern
 from typing import Optional
 
 class TransactionNode:
@@ -16,19 +17,27 @@ class TransactionNode:
         recurrence_type (str): "monthly", "weekly", or None if not recurring
         next: Pointer to next node in DLL
         prev: Pointer to previous node in DLL
+    
+    Memory: __slots__ (tanpa __dict__ per instance). date, trans_type, category
+    dan recurrence_type di-intern sehingga semua node dengan nilai yang sama
+    berbagi satu objek string (satu objek per hari, bukan per transaksi).
     """
     
+    __slots__ = ("date", "title", "amount", "trans_type", "category", "trans_id",
+                 "is_recurring", "recurrence_type", "next", "prev")
+    
     def __init__(self, date: str, title: str, amount: float, 
                  trans_type: str, category: str, trans_id: int,
                  is_recurring: bool = False, recurrence_type: Optional[str] = None):
-        self.date = date
+        self.date = intern(date)
         self.title = title
         self.amount = amount
-        self.trans_type = trans_type
-        self.category = category
+        self.trans_type = intern(trans_type)
+        self.category = intern(category)
         self.trans_id = trans_id
         self.is_recurring = is_recurring
-        self.recurrence_type = recurrence_type  # "monthly" or "weekly"
+        # "monthly" or "weekly"
+        self.recurrence_type = intern(recurrence_type) if recurrence_type else recurrence_type
         
         # Doubly Linked List Pointers
         self.next: Optional[TransactionNode] = None
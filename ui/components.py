@@ -1,8 +1,10 @@
 import customtkinter as ctk
 from utils.constants import UIConstants
-from utils.helpers import CurrencyHelper
+from utils.helpers import CurrencyHelper, DateHelper
 from models.transaction_node import TransactionNode
-from typing import Callable, Optional
+from models.fenwick_tree import FenwickTree
+from models.date_index import DateIndex, DateGroupsView
+from typing import Callable, Dict, List, Optional
 
 class UIComponents:
     
@@ -172,7 +174,8 @@ class UIComponents:
 
 class TransactionCard:
 
-    def __init__(self, parent, node: TransactionNode, delete_callback, edit_callback=None):
+    def __init__(self, parent, node: TransactionNode, delete_callback, edit_callback=None,
+                 auto_pack: bool = True):
         """
         Membuat transaction card
         
@@ -181,17 +184,29 @@ class TransactionCard:
             node: TransactionNode to display
             delete_callback: Function to call when delete is clicked
             edit_callback: Function to call when edit is clicked
+            auto_pack: Jika False, card tidak di-pack (posisi diatur oleh pemanggil,
+                       misalnya VirtualTransactionFeed)
         """
         self.node = node
         self.delete_callback = delete_callback
         self.edit_callback = edit_callback
         
         # Main card frame
-        self.card = UIComponents.create_card_frame(
-            parent,
-            corner_radius=10
-        )
-        self.card.pack(fill="x", pady=3)
+        if auto_pack:
+            self.card = UIComponents.create_card_frame(
+                parent,
+                corner_radius=10
+            )
+            self.card.pack(fill="x", pady=3)
+        else:
+            # Tinggi tetap agar posisi baris di feed virtual bisa dihitung
+            # (CTk tidak menerima width/height lewat place())
+            self.card = UIComponents.create_card_frame(
+                parent,
+                corner_radius=10,
+                height=UIConstants.FEED_CARD_HEIGHT - UIConstants.FEED_ROW_GAP
+            )
+            self.card.pack_propagate(False)
         
         # Content container
         content = ctk.CTkFrame(self.card, fg_color="transparent")
@@ -202,6 +217,8 @@ class TransactionCard:
         
         # Right side: Amount & Delete button
         self._create_right_section(content)
+        
+        self.bind_node(node)
     
     def _create_left_section(self, parent):
         """Title dan kategori"""
@@ -209,61 +226,52 @@ class TransactionCard:
         left_frame.pack(side="left", fill="x", expand=True)
         
         # Title
-        title_label = ctk.CTkLabel(
+        self.title_label = ctk.CTkLabel(
             left_frame,
-            text=self.node.title,
+            text="",
             font=(UIConstants.FONT_FAMILY, 14, "bold"),
             text_color=UIConstants.TEXT_PRIMARY,
             anchor="w"
         )
-        title_label.pack(anchor="w")
+        self.title_label.pack(anchor="w")
         
         # Category
-        category_label = ctk.CTkLabel(
+        self.category_label = ctk.CTkLabel(
             left_frame,
-            text=self.node.category,
+            text="",
             font=UIConstants.FONT_TINY,
             text_color=UIConstants.TEXT_SECONDARY,
             anchor="w"
         )
-        category_label.pack(anchor="w")
+        self.category_label.pack(anchor="w")
     
     def _create_right_section(self, parent):
         """Jumlah, tombol edit dan delete"""
         right_frame = ctk.CTkFrame(parent, fg_color="transparent")
         right_frame.pack(side="right")
         
-        # Determine color and prefix
-        color = (UIConstants.INCOME_COLOR if self.node.trans_type == "Income" 
-                else UIConstants.EXPENSE_COLOR)
-        prefix = "+" if self.node.trans_type == "Income" else "-"
-        
         # Amount label
-        amount_text = CurrencyHelper.format_amount(self.node.amount, prefix)
-        amount_label = ctk.CTkLabel(
+        self.amount_label = ctk.CTkLabel(
             right_frame,
-            text=amount_text,
-            font=(UIConstants.FONT_FAMILY, 14, "bold"),
-            text_color=color
+            text="",
+            font=(UIConstants.FONT_FAMILY, 14, "bold")
         )
-        amount_label.pack()
+        self.amount_label.pack()
         
         # Button frame
         button_frame = ctk.CTkFrame(right_frame, fg_color="transparent")
         button_frame.pack(pady=(3, 0))
         
-        # Recurring badge
-        if self.node.is_recurring:
-            recurring_badge = ctk.CTkLabel(
-                button_frame,
-                text=f"🔄 {self.node.recurrence_type}",
-                font=(UIConstants.FONT_FAMILY, 9),
-                text_color=UIConstants.TEXT_SECONDARY
-            )
-            recurring_badge.pack(side="left", padx=2)
+        # Recurring badge (ditampilkan hanya untuk transaksi recurring)
+        self.recurring_badge = ctk.CTkLabel(
+            button_frame,
+            text="",
+            font=(UIConstants.FONT_FAMILY, 9),
+            text_color=UIConstants.TEXT_SECONDARY
+        )
         
         # Edit button
-        edit_btn = ctk.CTkButton(
+        self.edit_btn = ctk.CTkButton(
             button_frame,
             text="✎",
             width=30,
@@ -273,7 +281,7 @@ class TransactionCard:
             hover_color=UIConstants.BUTTON_PRIMARY_HOVER,
             command=lambda: self.edit_callback(self.node) if hasattr(self, 'edit_callback') else None
         )
-        edit_btn.pack(side="left", padx=2)
+        self.edit_btn.pack(side="left", padx=2)
         
         # Delete button
         delete_btn = ctk.CTkButton(
@@ -288,6 +296,328 @@ class TransactionCard:
         )
         delete_btn.pack(side="left", padx=2)
     
+    def bind_node(self, node: TransactionNode):
+        """
+        Tampilkan data node lain di card yang sama (widget di-recycle, tidak dibuat ulang)
+        
+        Args:
+            node: TransactionNode to display
+        """
+        self.node = node
+        self.title_label.configure(text=node.title)
+        self.category_label.configure(text=node.category)
+        
+        # Determine color and prefix
+        color = (UIConstants.INCOME_COLOR if node.trans_type == "Income" 
+                else UIConstants.EXPENSE_COLOR)
+        prefix = "+" if node.trans_type == "Income" else "-"
+        self.amount_label.configure(
+            text=CurrencyHelper.format_amount(node.amount, prefix),
+            text_color=color
+        )
+        
+        if node.is_recurring:
+            self.recurring_badge.configure(text=f"🔄 {node.recurrence_type}")
+            self.recurring_badge.pack(side="left", padx=2, before=self.edit_btn)
+        else:
+            self.recurring_badge.pack_forget()
+    
     def set_edit_callback(self, callback: Callable):
         """Set edit callback after initialization"""
-        self.edit_callback = callback
\ No newline at end of file
+        self.edit_callback = callback
+
+
+class VirtualTransactionFeed:
+    """
+    Feed transaksi tervirtualisasi: hanya baris di (dan dekat) viewport yang
+    dibuatkan widget, dan widget card/header di-recycle saat scroll.
+    
+    Feed tidak menyimpan salinan data: isi feed dibaca langsung dari
+    DateGroupsView (view di atas date index FinanceManager), sehingga feed
+    hanya mencatat tinggi setiap blok tanggal (header + card transaksi) di
+    Fenwick Tree. Blok pertama yang terlihat dicari dengan prefix search,
+    dan insert/delete/edit satu transaksi cukup mem-patch tinggi satu blok
+    tanpa membangun ulang feed. Method patch dipanggil setelah ledger
+    berubah.
+    
+    Time Complexities:
+        - set_groups(): O(d), d = jumlah tanggal
+        - insert_node() / remove_node() / update_node(): O(log d + v),
+          v = baris terlihat (O(d) jika tanggal baru muncul atau grup
+          menjadi kosong)
+        - render(): O(log d + v)
+    
+    Attributes:
+        groups: DateGroupsView tanggal -> transaksi (terbaru dulu)
+        visible_cards: Dictionary trans_id -> TransactionCard yang sedang tampil
+        visible_headers: Dictionary date -> header label yang sedang tampil
+    """
+    
+    def __init__(self, parent, delete_callback, edit_callback=None):
+        """
+        Args:
+            parent: Parent widget
+            delete_callback: Function to call when delete is clicked (trans_id)
+            edit_callback: Function to call when edit is clicked (node)
+        """
+        self.delete_callback = delete_callback
+        self.edit_callback = edit_callback
+        
+        self.frame = ctk.CTkFrame(parent, fg_color="transparent")
+        self.viewport = ctk.CTkFrame(self.frame, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(self.frame, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        
+        self.empty_label = ctk.CTkLabel(
+            self.viewport,
+            text="No transactions yet\nAdd your first transaction above!",
+            font=UIConstants.FONT_LABEL,
+            text_color=UIConstants.TEXT_SECONDARY
+        )
+        
+        self.groups = DateGroupsView(DateIndex())
+        self.block_heights = FenwickTree(0)
+        # Jumlah transaksi di index yang sudah tercermin di block_heights
+        self._synced_count = 0
+        self.scroll_y = 0
+        
+        # Widget pool yang di-recycle
+        self.card_pool: List[TransactionCard] = []
+        self.header_pool: List[ctk.CTkLabel] = []
+        self.visible_cards: Dict[int, TransactionCard] = {}
+        self.visible_headers: Dict[str, ctk.CTkLabel] = {}
+        
+        self.viewport.bind("<Configure>", lambda event: self.render())
+        self.frame.bind("<Enter>", self._bind_mousewheel)
+        self.frame.bind("<Leave>", self._unbind_mousewheel)
+    
+    def pack(self, **kwargs):
+        """Pack container feed"""
+        self.frame.pack(**kwargs)
+    
+    # ==================== DATA ====================
+    
+    @staticmethod
+    def _block_height(count: int) -> int:
+        """Tinggi satu blok tanggal: header + count card"""
+        return UIConstants.FEED_HEADER_HEIGHT + count * UIConstants.FEED_CARD_HEIGHT
+    
+    def _rebuild_blocks(self):
+        """Bangun ulang Fenwick Tree tinggi blok (saat daftar tanggal berubah)"""
+        self.block_heights.build(
+            [self._block_height(self.groups.group_size(date_str)) for date_str in self.groups]
+        )
+        self._synced_count = self.groups.index.count
+    
+    def set_groups(self, date_groups: DateGroupsView):
+        """
+        Tampilkan isi view group_by_date (tanpa copy dan tanpa membuat widget)
+        
+        Args:
+            date_groups: DateGroupsView dari FinanceManager.group_by_date()
+        """
+        self.groups = date_groups
+        self._rebuild_blocks()
+        self.render()
+    
+    def _patch_block(self, date_str: str, delta: int):
+        """
+        Sesuaikan tinggi blok date_str setelah satu transaksi masuk (delta=1)
+        atau keluar (delta=-1); rebuild jika tanggal muncul atau hilang
+        """
+        self._synced_count += delta
+        size = self.groups.group_size(date_str)
+        if size == 0 or (delta > 0 and size == 1):
+            self._rebuild_blocks()
+        else:
+            self.block_heights.add(self.groups.position(date_str),
+                                   delta * UIConstants.FEED_CARD_HEIGHT)
+    
+    def insert_node(self, node: TransactionNode):
+        """
+        Tampilkan satu transaksi baru (sudah ada di ledger), patch satu blok
+        
+        Args:
+            node: TransactionNode baru
+        """
+        self._patch_block(node.date, 1)
+        self.render()
+    
+    def insert_nodes(self, nodes: List[TransactionNode]):
+        """
+        Tampilkan banyak transaksi baru sekaligus (mis. hasil materialisasi
+        recurring): tinggi blok dibangun ulang dan feed di-render sekali
+        
+        Args:
+            nodes: List of TransactionNode baru
+        """
+        self._rebuild_blocks()
+        self.render()
+    
+    def remove_node(self, node: TransactionNode):
+        """
+        Hapus satu transaksi (sudah dihapus dari ledger) dari feed
+        
+        Args:
+            node: TransactionNode yang dihapus
+        """
+        self._patch_block(node.date, -1)
+        self.render()
+    
+    def update_node(self, node: TransactionNode, old_date: Optional[str] = None):
+        """
+        Tampilkan perubahan satu transaksi (pindah blok jika tanggal berubah)
+        
+        Args:
+            node: TransactionNode yang sudah di-update
+            old_date: Tanggal sebelum update (default: tidak berubah)
+        """
+        if old_date is not None and old_date != node.date:
+            self._patch_block(old_date, -1)
+            self._patch_block(node.date, 1)
+            self.render()
+            return
+        card = self.visible_cards.get(node.trans_id)
+        if card:
+            card.bind_node(node)
+    
+    # ==================== RENDER ====================
+    
+    def _viewport_height(self) -> int:
+        return max(self.viewport.winfo_height(), 1)
+    
+    def _total_height(self) -> int:
+        return int(self.block_heights.prefix_sum(self.block_heights.size - 1))
+    
+    def render(self):
+        """
+        Tempatkan widget hanya untuk baris di dalam viewport (+ overscan)
+        
+        Time Complexity: O(log d + v) dimana v adalah jumlah baris terlihat
+        """
+        if self.groups.index.count != self._synced_count:
+            # Ledger berubah tanpa patch (mis. bulan dimuat lazy): sinkronkan ulang
+            self._rebuild_blocks()
+        block_count = self.block_heights.size
+        if not block_count:
+            self._hide_unused(0, 0)
+            self.visible_cards = {}
+            self.visible_headers = {}
+            self.empty_label.place(relx=0.5, y=50, anchor="n")
+            self.scrollbar.set(0.0, 1.0)
+            return
+        self.empty_label.place_forget()
+        
+        height = self._viewport_height()
+        total = self._total_height()
+        self.scroll_y = max(0, min(self.scroll_y, total - height))
+        
+        overscan = UIConstants.FEED_OVERSCAN * UIConstants.FEED_CARD_HEIGHT
+        top = max(self.scroll_y - overscan, 0)
+        bottom = self.scroll_y + height + overscan
+        
+        # Blok tanggal pertama yang terlihat
+        block = self.block_heights.find_prefix(top)
+        y = int(self.block_heights.prefix_sum(block - 1))
+        
+        cards: Dict[int, TransactionCard] = {}
+        headers: Dict[str, ctk.CTkLabel] = {}
+        while block < block_count and y < bottom:
+            date_str = self.groups.date_at(block)
+            if y + UIConstants.FEED_HEADER_HEIGHT > top:
+                widget = self._header_widget(len(headers))
+                widget.configure(text=DateHelper.format_date_header(date_str))
+                widget.place(x=0, y=y - self.scroll_y, relwidth=1.0)
+                headers[date_str] = widget
+            y += UIConstants.FEED_HEADER_HEIGHT
+            
+            # Lewati card di atas viewport dengan aritmatika, bukan iterasi
+            first = max((top - y) // UIConstants.FEED_CARD_HEIGHT, 0)
+            y += first * UIConstants.FEED_CARD_HEIGHT
+            for node in self.groups.iter_group(date_str, first):
+                if y >= bottom:
+                    break
+                card = self._card_widget(len(cards), node)
+                if card.node is not node:
+                    card.bind_node(node)
+                card.card.place(x=0, y=y - self.scroll_y, relwidth=1.0)
+                cards[node.trans_id] = card
+                y += UIConstants.FEED_CARD_HEIGHT
+            else:
+                block += 1
+                continue
+            break
+        
+        self._hide_unused(len(cards), len(headers))
+        self.visible_cards = cards
+        self.visible_headers = headers
+        
+        if total > 0:
+            self.scrollbar.set(self.scroll_y / total, min((self.scroll_y + height) / total, 1.0))
+    
+    def _card_widget(self, i: int, node: TransactionNode) -> TransactionCard:
+        """Ambil card ke-i dari pool, buat baru (untuk node) jika pool belum cukup"""
+        if i == len(self.card_pool):
+            self.card_pool.append(TransactionCard(
+                self.viewport, node, self.delete_callback, self.edit_callback,
+                auto_pack=False
+            ))
+        return self.card_pool[i]
+    
+    def _header_widget(self, i: int) -> ctk.CTkLabel:
+        """Ambil header ke-i dari pool, buat baru jika pool belum cukup"""
+        if i == len(self.header_pool):
+            self.header_pool.append(ctk.CTkLabel(
+                self.viewport,
+                text="",
+                height=UIConstants.FEED_HEADER_HEIGHT - UIConstants.FEED_ROW_GAP,
+                font=(UIConstants.FONT_FAMILY, 13, "bold"),
+                text_color=UIConstants.TEXT_SECONDARY,
+                anchor="w"
+            ))
+        return self.header_pool[i]
+    
+    def _hide_unused(self, cards_used: int, headers_used: int):
+        """Sembunyikan widget pool yang tidak dipakai pada render ini"""
+        for card in self.card_pool[cards_used:len(self.visible_cards)]:
+            card.card.place_forget()
+        for header in self.header_pool[headers_used:len(self.visible_headers)]:
+            header.place_forget()
+    
+    # ==================== SCROLL ====================
+    
+    def scroll_to(self, y: int):
+        """Scroll ke offset y (pixel) lalu render"""
+        self.scroll_y = y
+        self.render()
+    
+    def _on_scrollbar(self, *args):
+        """Handler command CTkScrollbar ("moveto", fraction) / ("scroll", n, "units")"""
+        total = self._total_height()
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * total))
+        elif args[0] == "scroll":
+            step = UIConstants.FEED_CARD_HEIGHT
+            if len(args) > 2 and args[2] == "pages":
+                step = self._viewport_height()
+            self.scroll_to(self.scroll_y + int(args[1]) * step)
+    
+    def _on_mousewheel(self, event):
+        if getattr(event, "num", None) == 4:
+            direction = -1
+        elif getattr(event, "num", None) == 5:
+            direction = 1
+        else:
+            direction = -1 if event.delta > 0 else 1
+        self.scroll_to(self.scroll_y + direction * UIConstants.FEED_CARD_HEIGHT)
+    
+    def _bind_mousewheel(self, event=None):
+        self.frame.bind_all("<MouseWheel>", self._on_mousewheel)
+        self.frame.bind_all("<Button-4>", self._on_mousewheel)
+        self.frame.bind_all("<Button-5>", self._on_mousewheel)
+    
+    def _unbind_mousewheel(self, event=None):
+        self.frame.unbind_all("<MouseWheel>")
+        self.frame.unbind_all("<Button-4>")
+        self.frame.unbind_all("<Button-5>")
@@ -1,8 +1,9 @@
 import customtkinter as ctk
+from tkinter import filedialog
 from models.finance_manager import FinanceManager
 from utils.constants import UIConstants
 from utils.helpers import DateHelper, CurrencyHelper
-from ui.components import UIComponents, TransactionCard
+from ui.components import UIComponents, VirtualTransactionFeed
 from datetime import datetime
 import os
 
@@ -14,7 +15,9 @@ class FinanceApp(ctk.CTk):
     def __init__(self):
         super().__init__()
 
-        self.manager = FinanceManager()
+        # Penulisan ke disk dilakukan PersistenceWorker (tidak memblokir main thread)
+        self.manager = FinanceManager(journal_mode=True, background_save=True,
+                                      save_debounce=UIConstants.SAVE_DEBOUNCE_SECONDS)
 
         self.title("FlowTrack - Personal Finance Manager")
         self.geometry(f"{UIConstants.WINDOW_WIDTH}x{UIConstants.WINDOW_HEIGHT}")
@@ -25,9 +28,26 @@ class FinanceApp(ctk.CTk):
         self.configure(fg_color=UIConstants.DARK_BG)
 
         self.widgets = {}
+        # Nilai terakhir yang ditampilkan per widget (agar configure hanya saat berubah)
+        self._widget_state = {}
+        self._history_snapshot = None
 
         self._create_ui()
+        # Posting transaksi recurring yang terlewat sejak aplikasi terakhir dibuka
+        self.manager.materialize_recurring()
         self.refresh_display()
+        self.after(UIConstants.RECURRING_CHECK_INTERVAL_MS, self._process_recurring)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        """Flush semua perubahan tertunda ke disk sebelum jendela ditutup"""
+        try:
+            self.manager.close()
+        except Exception as e:
+            # Jendela tetap terbuka agar data tidak hilang; tutup lagi untuk retry
+            self._show_error(f"Gagal menyimpan data: {e}")
+            return
+        self.destroy()
 
     # ==================== FORMAT ANGKA OTOMATIS ====================
     def _format_amount(self, event=None):
@@ -94,6 +114,16 @@ class FinanceApp(ctk.CTk):
         )
         export_btn.pack(fill="x", pady=5)
 
+        import_btn = UIComponents.create_button(
+            button_frame,
+            "📥 Import CSV",
+            self.import_transactions,
+            style="primary",
+            height=35,
+            font=(UIConstants.FONT_FAMILY, 12, "bold")
+        )
+        import_btn.pack(fill="x", pady=5)
+
     # ==================== HEADER SECTION ====================
     def _create_header_section(self, parent):
         header_frame = ctk.CTkFrame(parent, fg_color="transparent")
@@ -302,15 +332,18 @@ class FinanceApp(ctk.CTk):
         ctk.CTkLabel(parent, text="Riwayat Transaksi", font=UIConstants.FONT_TITLE,
                      text_color=UIConstants.TEXT_PRIMARY).pack(anchor="w", pady=(10, 10))
 
-        self.widgets["scrollable_frame"] = ctk.CTkScrollableFrame(parent, fg_color="transparent")
-        self.widgets["scrollable_frame"].pack(fill="both", expand=True)
+        # Feed tervirtualisasi: hanya baris yang terlihat yang punya widget
+        self.widgets["transaction_feed"] = VirtualTransactionFeed(
+            parent, self.delete_transaction, self.edit_transaction
+        )
+        self.widgets["transaction_feed"].pack(fill="both", expand=True)
 
     # ==================== EVENT HANDLERS ====================
     def add_transaction(self):
         try:
             date = self.widgets["date_entry"].get().strip()
             title = self.widgets["title_entry"].get().strip()
-            amount_str = self.widgets["amount_entry"].get().replace(".", "").strip()
+            amount_str = self.widgets["amount_entry"].get().strip()
             trans_type = self.widgets["type_var"].get()
             category = self.widgets["category_entry"].get().strip()
             is_recurring = self.widgets["recurring_var"].get() == 1
@@ -320,16 +353,17 @@ class FinanceApp(ctk.CTk):
                 self._show_error("All fields are required")
                 return
 
-            amount = float(amount_str)
+            amount = CurrencyHelper.parse_amount(amount_str)
             if amount <= 0:
                 self._show_error("Amount must be positive")
                 return
 
-            self.manager.insert_at_head(date, title, amount, trans_type, category,
-                                       is_recurring, recurrence_type)
-            self.manager.save_to_file()
+            node = self.manager.insert_at_head(date, title, amount, trans_type, category,
+                                              is_recurring, recurrence_type)
+            self.manager.persist()
             self._clear_form()
-            self.refresh_display()
+            self.widgets["transaction_feed"].insert_node(node)
+            self._refresh_summary()
 
         except ValueError:
             self._show_error("Invalid amount. Please enter a number.")
@@ -339,8 +373,9 @@ class FinanceApp(ctk.CTk):
         node = self.manager.find_node_by_id(trans_id)
         if node:
             self.manager.delete_node(node)
-            self.manager.save_to_file()
-            self.refresh_display()
+            self.manager.persist()
+            self.widgets["transaction_feed"].remove_node(node)
+            self._refresh_summary()
 
     def edit_transaction(self, node):
         """Open edit modal for transaction"""
@@ -357,6 +392,24 @@ class FinanceApp(ctk.CTk):
         except Exception as e:
             self._show_error(f"Export error: {str(e)}")
 
+    def import_transactions(self):
+        """Import transaksi dari CSV (format export atau mutasi bank)"""
+        filename = filedialog.askopenfilename(
+            title="Import CSV",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+        try:
+            result = self.manager.import_from_csv(filename)
+            self.refresh_display()
+            self._show_error(
+                f"✓ Imported {result['rows']:,} rows ({result['rows_per_sec']:,.0f} rows/s), "
+                f"{result['skipped']:,} skipped"
+            )
+        except Exception as e:
+            self._show_error(f"Import error: {str(e)}")
+
     def set_monthly_budget(self):
         """Set budget untuk bulan ini"""
         try:
@@ -371,10 +424,10 @@ class FinanceApp(ctk.CTk):
                 return
             
             current_month = datetime.now().strftime("%Y-%m")
-            self.manager.budget_bst.insert(current_month, budget)
-            self.manager.save_to_file()
+            self.manager.set_budget(current_month, budget)
+            self.manager.persist()
             self.widgets["budget_entry"].delete(0, "end")
-            self.refresh_display()
+            self._refresh_summary()
             self._show_error(f"✅ Anggaran {CurrencyHelper.format_amount(budget)} untuk bulan ini berhasil diatur")
         except ValueError:
             self._show_error("❌ Masukkan angka yang valid")
@@ -441,17 +494,19 @@ class FinanceApp(ctk.CTk):
             try:
                 new_date = date_entry.get().strip()
                 new_title = title_entry.get().strip()
-                new_amount = float(amount_entry.get().replace(".", "").strip())
+                new_amount = CurrencyHelper.parse_amount(amount_entry.get())
                 new_category = category_entry.get().strip()
 
                 if not all([new_date, new_title, new_amount, new_category]):
                     self._show_error("All fields are required")
                     return
 
+                old_date = node.date
                 self.manager.update_node(node, new_date, new_title, new_amount,
                                         category=new_category)
-                self.manager.save_to_file()
-                self.refresh_display()
+                self.manager.persist()
+                self.widgets["transaction_feed"].update_node(node, old_date)
+                self._refresh_summary()
                 modal.destroy()
                 self._show_error("✓ Transaction updated")
             except ValueError:
@@ -480,37 +535,47 @@ class FinanceApp(ctk.CTk):
 
     # ==================== UI UPDATES ====================
     def refresh_display(self):
+        """Refresh penuh: ringkasan + seluruh feed (startup)"""
+        self._refresh_summary()
+
+        # Feed membaca view date index secara langsung (tanpa copy dan tanpa sort)
+        self.widgets["transaction_feed"].set_groups(self.manager.group_by_date())
+
+    def _refresh_summary(self):
+        """Update balance, highest expense, budget dan history (hanya widget yang berubah)"""
         # Check dan reset monthly jika bulan berubah
         if self.manager.check_and_reset_monthly():
             self._show_error("🗓️ Bulan baru dimulai! Total pemasukan dan pengeluaran telah direset.")
-            self.manager.save_to_file()
+            self.manager.persist()
         
         stats = self.manager.get_stats()
 
-        self.widgets["balance_value"].configure(text=CurrencyHelper.format_amount(stats["balance"]))
-        self.widgets["income_value"].configure(text=CurrencyHelper.format_amount(stats["total_income"]))
-        self.widgets["expense_value"].configure(text=CurrencyHelper.format_amount(stats["total_expense"]))
+        self._configure_widget("balance_value", text=CurrencyHelper.format_amount(stats["balance"]))
+        self._configure_widget("income_value", text=CurrencyHelper.format_amount(stats["total_income"]))
+        self._configure_widget("expense_value", text=CurrencyHelper.format_amount(stats["total_expense"]))
 
         highest = self.manager.get_highest_expense()
         if highest:
-            self.widgets["highest_expense"].configure(
+            self._configure_widget(
+                "highest_expense",
                 text=CurrencyHelper.format_amount(highest.amount),
                 text_color=UIConstants.EXPENSE_COLOR)
         else:
-            self.widgets["highest_expense"].configure(
+            self._configure_widget(
+                "highest_expense",
                 text="-",
                 text_color=UIConstants.TEXT_SECONDARY)
 
         # Update budget display
         current_month = datetime.now().strftime("%Y-%m")
-        budget_node = self.manager.budget_bst.search(current_month)
+        budget_node = self.manager.get_budget(current_month)
         if budget_node:
             remaining = budget_node.get_remaining()
             percentage = budget_node.get_percentage()
             
             # Update progress bar
             progress_value = min(percentage / 100, 1.0)
-            self.widgets["budget_progress"].set(progress_value)
+            self._set_progress("budget_progress", progress_value)
             
             # Update status label with color warning
             if budget_node.is_over_budget():
@@ -523,10 +588,11 @@ class FinanceApp(ctk.CTk):
                 status_color = UIConstants.INCOME_COLOR
                 status_text = f"✓ {CurrencyHelper.format_amount(remaining)} remaining ({percentage:.0f}%)"
             
-            self.widgets["budget_status"].configure(text=status_text, text_color=status_color)
+            self._configure_widget("budget_status", text=status_text, text_color=status_color)
         else:
-            self.widgets["budget_progress"].set(0.0)
-            self.widgets["budget_status"].configure(
+            self._set_progress("budget_progress", 0.0)
+            self._configure_widget(
+                "budget_status",
                 text="No budget set",
                 text_color=UIConstants.TEXT_SECONDARY
             )
@@ -534,50 +600,25 @@ class FinanceApp(ctk.CTk):
         # Update Monthly History Display
         self._refresh_monthly_history()
 
-        for widget in self.widgets["scrollable_frame"].winfo_children():
-            widget.destroy()
-
-        date_groups = self.manager.group_by_date()
+    def _process_recurring(self):
+        """Timer: posting transaksi recurring yang jatuh tempo lalu jadwalkan ulang"""
+        nodes = self.manager.materialize_recurring()
+        if nodes:
+            self.widgets["transaction_feed"].insert_nodes(nodes)
+            self._refresh_summary()
+        self.after(UIConstants.RECURRING_CHECK_INTERVAL_MS, self._process_recurring)
 
-        if not date_groups:
-            empty_label = ctk.CTkLabel(
-                self.widgets["scrollable_frame"],
-                text="No transactions yet\nAdd your first transaction above!",
-                font=UIConstants.FONT_LABEL,
-                text_color=UIConstants.TEXT_SECONDARY
-            )
-            empty_label.pack(pady=50)
+    def _refresh_monthly_history(self):
+        """Update monthly history display (dibangun ulang hanya jika datanya berubah)"""
+        # Get monthly history dari manager
+        history = self.manager.monthly_history
+        if history == self._history_snapshot:
             return
+        self._history_snapshot = history
 
-        sorted_dates = sorted(date_groups.keys(), reverse=True)
-
-        for date_str in sorted_dates:
-            date_header = DateHelper.format_date_header(date_str)
-            header_label = ctk.CTkLabel(
-                self.widgets["scrollable_frame"],
-                text=date_header,
-                font=(UIConstants.FONT_FAMILY, 13, "bold"),
-                text_color=UIConstants.TEXT_SECONDARY,
-                anchor="w"
-            )
-            header_label.pack(fill="x", pady=(10, 5))
-
-            for node in date_groups[date_str]:
-                card = TransactionCard(
-                    self.widgets["scrollable_frame"],
-                    node,
-                    self.delete_transaction,
-                    self.edit_transaction
-                )
-
-    def _refresh_monthly_history(self):
-        """Update monthly history display"""
         # Clear existing widgets
         for widget in self.widgets["monthly_history_frame"].winfo_children():
             widget.destroy()
-
-        # Get monthly history dari manager
-        history = self.manager.monthly_history
         
         if not history:
             # Tampilkan pesan jika tidak ada history
@@ -649,6 +690,18 @@ class FinanceApp(ctk.CTk):
             ).pack(anchor="w", pady=(1, 0))
 
     # ==================== HELPER METHODS ====================
+    def _configure_widget(self, name: str, **kwargs):
+        """Configure widget hanya jika nilai yang ditampilkan berubah"""
+        if self._widget_state.get(name) != kwargs:
+            self._widget_state[name] = kwargs
+            self.widgets[name].configure(**kwargs)
+
+    def _set_progress(self, name: str, value: float):
+        """Set progress bar hanya jika nilainya berubah"""
+        if self._widget_state.get(name) != value:
+            self._widget_state[name] = value
+            self.widgets[name].set(value)
+
     def _clear_form(self):
         self.widgets["title_entry"].delete(0, "end")
         self.widgets["amount_entry"].delete(0, "end")
@@ -13,6 +13,18 @@ class UIConstants:
     WINDOW_WIDTH = 1100
     WINDOW_HEIGHT = 700
     
+    # Virtualized transaction feed (tinggi baris dalam pixel)
+    FEED_CARD_HEIGHT = 76
+    FEED_HEADER_HEIGHT = 36
+    FEED_ROW_GAP = 6
+    FEED_OVERSCAN = 3
+    
+    # Interval pengecekan transaksi recurring yang jatuh tempo
+    RECURRING_CHECK_INTERVAL_MS = 60_000
+    
+    # Jeda debounce penyimpanan di background (mutasi beruntun digabung)
+    SAVE_DEBOUNCE_SECONDS = 0.5
+    
     FONT_FAMILY = "Roboto"
     FONT_TITLE = ("Roboto", 18, "bold")
     FONT_BALANCE = ("Roboto", 32, "bold")
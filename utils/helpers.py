@@ -41,4 +41,34 @@ class CurrencyHelper:
         """
         if prefix:
             return f"{prefix} Rp {amount:,.0f}"
-        return f"Rp {amount:,.0f}"
\ No newline at end of file
+        return f"Rp {amount:,.0f}"
+    
+    @staticmethod
+    def parse_amount(text: str) -> float:
+        """
+        Parse jumlah format Indonesia (titik sebagai pemisah ribuan, koma
+        sebagai desimal), misalnya "Rp 1.500.000", "-50.000" atau "12.500,50".
+        Satu titik tanpa koma yang tidak diikuti tepat 3 digit dibaca sebagai
+        desimal ("50000.0", "12.5"), sehingga angka float biasa tetap benar.
+        Args:
+            text: Amount string
+        Returns:
+            Amount as float (negatif jika diawali "-" atau dalam kurung)
+        Raises:
+            ValueError: Jika text bukan angka yang valid
+        """
+        value = text.strip().replace("Rp", "").replace("rp", "").replace(" ", "")
+        negative = False
+        if value.startswith("(") and value.endswith(")"):
+            negative, value = True, value[1:-1]
+        if value.startswith("-"):
+            negative, value = not negative, value[1:]
+        elif value.startswith("+"):
+            value = value[1:]
+        
+        if "," in value or value.count(".") != 1 or len(value.rsplit(".", 1)[1]) == 3:
+            value = value.replace(".", "").replace(",", ".")
+        if not value:
+            raise ValueError(f"Invalid amount: {text!r}")
+        amount = float(value)
+        return -amount if negative else amount
@@ -5,9 +5,12 @@ FlowTrack Feature Verification Script
 Menjalankan tes untuk memverifikasi semua fitur yang ditambahkan.
 """
 
+import json
 import os
+import shutil
 import sys
-from datetime import datetime
+import tempfile
+from datetime import date, datetime, timedelta
 
 def print_header(title):
     print("\n" + "=" * 60)
@@ -260,6 +263,603 @@ def test_data_persistence():
         print_error(f"Data persistence test failed: {e}")
         return False
 
+def test_daily_totals_backdated():
+    """Test Fenwick Tree total harian dengan insert back-dated"""
+    print_header("9. Testing Daily Totals (Back-dated Inserts)")
+    
+    try:
+        from models import FinanceManager
+        
+        with tempfile.TemporaryDirectory() as workdir:
+            manager = FinanceManager(os.path.join(workdir, "data.json"))
+            start = date(2025, 6, 1)
+            for i in range(400):
+                day = (start - timedelta(days=i)).isoformat()
+                manager.insert_at_head(day, "Back-dated", 1000, "Expense", "Test")
+            
+            # Kapasitas tumbuh amortized, bukan eksponensial per hari
+            size = manager.daily_totals.expense.size
+            assert size <= 4 * 1024, f"capacity grew to {size} slots"
+            print_success(f"400 back-dated days, capacity {size} slots")
+            
+            totals = manager.range_totals("2024-01-01", "2025-12-31")
+            assert totals["expense"] == 400 * 1000
+            first_week = manager.range_totals((start - timedelta(days=6)).isoformat(),
+                                              start.isoformat())
+            assert first_week["expense"] == 7 * 1000
+            print_success(f"range_totals correct: {totals['expense']:.0f}")
+        
+        return True
+    except Exception as e:
+        print_error(f"Daily totals test failed: {e}")
+        return False
+
+def test_csv_round_trip():
+    """Test export_to_csv lalu import_from_csv menghasilkan jumlah yang sama"""
+    print_header("10. Testing CSV Export -> Import Round-trip")
+    
+    try:
+        from models import FinanceManager
+        from utils.helpers import CurrencyHelper
+        
+        with tempfile.TemporaryDirectory() as workdir:
+            source = FinanceManager(os.path.join(workdir, "source.json"))
+            amounts = [50000.0, 1234567.5, 1.125, 99.99]
+            for i, amount in enumerate(amounts):
+                source.insert_at_head(f"2025-01-0{i + 1}", f"Item {i}", amount,
+                                      "Income" if i % 2 else "Expense", "Test")
+            csv_file = os.path.join(workdir, "export.csv")
+            assert source.export_to_csv(csv_file)
+            
+            target = FinanceManager(os.path.join(workdir, "target.json"))
+            result = target.import_from_csv(csv_file)
+            assert result["rows"] == len(amounts) and result["skipped"] == 0
+            imported = sorted((node.date, node.amount, node.trans_type)
+                              for node in target.get_all_transactions())
+            original = sorted((node.date, node.amount, node.trans_type)
+                              for node in source.get_all_transactions())
+            assert imported == original, f"{imported} != {original}"
+            print_success(f"Round-trip preserved {len(amounts)} amounts")
+        
+        assert CurrencyHelper.parse_amount("Rp 1.500.000") == 1500000
+        assert CurrencyHelper.parse_amount("12.500,50") == 12500.5
+        assert CurrencyHelper.parse_amount("50000.0") == 50000
+        print_success("parse_amount: thousands and decimal separators OK")
+        
+        return True
+    except Exception as e:
+        print_error(f"CSV round-trip test failed: {e}")
+        return False
+
+def test_recurring_materialization():
+    """Test materialize_recurring: catch-up, anchor tanggal 31, tipe tidak dikenal"""
+    print_header("11. Testing Recurring Materialization")
+    
+    try:
+        from models import FinanceManager
+        
+        with tempfile.TemporaryDirectory() as workdir:
+            data_file = os.path.join(workdir, "data.json")
+            manager = FinanceManager(data_file)
+            manager.insert_at_head("2024-01-31", "Sewa", 1000000, "Expense", "Kos",
+                                   is_recurring=True, recurrence_type="monthly")
+            posted = manager.materialize_recurring("2024-06-30")
+            dates = [node.date for node in posted]
+            assert dates == ["2024-02-29", "2024-03-31", "2024-04-30",
+                             "2024-05-31", "2024-06-30"], dates
+            print_success(f"Monthly on the 31st keeps its anchor day: {dates}")
+            
+            # Idempotent: occurrence yang sama tidak diposting dua kali setelah restart
+            manager.save_to_file()
+            reloaded = FinanceManager(data_file)
+            assert reloaded.materialize_recurring("2024-06-30") == []
+            assert len(reloaded.materialize_recurring("2024-07-31")) == 1
+            print_success("Schedule cursor survives restart")
+            
+            try:
+                manager.insert_at_head("2024-01-01", "Tahunan", 1, "Expense", "Test",
+                                       is_recurring=True, recurrence_type="yearly")
+                raise AssertionError("unsupported recurrence_type was accepted")
+            except ValueError:
+                print_success("Unsupported recurrence_type rejected")
+        
+        return True
+    except Exception as e:
+        print_error(f"Recurring materialization test failed: {e}")
+        return False
+
+def test_journal_crash_recovery():
+    """Test replay journal setelah crash di antara snapshot dan truncate"""
+    print_header("12. Testing Journal Replay After Crash")
+    
+    try:
+        from models import FinanceManager
+        
+        with tempfile.TemporaryDirectory() as workdir:
+            data_file = os.path.join(workdir, "data.json")
+            journal_file = data_file + ".journal"
+            manager = FinanceManager(data_file, journal_mode=True)
+            manager.insert_at_head("2025-01-01", "Gaji", 5000000, "Income", "Salary")
+            manager.insert_at_head("2025-01-02", "Makan", 50000, "Expense", "Food")
+            manager.persist()
+            
+            # Crash setelah os.replace snapshot, sebelum journal dikosongkan:
+            # journal lama dikembalikan di samping snapshot baru
+            shutil.copy(journal_file, journal_file + ".before")
+            manager.compact()
+            manager.close()
+            shutil.copy(journal_file + ".before", journal_file)
+            
+            recovered = FinanceManager(data_file, journal_mode=True)
+            count = len(recovered.get_all_transactions())
+            assert count == 2, f"{count} transactions after replay"
+            assert recovered.monthly_stats["2025-01"]["count"] == 2
+            assert recovered.monthly_stats["2025-01"]["income"] == 5000000
+            print_success("Stale journal skipped: 2 transactions, stats not doubled")
+            
+            recovered.insert_at_head("2025-01-03", "Kopi", 20000, "Expense", "Food")
+            recovered.persist()
+            recovered.close()
+            reloaded = FinanceManager(data_file, journal_mode=True)
+            assert len(reloaded.get_all_transactions()) == 3
+            print_success("New journal records replayed after recovery")
+        
+        return True
+    except Exception as e:
+        print_error(f"Journal crash recovery test failed: {e}")
+        return False
+
+def test_background_save_failure():
+    """Test close() melaporkan penulisan yang gagal dan ledger tetap dirty"""
+    print_header("13. Testing Background Save Failure Handling")
+    
+    try:
+        from models import FinanceManager
+        
+        with tempfile.TemporaryDirectory() as workdir:
+            data_dir = os.path.join(workdir, "data")
+            os.makedirs(data_dir)
+            data_file = os.path.join(data_dir, "data.json")
+            manager = FinanceManager(data_file, background_save=True, save_debounce=0.05)
+            manager.insert_at_head("2025-01-01", "Gaji", 5000000, "Income", "Salary")
+            worker = manager.persistence_worker
+            shutil.rmtree(data_dir)
+            manager.persist()
+            
+            try:
+                manager.close()
+                raise AssertionError("close() succeeded without writing data")
+            except OSError:
+                print_success("close() raises when the final write fails")
+            assert worker.dirty and worker.failures >= 1
+            
+            os.makedirs(data_dir)
+            manager.close()
+            assert len(FinanceManager(data_file).get_all_transactions()) == 1
+            print_success("Retry after failure writes the ledger")
+        
+        return True
+    except Exception as e:
+        print_error(f"Background save failure test failed: {e}")
+        return False
+
+def test_batch_rollback():
+    """Test exception di dalam batch() membatalkan semua mutasi"""
+    print_header("14. Testing Batch Rollback")
+    
+    try:
+        from models import FinanceManager
+        
+        with tempfile.TemporaryDirectory() as workdir:
+            data_file = os.path.join(workdir, "data.json")
+            manager = FinanceManager(data_file)
+            salary = manager.insert_at_head("2025-01-01", "Gaji", 5000000, "Income", "Salary")
+            lunch = manager.insert_at_head("2025-01-05", "Makan", 50000, "Expense", "Food")
+            manager.persist()
+            with open(data_file, 'rb') as f:
+                saved = f.read()
+            
+            stats_before = json.dumps(manager.monthly_stats, sort_keys=True)
+            totals_before = manager.range_totals("2025-01-01", "2025-12-31")
+            
+            try:
+                with manager.batch():
+                    manager.insert_at_head("2024-12-20", "Laptop", 9000000, "Expense", "Tech")
+                    manager.delete_node(salary)
+                    manager.update_node(lunch, date="2025-02-01", amount=75000, category="Dinner")
+                    manager.set_budget("2025-01", 1000000)
+                    raise RuntimeError("abort")
+            except RuntimeError:
+                pass
+            
+            transactions = manager.get_all_transactions()
+            assert [node.trans_id for node in transactions] == [lunch.trans_id, salary.trans_id]
+            assert (lunch.date, lunch.amount, lunch.category) == ("2025-01-05", 50000, "Food")
+            assert manager.find_node_by_id(salary.trans_id) is salary
+            print_success("DLL, ID index and node fields restored")
+            
+            assert json.dumps(manager.monthly_stats, sort_keys=True) == stats_before
+            assert manager.range_totals("2025-01-01", "2025-12-31") == totals_before
+            assert manager.range_totals("2024-12-01", "2024-12-31")["expense"] == 0
+            assert manager.get_highest_expense() is lunch
+            assert list(manager.group_by_date()) == ["2025-01-05", "2025-01-01"]
+            assert manager.get_category_totals("Dinner")["count"] == 0
+            assert manager.budget_bst.search("2025-01") is None
+            print_success("Monthly stats, daily totals, heap, indexes and budget restored")
+            
+            with open(data_file, 'rb') as f:
+                assert f.read() == saved, "data file written by aborted batch"
+            print_success("Nothing written to disk")
+        
+        return True
+    except Exception as e:
+        print_error(f"Batch rollback test failed: {e}")
+        return False
+
+def test_binary_snapshot():
+    """Test save/load lewat snapshot biner .ftsnap dan konversi JSON -> biner"""
+    print_header("15. Testing Binary Snapshot Round-trip")
+    
+    try:
+        from models import FinanceManager, BinarySnapshot
+        from models.binary_snapshot import convert_json_to_binary, write_binary_snapshot
+        
+        with tempfile.TemporaryDirectory() as workdir:
+            snapshot_file = os.path.join(workdir, "data.ftsnap")
+            manager = FinanceManager(snapshot_file)
+            manager.insert_at_head("2025-01-01", "Gaji", 5000000, "Income", "Salary",
+                                   is_recurring=True, recurrence_type="monthly")
+            manager.insert_at_head("2025-01-02", "Kopi", 12.345, "Expense", "Food")
+            manager.insert_at_head("2025-01-03", "Iuran", 0.005, "Expense", "Misc",
+                                   is_recurring=True, recurrence_type=None)
+            manager.save_to_file()
+            original = [node.to_dict() for node in manager.get_all_transactions()]
+            
+            reloaded = FinanceManager(snapshot_file)
+            assert reloaded.binary_snapshot
+            loaded = [node.to_dict() for node in reloaded.get_all_transactions()]
+            assert loaded == original, f"{loaded} != {original}"
+            print_success("Save/load via .ftsnap is exact (12.345, 0.005, recurrence None)")
+            
+            json_file = os.path.join(workdir, "data.json")
+            json_manager = FinanceManager(json_file)
+            for trans in reversed(original):
+                json_manager.insert_at_head(trans["date"], trans["title"], trans["amount"],
+                                            trans["type"], trans["category"],
+                                            trans["is_recurring"], trans["recurrence_type"])
+            json_manager.save_to_file()
+            converted_file = os.path.join(workdir, "converted.ftsnap")
+            assert convert_json_to_binary(json_file, converted_file) == len(original)
+            with BinarySnapshot(converted_file) as snapshot:
+                assert list(snapshot.iter_transactions()) == list(reversed(original))
+                assert snapshot[1][3] == 12.345
+            print_success("JSON -> binary conversion matches the ledger")
+            
+            try:
+                with open(os.path.join(workdir, "bad.ftsnap"), 'wb') as f:
+                    write_binary_snapshot(f, {"transactions": [dict(original[0], type="Transfer")]})
+                raise AssertionError("unknown type was encoded")
+            except ValueError:
+                print_success("Unknown type rejected with ValueError")
+        
+        return True
+    except Exception as e:
+        print_error(f"Binary snapshot test failed: {e}")
+        return False
+
+def test_sqlite_storage():
+    """Test insert/update/delete lewat SQLite storage, reopen, lalu export terfilter"""
+    print_header("16. Testing SQLite Storage Round-trip")
+    
+    try:
+        import csv
+        from models import FinanceManager, SQLiteStorage
+        
+        current_month = datetime.now().strftime("%Y-%m")
+        with tempfile.TemporaryDirectory() as workdir:
+            data_file = os.path.join(workdir, "data.json")
+            db_file = os.path.join(workdir, "data.db")
+            manager = FinanceManager(data_file, storage=SQLiteStorage(db_file))
+            manager.insert_at_head("2024-01-05", "Gaji", 5000000, "Income", "Salary")
+            rent = manager.insert_at_head("2024-01-10", "Kos", 1500000, "Expense", "Rent",
+                                          is_recurring=True, recurrence_type="monthly")
+            coffee = manager.insert_at_head("2024-02-03", "Kopi", 25000, "Expense", "Food")
+            snack = manager.insert_at_head("2024-02-04", "Snack", 10000, "Expense", "Food")
+            manager.insert_at_head(f"{current_month}-01", "Makan", 40000, "Expense", "Food")
+            manager.update_node(coffee, amount=30000, category="Drinks")
+            manager.delete_node(snack)
+            manager.persist()
+            original = {trans["id"]: trans for trans in
+                        (node.to_dict() for node in manager.get_all_transactions())}
+            monthly_stats = json.loads(json.dumps(manager.monthly_stats))
+            manager.storage.close()
+            
+            reopened = FinanceManager(data_file, storage=SQLiteStorage(db_file))
+            assert len(reopened.id_index) < len(original), "closed months loaded at startup"
+            assert reopened.monthly_stats == monthly_stats
+            assert reopened.find_node_by_id(coffee.trans_id).to_dict() == original[coffee.trans_id]
+            assert reopened.find_node_by_id(snack.trans_id) is None
+            assert reopened.get_highest_expense().trans_id == rent.trans_id
+            loaded = {node.trans_id: node.to_dict() for node in reopened.get_all_transactions()}
+            assert loaded == original, f"{loaded} != {original}"
+            print_success("Reopen keeps the same transactions; closed months load on demand")
+            
+            new_node = reopened.insert_at_head(f"{current_month}-02", "Bensin", 20000,
+                                               "Expense", "Transport")
+            assert new_node.trans_id == max(original) + 1
+            print_success(f"next_id continues after reopen (new ID {new_node.trans_id})")
+            
+            export_file = os.path.join(workdir, "export.csv")
+            assert reopened.export_to_csv(export_file, start_date="2024-01-01",
+                                          end_date="2024-02-29", trans_type="Expense")
+            with open(export_file, newline='', encoding='utf-8') as f:
+                exported = [int(row["ID"]) for row in csv.DictReader(f)]
+            assert exported == [rent.trans_id, coffee.trans_id], exported
+            print_success("Filtered export returns only Jan-Feb 2024 expenses")
+            reopened.storage.close()
+        
+        return True
+    except Exception as e:
+        print_error(f"SQLite storage test failed: {e}")
+        return False
+
+def test_partitioned_storage():
+    """Test partitioned storage: migrasi data.json, lazy load, dan rewrite bulan dirty"""
+    print_header("17. Testing Partitioned Storage")
+    
+    try:
+        from models import FinanceManager
+        
+        current_month = datetime.now().strftime("%Y-%m")
+        with tempfile.TemporaryDirectory() as workdir:
+            data_file = os.path.join(workdir, "data.json")
+            legacy = FinanceManager(data_file)
+            rent = legacy.insert_at_head("2024-01-10", "Kos", 1500000, "Expense", "Rent",
+                                         is_recurring=True, recurrence_type="monthly")
+            legacy.insert_at_head("2024-01-25", "Gaji", 5000000, "Income", "Salary")
+            book = legacy.insert_at_head("2024-02-03", "Buku", 90000, "Expense", "Education")
+            legacy.insert_at_head("2024-03-04", "Kopi", 25000, "Expense", "Food")
+            legacy.insert_at_head(f"{current_month}-01", "Makan", 40000, "Expense", "Food")
+            legacy.save_to_file()
+            original = {node.trans_id: node.to_dict() for node in legacy.get_all_transactions()}
+            monthly_stats = json.loads(json.dumps(legacy.monthly_stats))
+            
+            migrated = FinanceManager(data_file, partitioned=True)
+            partition_dir = migrated.partition_dir
+            month_files = sorted(os.listdir(partition_dir))
+            assert month_files == ["2024-01.json", "2024-02.json", "2024-03.json",
+                                   f"{current_month}.json", "manifest.json"], month_files
+            with open(os.path.join(partition_dir, "manifest.json")) as f:
+                manifest = json.load(f)
+            assert manifest["months"] == monthly_stats
+            assert manifest["next_id"] == max(original) + 1
+            print_success("Old data.json migrated to month files; manifest aggregates match")
+            
+            restarted = FinanceManager(data_file, partitioned=True)
+            assert restarted._loaded_months == {current_month}, restarted._loaded_months
+            assert book.trans_id not in restarted.id_index
+            assert restarted.monthly_stats == monthly_stats
+            assert restarted.get_category_totals("Salary")["income"] == 5000000
+            print_success("Restart loads only the current month; totals come from the manifest")
+            
+            assert restarted.find_node_by_id(book.trans_id).to_dict() == original[book.trans_id]
+            assert restarted._loaded_months == {current_month, "2024-02"}
+            print_success("find_node_by_id loads just the month containing the ID")
+            
+            inodes = {name: os.stat(os.path.join(partition_dir, name)).st_ino
+                      for name in month_files}
+            late = restarted.insert_at_head("2024-03-20", "Pulsa", 50000, "Expense", "Bills")
+            restarted.delete_node(restarted.find_node_by_id(rent.trans_id))
+            restarted.save_to_file()
+            rewritten = {name for name in month_files
+                         if os.stat(os.path.join(partition_dir, name)).st_ino != inodes[name]}
+            assert rewritten == {"2024-01.json", "2024-03.json", "manifest.json"}, rewritten
+            print_success("Save rewrites only the dirty months (2024-01, 2024-03) and the manifest")
+            
+            expected = dict(original)
+            del expected[rent.trans_id]
+            expected[late.trans_id] = late.to_dict()
+            reopened = FinanceManager(data_file, partitioned=True)
+            assert reopened.find_node_by_id(rent.trans_id) is None
+            assert reopened.find_node_by_id(late.trans_id).title == "Pulsa"
+            assert reopened.monthly_stats == restarted.monthly_stats
+            loaded = {node.trans_id: node.to_dict() for node in reopened.get_all_transactions()}
+            assert loaded == expected, f"{loaded} != {expected}"
+            assert reopened.get_category_totals("Rent")["count"] == 0
+            print_success("Insert/delete in closed months survive a restart")
+        
+        return True
+    except Exception as e:
+        print_error(f"Partitioned storage test failed: {e}")
+        return False
+
+def test_budget_bst_balance():
+    """Test BudgetBST (AVL) setelah rangkaian insert dan delete bulan"""
+    print_header("18. Testing Budget BST Balance")
+    
+    try:
+        import math
+        from models import BudgetBST
+        
+        def check_subtree(node):
+            """Return tinggi subtree setelah memeriksa height dan balance factor"""
+            if node is None:
+                return 0
+            left, right = check_subtree(node.left), check_subtree(node.right)
+            assert abs(left - right) <= 1, f"unbalanced at {node.month}"
+            assert node.height == 1 + max(left, right), f"stale height at {node.month}"
+            return node.height
+        
+        bst = BudgetBST()
+        months = [f"{year}-{month:02d}" for year in range(2015, 2025) for month in range(1, 13)]
+        expected = {}
+        # Insert terurut (kasus terburuk BST biasa), lalu hapus sebagian termasuk root
+        for index, month in enumerate(months):
+            bst.insert(month, 1000 + index)
+            expected[month] = 1000 + index
+        for month in months[::3] + [bst.root.month]:
+            if month in expected:
+                assert bst.delete(month)
+                del expected[month]
+        assert not bst.delete("1999-01")
+        for month in months[::6]:
+            bst.insert(month, 5)
+            expected[month] = 5
+        
+        in_order = [(budget.month, budget.budget_limit) for budget in bst.get_all_budgets()]
+        assert in_order == sorted(expected.items()), "in-order traversal out of order"
+        print_success(f"In-order traversal sorted after deletes ({len(in_order)} budgets)")
+        
+        height = check_subtree(bst.root)
+        bound = 1.45 * math.log2(len(expected) + 2)
+        assert height <= bound, f"height {height} > {bound:.1f}"
+        print_success(f"AVL invariants hold, height {height} <= {bound:.1f}")
+        
+        in_range = [budget.month for budget in bst.get_budgets_in_range("2018-03", "2019-06")]
+        assert in_range == sorted(month for month in expected if "2018-03" <= month <= "2019-06")
+        assert bst.get_budgets_in_range("2030-01", "2030-12") == []
+        print_success(f"get_budgets_in_range 2018-03..2019-06: {len(in_range)} budgets")
+        
+        return True
+    except Exception as e:
+        print_error(f"Budget BST balance test failed: {e}")
+        return False
+
+def test_forecast():
+    """Test forecast() dari template recurring bulanan dan mingguan"""
+    print_header("19. Testing Recurring Forecast")
+    
+    try:
+        from models import FinanceManager
+        
+        with tempfile.TemporaryDirectory() as workdir:
+            data_file = os.path.join(workdir, "data.json")
+            manager = FinanceManager(data_file)
+            manager.insert_at_head("2024-12-20", "Bonus", 300000, "Income", "Salary")
+            manager.insert_at_head("2025-01-15", "Gaji", 1000000, "Income", "Salary",
+                                   is_recurring=True, recurrence_type="monthly")
+            manager.insert_at_head("2025-01-06", "Langganan", 100000, "Expense", "Bills",
+                                   is_recurring=True, recurrence_type="weekly")
+            manager.insert_at_head("2025-02-03", "Makan", 50000, "Expense", "Food")
+            manager.save_to_file()
+            
+            # Proyeksi yang diharapkan dihitung ulang secara brute force: semua
+            # occurrence setelah tanggal template, yang sudah lewat masuk bulan pertama
+            months = ["2025-02", "2025-03", "2025-04"]
+            projected = {month: 0.0 for month in months}
+            day = date(2025, 1, 6) + timedelta(weeks=1)
+            while day <= date(2025, 4, 30):
+                projected[max(day.strftime("%Y-%m"), months[0])] -= 100000
+                day += timedelta(weeks=1)
+            for month in range(2, 5):
+                projected[f"2025-{month:02d}"] += 1000000
+            
+            def ledger_state(fm):
+                return (json.dumps(fm.monthly_stats, sort_keys=True), fm.generation,
+                        len(fm.id_index), fm.transaction_count,
+                        sorted((item.node.trans_id, item.next_due_date)
+                               for item in fm.recurring_queue.iter_scheduled()))
+            
+            before = ledger_state(manager)
+            rows = manager.forecast(2, today="2025-02-10")
+            assert ledger_state(manager) == before, "forecast mutated the ledger"
+            print_success("forecast() leaves the ledger and schedule untouched")
+            
+            opening = sum(stats["income"] - stats["expense"]
+                          for month, stats in manager.monthly_stats.items() if month < "2025-02")
+            assert opening == 300000 + 1000000 - 100000
+            running = opening
+            assert [row["month"] for row in rows] == months
+            for row in rows:
+                expected = projected[row["month"]]
+                assert row["projected_income"] - row["projected_expense"] == expected, row
+                running += expected - (50000 if row["month"] == "2025-02" else 0)
+                assert row["running_balance"] == running, (row, running)
+            print_success("Projected balance per month matches: " +
+                          ", ".join(f"{row['month']}={row['running_balance']:,.0f}" for row in rows))
+            
+            # Saldo awal dari monthly_stats: bulan tutup tidak perlu dimuat
+            FinanceManager(data_file, partitioned=True)  # migrasi ke file per bulan
+            partitioned = FinanceManager(data_file, partitioned=True)
+            loaded_months = set(partitioned._loaded_months)
+            assert partitioned.forecast(2, today="2025-02-10") == rows
+            assert partitioned._loaded_months == loaded_months
+            print_success("Opening balance comes from monthly_stats (no closed months loaded)")
+        
+        return True
+    except Exception as e:
+        print_error(f"Forecast test failed: {e}")
+        return False
+
+def test_category_index():
+    """Test total dan daftar transaksi per kategori terhadap hitungan brute force"""
+    print_header("20. Testing Category Index")
+    
+    try:
+        import random
+        from models import FinanceManager
+        
+        def brute_totals(nodes, category, month=None):
+            totals = {"income": 0.0, "expense": 0.0, "count": 0}
+            for node in nodes:
+                if node.category == category and (month is None or node.date[:7] == month):
+                    totals["income" if node.trans_type == "Income" else "expense"] += node.amount
+                    totals["count"] += 1
+            totals["balance"] = totals["income"] - totals["expense"]
+            return totals
+        
+        def check(manager, categories):
+            nodes = manager.get_all_transactions()
+            months = sorted({node.date[:7] for node in nodes})
+            for category in categories:
+                for month in [None] + months:
+                    got = manager.get_category_totals(category, month)
+                    expected = brute_totals(nodes, category, month)
+                    assert got["count"] == expected["count"], (category, month, got, expected)
+                    for key in ("income", "expense", "balance"):
+                        assert abs(got[key] - expected[key]) < 1e-6, (category, month, got, expected)
+                for start, end in [(None, None), ("2025-03-01", "2025-05-31")]:
+                    got = [node.trans_id for node in
+                           manager.transactions_in_category(category, start, end)]
+                    expected = [node.trans_id for node in sorted(
+                        (node for node in nodes if node.category == category and
+                         (start is None or start <= node.date <= end)),
+                        key=lambda node: (node.date, node.trans_id), reverse=True)]
+                    assert got == expected, (category, start, end)
+        
+        with tempfile.TemporaryDirectory() as workdir:
+            manager = FinanceManager(os.path.join(workdir, "data.json"))
+            categories = ["Food", "Rent", "Transport", "Salary", "Unused"]
+            rng = random.Random(25)
+            for _ in range(300):
+                manager.insert_at_head(f"2025-{rng.randint(1, 8):02d}-{rng.randint(1, 28):02d}",
+                                       "Item", rng.randint(1, 500) * 1000,
+                                       rng.choice(["Income", "Expense"]), rng.choice(categories[:4]))
+            check(manager, categories)
+            print_success("Totals and listings match brute force after 300 inserts")
+            
+            nodes = manager.get_all_transactions()
+            for node in rng.sample(nodes, 60):
+                manager.update_node(node, category=rng.choice(categories[:4]),
+                                    amount=rng.randint(1, 500) * 1000,
+                                    date=f"2025-{rng.randint(1, 8):02d}-15")
+            check(manager, categories)
+            print_success("Still consistent after 60 updates (category, amount and date changes)")
+            
+            for node in rng.sample(manager.get_all_transactions(), 80):
+                manager.delete_node(node)
+            for node in list(manager.transactions_in_category("Transport")):
+                manager.delete_node(node)
+            check(manager, categories)
+            assert manager.get_category_totals("Transport")["count"] == 0
+            assert "Transport" not in manager.category_index.all_time
+            print_success("Still consistent after 80 deletes and emptying one category")
+        
+        return True
+    except Exception as e:
+        print_error(f"Category index test failed: {e}")
+        return False
+
 def main():
     """Run all tests"""
     print("\n" + "=" * 60)
@@ -276,6 +876,18 @@ def main():
         ("UI Components", test_ui_components),
         ("File Verification", verify_files),
         ("Data Persistence", test_data_persistence),
+        ("Daily Totals Back-dated", test_daily_totals_backdated),
+        ("CSV Round-trip", test_csv_round_trip),
+        ("Recurring Materialization", test_recurring_materialization),
+        ("Journal Crash Recovery", test_journal_crash_recovery),
+        ("Background Save Failure", test_background_save_failure),
+        ("Batch Rollback", test_batch_rollback),
+        ("Binary Snapshot", test_binary_snapshot),
+        ("SQLite Storage", test_sqlite_storage),
+        ("Partitioned Storage", test_partitioned_storage),
+        ("Budget BST Balance", test_budget_bst_balance),
+        ("Recurring Forecast", test_forecast),
+        ("Category Index", test_category_index),
     ]
     
     results = []